@@ -0,0 +1,338 @@
+"""news-api / data-collection 부하 테스트 (p50/p95/p99, 처리량, DynamoDB 용량 단위)
+
+서비스 밖에서 HTTP로 부하를 걸고, 각 서비스의 /metrics에서 DynamoDB ConsumedCapacity를
+시나리오 전후로 읽어 요청당 읽기/쓰기 용량 단위를 계산한다. 결과를 저장된 기준값과 비교해
+회귀가 있으면 종료 코드 1로 끝난다.
+
+    cd backend
+    pip install -r benchmarks/requirements.txt
+    docker compose -f benchmarks/docker-compose.yml up -d
+    python benchmarks/seed.py --articles 20000 --recreate     # 출력되는 환경변수 export
+    python benchmarks/naver_stub.py &
+    export NAVER_SEARCH_URL=http://localhost:8200/v1/search/news.json NAVER_CLIENT_ID=bench NAVER_CLIENT_SECRET=bench
+    (cd news-api-service && uvicorn main:app --port 8000) &
+    (cd data-collection-service && uvicorn main:app --port 8001) &
+    python benchmarks/load_test.py --requests 2000 --concurrency 32 --baseline benchmarks/baseline.json
+
+기준값 갱신: 같은 명령에 --save-baseline benchmarks/baseline.json (커밋/측정 환경 정보도 함께 저장,
+docker 없이 다른 DynamoDB 대체 환경을 쓰면 --dynamodb-backend에 기록)
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+READ_OPERATIONS = {'get_item', 'query', 'scan', 'batch_get_item'}
+WRITE_OPERATIONS = {'put_item', 'update_item', 'delete_item', 'batch_write_item'}
+CAPACITY_RE = re.compile(r'^dynamodb_consumed_capacity_units_total\{operation="([^"]+)",table="[^"]*"\} ([0-9.e+]+)$')
+
+DEFAULT_KEYWORDS = ['비트코인', 'AI', '반도체', '부동산']
+
+
+@dataclass
+class Scenario:
+    name: str
+    service: str                                 # 'api' 또는 'collector'
+    method: str
+    path: str
+    params: Callable[[random.Random], Dict]
+    concurrency: Optional[int] = None            # 지정 시 --concurrency 대신 사용
+    requests: Optional[int] = None               # 지정 시 --requests 대신 사용
+
+
+@dataclass
+class ScenarioResult:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+
+
+def build_scenarios(keywords: List[str], news_ids: List[str], collect_requests: int) -> List[Scenario]:
+    return [
+        Scenario('news_latest', 'api', 'GET', '/api/news', lambda rng: {'keyword': '', 'limit': 20}),
+        Scenario('news_keyword', 'api', 'GET', '/api/news',
+                 lambda rng: {'keyword': rng.choice(keywords), 'limit': 20}),
+        Scenario('news_v2_list_fields', 'api', 'GET', '/api/v2/news',
+                 lambda rng: {'keyword': rng.choice(keywords), 'limit': 50, 'fields': 'list'}),
+        Scenario('news_offset_page', 'api', 'GET', '/api/news',
+                 lambda rng: {'keyword': '', 'limit': 20, 'offset': rng.choice([100, 200, 400])}),
+        Scenario('news_search_text', 'api', 'GET', '/api/news',
+                 lambda rng: {'keyword': '시장 동향', 'limit': 20, 'sort': 'relevance'}),
+        Scenario('news_item', 'api', 'GET', '/api/news/{news_id}',
+                 lambda rng: {'news_id': rng.choice(news_ids)} if news_ids else {}),
+        Scenario('statistics', 'api', 'GET', '/api/statistics', lambda rng: {}),
+        Scenario('collect', 'collector', 'POST', '/api/collect',
+                 lambda rng: {'query': rng.choice(keywords), 'display': 10, 'include_images': 'true'},
+                 concurrency=1, requests=collect_requests),
+    ]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def consumed_capacity(client: httpx.AsyncClient, base_url: str) -> Dict[str, float]:
+    """/metrics의 DynamoDB ConsumedCapacity 누적값 (read/write)"""
+    totals = {'read': 0.0, 'write': 0.0}
+    try:
+        response = await client.get(f"{base_url}/metrics")
+    except httpx.HTTPError:
+        return totals
+    for line in response.text.splitlines():
+        match = CAPACITY_RE.match(line)
+        if not match:
+            continue
+        operation, value = match.group(1), float(match.group(2))
+        if operation in READ_OPERATIONS:
+            totals['read'] += value
+        elif operation in WRITE_OPERATIONS:
+            totals['write'] += value
+    return totals
+
+
+async def run_scenario(client: httpx.AsyncClient, base_url: str, scenario: Scenario,
+                       total_requests: int, concurrency: int, seed: int) -> ScenarioResult:
+    result = ScenarioResult()
+    rng = random.Random(seed)
+    request_params = [scenario.params(rng) for _ in range(total_requests)]
+    queue: asyncio.Queue = asyncio.Queue()
+    for params in request_params:
+        queue.put_nowait(params)
+
+    async def worker():
+        while True:
+            try:
+                params = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            path = scenario.path.format(**params) if '{' in scenario.path else scenario.path
+            query = {key: value for key, value in params.items() if '{' + key + '}' not in scenario.path}
+            start = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, f"{base_url}{path}", params=query)
+                status = response.status_code
+            except httpx.HTTPError:
+                status = 0
+            result.latencies.append(time.perf_counter() - start)
+            result.status_counts[status] = result.status_counts.get(status, 0) + 1
+            if status == 0 or status >= 500 or (status >= 400 and status != 404):
+                result.errors += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return result
+
+
+def summarize(result: ScenarioResult, elapsed: float, capacity_before: Dict, capacity_after: Dict) -> Dict:
+    latencies = sorted(result.latencies)
+    count = len(latencies)
+    return {
+        'requests': count,
+        'errors': result.errors,
+        'status_counts': {str(status): n for status, n in sorted(result.status_counts.items())},
+        'throughput_rps': round(count / elapsed, 2) if elapsed else 0.0,
+        'mean_ms': round(sum(latencies) / count * 1000, 2) if count else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'read_units_per_request': round((capacity_after['read'] - capacity_before['read']) / count, 3) if count else 0.0,
+        'write_units_per_request': round((capacity_after['write'] - capacity_before['write']) / count, 3) if count else 0.0,
+    }
+
+
+def compare_with_baseline(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """기준값 대비 회귀 목록 (지연/용량은 증가, 처리량은 감소를 회귀로 판단)"""
+    regressions = []
+    for name, base in baseline.get('scenarios', {}).items():
+        current = results.get(name)
+        if current is None:
+            continue
+        for metric in ('p50_ms', 'p95_ms', 'p99_ms'):
+            if current[metric] > base[metric] * (1 + tolerance):
+                regressions.append(f"{name}.{metric}: {base[metric]} → {current[metric]}")
+        if current['throughput_rps'] < base['throughput_rps'] * (1 - tolerance):
+            regressions.append(f"{name}.throughput_rps: {base['throughput_rps']} → {current['throughput_rps']}")
+        for metric in ('read_units_per_request', 'write_units_per_request'):
+            # 용량 단위는 실행 환경과 무관하므로 작은 절대 오차만 허용
+            if current[metric] > base[metric] * (1 + tolerance) + 0.05:
+                regressions.append(f"{name}.{metric}: {base[metric]} → {current[metric]}")
+        if current['errors'] > base.get('errors', 0):
+            regressions.append(f"{name}.errors: {base.get('errors', 0)} → {current['errors']}")
+    return regressions
+
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def git_output(*args: str) -> Optional[str]:
+    try:
+        return subprocess.check_output(['git', *args], cwd=BACKEND_DIR, text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def git_revision() -> Optional[str]:
+    return git_output('rev-parse', '--short', 'HEAD')
+
+
+def commit_metadata() -> Dict:
+    """측정한 코드의 커밋 정보 (커밋되지 않은 서비스 코드 변경이 있으면 dirty)"""
+    status = git_output('status', '--porcelain', '--', 'news-api-service', 'data-collection-service')
+    return {
+        'revision': git_output('rev-parse', 'HEAD'),
+        'subject': git_output('log', '-1', '--format=%s'),
+        'committed_at': git_output('log', '-1', '--format=%cI'),
+        'dirty': bool(status) if status is not None else None,
+    }
+
+
+def environment_metadata(args) -> Dict:
+    """측정 환경 (기준값과 다른 환경에서 비교하면 지연/처리량 차이는 환경 차이일 수 있음)"""
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'dynamodb_backend': args.dynamodb_backend,
+        'seeded_articles': args.articles,
+        'api_url': args.api_url,
+        'collector_url': args.collector_url,
+    }
+
+
+def environment_differences(baseline: Dict, current: Dict) -> List[str]:
+    """기준값과 달라진 측정 환경 항목"""
+    keys = ('machine', 'cpu_count', 'dynamodb_backend', 'seeded_articles')
+    base = baseline.get('environment', {})
+    return [f"{key}: {base.get(key)} → {current.get(key)}" for key in keys if base.get(key) != current.get(key)]
+
+
+def print_table(results: Dict) -> None:
+    header = f"{'scenario':<22}{'req':>7}{'err':>5}{'rps':>10}{'p50':>9}{'p95':>9}{'p99':>9}{'RCU/req':>9}{'WCU/req':>9}"
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        print(f"{name:<22}{r['requests']:>7}{r['errors']:>5}{r['throughput_rps']:>10.1f}"
+              f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}"
+              f"{r['read_units_per_request']:>9.2f}{r['write_units_per_request']:>9.2f}")
+
+
+async def run(args) -> Dict:
+    keywords = [keyword.strip() for keyword in args.keywords.split(',') if keyword.strip()]
+    base_urls = {'api': args.api_url.rstrip('/'), 'collector': args.collector_url.rstrip('/')}
+    limits = httpx.Limits(max_connections=args.concurrency * 2, max_keepalive_connections=args.concurrency * 2)
+
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        for name, base_url in base_urls.items():
+            ready = await client.get(f"{base_url}/ready")
+            if ready.status_code != 200:
+                raise SystemExit(f"{name} 서비스가 준비되지 않았습니다: {base_url}/ready → {ready.status_code}")
+
+        # 단건 조회 시나리오용 id 목록
+        listing = await client.get(f"{base_urls['api']}/api/v2/news",
+                                   params={'keyword': '', 'limit': 100, 'fields': 'id'})
+        news_ids = [item['id'] for item in listing.json().get('news_items', [])]
+
+        scenarios = [
+            scenario for scenario in build_scenarios(keywords, news_ids, args.collect_requests)
+            if not args.scenarios or scenario.name in args.scenarios
+        ]
+
+        results = {}
+        for index, scenario in enumerate(scenarios):
+            base_url = base_urls[scenario.service]
+            total_requests = scenario.requests or args.requests
+            concurrency = min(scenario.concurrency or args.concurrency, total_requests)
+            if total_requests <= 0:
+                continue
+
+            # 워밍업 (연결 수립, 캐시/색인 준비)
+            await run_scenario(client, base_url, scenario, min(args.warmup, total_requests), concurrency, args.seed)
+
+            capacity_before = await consumed_capacity(client, base_url)
+            start = time.perf_counter()
+            result = await run_scenario(client, base_url, scenario, total_requests, concurrency, args.seed + index)
+            elapsed = time.perf_counter() - start
+            capacity_after = await consumed_capacity(client, base_url)
+
+            results[scenario.name] = summarize(result, elapsed, capacity_before, capacity_after)
+            results[scenario.name]['concurrency'] = concurrency
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--api-url', default='http://localhost:8000')
+    parser.add_argument('--collector-url', default='http://localhost:8001')
+    parser.add_argument('--requests', type=int, default=2000, help='시나리오당 요청 수')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--collect-requests', type=int, default=20, help='/api/collect 요청 수 (동시 1개)')
+    parser.add_argument('--warmup', type=int, default=50)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--keywords', default=','.join(DEFAULT_KEYWORDS))
+    parser.add_argument('--scenarios', nargs='*', help='실행할 시나리오 이름 (기본: 전체)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', help='비교할 기준값 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 오차 비율 (기본 20%%)')
+    parser.add_argument('--save-baseline', help='이번 결과를 기준값으로 저장할 경로')
+    parser.add_argument('--dynamodb-backend', default='amazon/dynamodb-local:2.2.1 (benchmarks/docker-compose.yml)',
+                        help='DynamoDB 대체 환경 (기준값에 기록)')
+    parser.add_argument('--articles', type=int, default=20000, help='seed.py로 적재한 뉴스 수 (기준값에 기록)')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print_table(results)
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'commit': commit_metadata(),
+        'environment': environment_metadata(args),
+        'options': {
+            'requests': args.requests, 'concurrency': args.concurrency,
+            'collect_requests': args.collect_requests, 'warmup': args.warmup,
+            'keywords': args.keywords, 'seed': args.seed
+        },
+        'scenarios': results
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        differences = environment_differences(baseline, report['environment'])
+        if differences:
+            print(f"\n⚠️  기준값과 측정 환경이 다름 (지연/처리량 비교는 참고용): {', '.join(differences)}")
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ 기준값 대비 회귀 {len(regressions)}건 (허용 오차 {args.tolerance:.0%}):")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"\n✅ 기준값 대비 회귀 없음 (허용 오차 {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
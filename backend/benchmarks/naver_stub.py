@@ -0,0 +1,99 @@
+"""네이버 뉴스 검색 API / 기사 페이지 대체 서버 (벤치마크용)
+
+/v1/search/news.json 은 호출할 때마다 새 기사(pubDate=현재 시각)를 돌려주므로 /api/collect가
+매번 실제로 저장까지 수행한다. 기사 링크는 og:image가 있는 이 서버의 페이지를 가리켜
+이미지 추출 → 다운로드 → S3 업로드 경로도 함께 측정된다.
+
+    python benchmarks/naver_stub.py --port 8200
+    export NAVER_SEARCH_URL=http://localhost:8200/v1/search/news.json
+"""
+import argparse
+import itertools
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# 1x1 JPEG
+PIXEL_JPEG = bytes.fromhex(
+    'ffd8ffe000104a46494600010100000100010000ffdb004300080606070605080707070909080a0c140d0c0b0b0c1912130f'
+    '141d1a1f1e1d1a1c1c20242e2720222c231c1c2837292c30313434341f27393d38323c2e333432ffc0000b080001000101011100'
+    'ffc4001f0000010501010101010100000000000000000102030405060708090a0bffc400b5100002010303020403050504040000'
+    '017d01020300041105122131410613516107227114328191a1082342b1c11552d1f02433627282090a161718191a25262728292a'
+    '3435363738393a434445464748494a535455565758595a636465666768696a737475767778797a838485868788898a9293949596'
+    '9798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5c6c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2'
+    'f3f4f5f6f7f8f9faffda0008010100003f00fbd3ffd9'
+)
+
+_article_ids = itertools.count(1)
+_lock = threading.Lock()
+
+
+class NaverStubHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):  # 요청마다 로그를 남기지 않음
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        base = f"http://{self.headers.get('Host')}"
+
+        if url.path == '/v1/search/news.json':
+            params = parse_qs(url.query)
+            query = params.get('query', [''])[0]
+            display = int(params.get('display', ['10'])[0])
+            pub_date = datetime.now().astimezone().strftime('%a, %d %b %Y %H:%M:%S %z')
+            with _lock:
+                ids = [next(_article_ids) for _ in range(display)]
+            body = {
+                'lastBuildDate': pub_date,
+                'total': display,
+                'start': 1,
+                'display': display,
+                'items': [
+                    {
+                        'title': f'<b>{query}</b> 벤치마크 기사 {article_id}',
+                        'originallink': f'{base}/article/{article_id}',
+                        'link': f'{base}/article/{article_id}',
+                        'description': f'{query} 관련 벤치마크용 기사 본문 {article_id}',
+                        'pubDate': pub_date
+                    }
+                    for article_id in ids
+                ]
+            }
+            self._send(200, json.dumps(body, ensure_ascii=False).encode('utf-8'), 'application/json; charset=utf-8')
+        elif url.path.startswith('/article/'):
+            article_id = url.path.rsplit('/', 1)[-1]
+            html = (f'<html><head><meta property="og:image" content="{base}/images/{article_id}.jpg"></head>'
+                    f'<body><div class="article-body">기사 {article_id}</div></body></html>')
+            self._send(200, html.encode('utf-8'), 'text/html; charset=utf-8')
+        elif url.path.startswith('/images/'):
+            self._send(200, PIXEL_JPEG, 'image/jpeg')
+        else:
+            self._send(404, b'not found', 'text/plain')
+
+
+def serve(port: int) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(('0.0.0.0', port), NaverStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8200)
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(('0.0.0.0', args.port), NaverStubHandler)
+    print(f"네이버 API 대체 서버 실행: http://localhost:{args.port}/v1/search/news.json")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
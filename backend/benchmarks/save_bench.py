@@ -0,0 +1,110 @@
+"""수집기 저장 처리량 벤치마크 (건별 순차 PutItem vs BatchWriteItem/조건부 PutItem 파이프라인)
+
+로컬 DynamoDB 대체 환경에 data-collection-service의 DynamoDBManager로 같은 건수를 저장하고
+초당 저장 건수를 비교한다. save_new는 수집기와 같이 BatchGetItem으로 없는 기사를 확인한 뒤
+BatchWriteItem으로 저장하고(확인 시간 포함), save_conditional은 확인 없이 조건부 PutItem으로만
+저장한다 (확인 실패 시 경로). save_existing은 같은 기사를 다시 저장하는 경우(조건부 쓰기 거절 +
+키워드 병합)의 처리량이다. 로컬 대체 환경은 왕복 지연이 1ms 안팎이라 실제 DynamoDB
+(왕복 수 ms)보다 왕복 횟수를 줄인 효과가 작게 나온다.
+
+    cd backend
+    docker compose -f benchmarks/docker-compose.yml up -d
+    pip install -r data-collection-service/requirements.txt
+    python benchmarks/save_bench.py --items 100 --rounds 5
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+import boto3
+
+from seed import DEFAULT_DYNAMODB_ENDPOINT, DEFAULT_S3_ENDPOINT, create_table, local_env, make_article
+
+
+def load_db_manager(env: dict):
+    """로컬 대체 환경을 가리키도록 환경변수를 설정한 뒤 수집기 DynamoDBManager 로드"""
+    os.environ.update(env)
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection-service'))
+    from database import db_manager  # noqa: E402
+    db_manager.connect()
+    return db_manager
+
+
+def make_items(count: int, offset: int, keyword: str) -> list:
+    """수집 1회분 뉴스 아이템 (라운드마다 다른 id)"""
+    now = datetime.now().replace(microsecond=0)
+    return [
+        make_article(offset + i, keyword, now - timedelta(seconds=i), "http://localhost:9000/news-benchmark-images")
+        for i in range(count)
+    ]
+
+
+async def put_each(db_manager, items: list) -> None:
+    """기존 경로: 아이템마다 PutItem 1회를 순서대로"""
+    for item in items:
+        await db_manager.executor.run('put_item', db_manager.table.put_item, Item=item)
+
+
+async def run(db_manager, items_per_round: int, rounds: int) -> dict:
+    results = {'put_item': [], 'save_new': [], 'save_conditional': [], 'save_existing': []}
+    offset = 0
+    for _ in range(rounds):
+        items = make_items(items_per_round, offset, '비트코인')
+        offset += items_per_round
+        start = time.perf_counter()
+        await put_each(db_manager, items)
+        results['put_item'].append(items_per_round / (time.perf_counter() - start))
+
+        items = make_items(items_per_round, offset, '비트코인')
+        offset += items_per_round
+        start = time.perf_counter()
+        stored = await db_manager.get_stored_keywords([item['id'] for item in items])
+        result = await db_manager.save_news_items(items, new_ids={item['id'] for item in items} - set(stored))
+        results['save_new'].append(items_per_round / (time.perf_counter() - start))
+        if result['saved_count'] != items_per_round:
+            raise RuntimeError(f"save_new: {result['saved_count']}/{items_per_round}, 실패 {result['failed_items'][:3]}")
+
+        items = make_items(items_per_round, offset, '비트코인')
+        offset += items_per_round
+        for name, expected in (('save_conditional', 'saved_count'), ('save_existing', 'existing_count')):
+            start = time.perf_counter()
+            result = await db_manager.save_news_items(items)
+            results[name].append(items_per_round / (time.perf_counter() - start))
+            if result[expected] != items_per_round:
+                raise RuntimeError(f"{name}: {result[expected]}/{items_per_round}, 실패 {result['failed_items'][:3]}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=100, help='라운드당 저장 건수 (수집 display와 같은 의미)')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--table', default='naver_news_articles_save_bench')
+    parser.add_argument('--dynamodb-endpoint', default=os.getenv('DYNAMODB_ENDPOINT_URL', DEFAULT_DYNAMODB_ENDPOINT))
+    args = parser.parse_args()
+
+    env = local_env(args.dynamodb_endpoint, DEFAULT_S3_ENDPOINT, args.table, '')
+    session = boto3.session.Session(
+        aws_access_key_id=env['AWS_ACCESS_KEY_ID'],
+        aws_secret_access_key=env['AWS_SECRET_ACCESS_KEY'],
+        region_name=env['AWS_REGION']
+    )
+    create_table(session.resource('dynamodb', endpoint_url=args.dynamodb_endpoint), args.table, recreate=True)
+
+    db_manager = load_db_manager(env)
+    results = asyncio.run(run(db_manager, args.items, args.rounds))
+
+    print(f"items={args.items}, rounds={args.rounds}, endpoint={args.dynamodb_endpoint}")
+    for name, rates in results.items():
+        print(f"{name:16s}: median {statistics.median(rates):8.0f} items/s (min {min(rates):.0f}, max {max(rates):.0f})")
+    for name, label in (('save_new', 'BatchWriteItem 파이프라인'), ('save_conditional', '조건부 PutItem 파이프라인')):
+        print(f"{label}: {statistics.median(results[name]) / statistics.median(results['put_item']):.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
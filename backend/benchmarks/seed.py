@@ -0,0 +1,142 @@
+"""벤치마크용 로컬 DynamoDB/S3 초기화 및 뉴스 데이터 적재
+
+운영 테이블과 같은 키/글로벌 인덱스 구성으로 테이블을 만들고 지정한 건수의 뉴스와
+메타 아이템(데이터 버전, 집계 카운터)을 적재한다.
+
+    cd backend
+    docker compose -f benchmarks/docker-compose.yml up -d
+    python benchmarks/seed.py --articles 20000 --keywords 비트코인,AI,반도체,부동산
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+import boto3
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import table_schema  # noqa: E402
+
+DEFAULT_DYNAMODB_ENDPOINT = "http://localhost:8100"
+DEFAULT_S3_ENDPOINT = "http://localhost:9000"
+
+
+def local_env(dynamodb_endpoint: str, s3_endpoint: str, table_name: str, bucket: str) -> dict:
+    """로컬 대체 환경을 가리키는 서비스 환경변수"""
+    return {
+        'AWS_ACCESS_KEY_ID': os.getenv('AWS_ACCESS_KEY_ID', 'benchmark'),
+        'AWS_SECRET_ACCESS_KEY': os.getenv('AWS_SECRET_ACCESS_KEY', 'benchmark-secret'),
+        'AWS_REGION': os.getenv('AWS_REGION', 'ap-northeast-2'),
+        'DYNAMODB_ENDPOINT_URL': dynamodb_endpoint,
+        'DYNAMODB_TABLE_NAME': table_name,
+        'S3_ENDPOINT_URL': s3_endpoint,
+        'S3_BUCKET_NAME': bucket,
+        'CURSOR_SECRET': os.getenv('CURSOR_SECRET', 'benchmark-cursor-secret'),
+    }
+
+
+def create_table(dynamodb, table_name: str, recreate: bool = False):
+    """운영과 같은 구성의 테이블 생성 (recreate면 기존 테이블을 지우고 다시 생성)"""
+    existing = dynamodb.meta.client.list_tables()['TableNames']
+    if table_name in existing:
+        if not recreate:
+            return dynamodb.Table(table_name)
+        dynamodb.Table(table_name).delete()
+        dynamodb.meta.client.get_waiter('table_not_exists').wait(TableName=table_name)
+    return table_schema.create_table(dynamodb, table_name)
+
+
+def make_article(index: int, keyword: str, collected_at: datetime, image_base: str) -> dict:
+    """수집기가 저장하는 형태의 뉴스 아이템"""
+    news_id = f"{collected_at.strftime('%Y%m%d_%H%M%S')}_{index:08x}"
+    return {
+        'id': news_id,
+        'title': f'{keyword} 관련 시장 동향 기사 {index}',
+        'description': f'{keyword} 관련 업계 전망과 투자 심리를 정리한 기사입니다. 기사 번호 {index}.',
+        'keyword': keyword,
+        'originallink': f'https://news.example.com/article/{index}',
+        'link': f'https://n.news.naver.com/mnews/article/{index}',
+        'pubDate': collected_at.strftime('%a, %d %b %Y %H:%M:%S +0900'),
+        'image_url': f'https://news.example.com/images/{index}.jpg',
+        'cloudfront_image_url': f'{image_base}/{news_id}/images/{index:012x}.jpg',
+        'collected_at': collected_at.isoformat(),
+        'created_at': collected_at.isoformat(),
+        'content_type': 'news',
+        'source': 'naver_api'
+    }
+
+
+def seed_articles(table, articles: int, keywords: list, seed: int, image_base: str) -> Counter:
+    """최근 30일에 걸쳐 뉴스 적재 후 집계 카운터용 건수 반환"""
+    rng = random.Random(seed)
+    now = datetime.now().replace(microsecond=0)
+    counts = Counter()
+    with table.batch_writer() as batch:
+        for index in range(articles):
+            keyword = keywords[index % len(keywords)]
+            collected_at = now - timedelta(seconds=rng.randint(0, 30 * 24 * 3600))
+            item = make_article(index, keyword, collected_at, image_base)
+            batch.put_item(Item=item)
+            counts['total_items'] += 1
+            counts[f"kw#{keyword}"] += 1
+            counts[f"src#{item['source']}"] += 1
+            counts[f"day#{collected_at.date().isoformat()}"] += 1
+    return counts
+
+
+def seed_meta(table, counts: Counter) -> None:
+    """데이터 버전 / 집계 카운터 메타 아이템"""
+    now = datetime.now().isoformat()
+    table.put_item(Item={'id': '__meta__#data_version', 'version': 1, 'updated_at': now})
+    counters = {'id': '__meta__#counters', 'updated_at': now}
+    counters.update(counts)
+    table.put_item(Item=counters)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--articles', type=int, default=20000)
+    parser.add_argument('--keywords', default='비트코인,AI,반도체,부동산')
+    parser.add_argument('--seed', type=int, default=42, help='collected_at 분포 난수 시드 (재현용)')
+    parser.add_argument('--table', default='naver_news_articles')
+    parser.add_argument('--bucket', default='news-benchmark-images')
+    parser.add_argument('--dynamodb-endpoint', default=os.getenv('DYNAMODB_ENDPOINT_URL', DEFAULT_DYNAMODB_ENDPOINT))
+    parser.add_argument('--s3-endpoint', default=os.getenv('S3_ENDPOINT_URL', DEFAULT_S3_ENDPOINT))
+    parser.add_argument('--recreate', action='store_true', help='테이블을 지우고 다시 생성')
+    args = parser.parse_args()
+
+    env = local_env(args.dynamodb_endpoint, args.s3_endpoint, args.table, args.bucket)
+    session = boto3.session.Session(
+        aws_access_key_id=env['AWS_ACCESS_KEY_ID'],
+        aws_secret_access_key=env['AWS_SECRET_ACCESS_KEY'],
+        region_name=env['AWS_REGION']
+    )
+    dynamodb = session.resource('dynamodb', endpoint_url=args.dynamodb_endpoint)
+    s3 = session.client('s3', endpoint_url=args.s3_endpoint)
+
+    start_time = time.time()
+    table = create_table(dynamodb, args.table, recreate=args.recreate)
+    try:
+        s3.create_bucket(
+            Bucket=args.bucket,
+            CreateBucketConfiguration={'LocationConstraint': env['AWS_REGION']}
+        )
+    except (s3.exceptions.BucketAlreadyOwnedByYou, s3.exceptions.BucketAlreadyExists):
+        pass
+
+    keywords = [keyword.strip() for keyword in args.keywords.split(',') if keyword.strip()]
+    counts = seed_articles(table, args.articles, keywords, args.seed, f"http://localhost:9000/{args.bucket}")
+    seed_meta(table, counts)
+
+    print(f"적재 완료: 뉴스 {args.articles}개, 키워드 {len(keywords)}개 ({time.time() - start_time:.1f}초)")
+    print("서비스 실행 시 환경변수:")
+    for name, value in env.items():
+        print(f"  export {name}={value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""/api/news 응답 직렬화 벤치마크 (v1 pydantic 경로 vs v2 orjson 경로)
+
+DynamoDB 조회를 제외한 응답 구성 + 직렬화 CPU 시간만 측정한다.
+
+    cd backend
+    pip install -r news-api-service/requirements.txt
+    python benchmarks/serialization_bench.py --limit 100 --iterations 2000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'news-api-service'))
+
+from models import NewsItem, APIResponse, APIResponseBody, QueryParams  # noqa: E402
+from serialization import dumps, news_item_dict, news_item_dicts  # noqa: E402
+
+
+def make_items(count: int):
+    """DynamoDB에서 읽은 형태의 뉴스 아이템 생성"""
+    return [
+        {
+            'id': f'20240909_103000_{i:08x}',
+            'title': f'비트코인 가격 급등, 시장 기대감 확산 ({i})',
+            'description': '비트코인이 사상 최고가를 경신하며 가상자산 시장 전반에 대한 기대감이 커지고 있다. ' * 2,
+            'keyword': '비트코인',
+            'originallink': f'https://news.example.com/article/{i}',
+            'link': f'https://n.news.naver.com/mnews/article/{i}',
+            'pubDate': 'Mon, 09 Sep 2024 14:30:00 +0900',
+            'image_url': f'https://news.example.com/images/{i}.jpg',
+            'cloudfront_image_url': f'https://d2hpi3mpmg4l2t.cloudfront.net/{i}/images/abc.jpg',
+            'collected_at': '2024-09-09T10:30:00',
+            'created_at': '2024-09-09T10:30:00',
+            'content_type': 'news',
+            'source': 'naver_api',
+            'score': Decimal('1')
+        }
+        for i in range(count)
+    ]
+
+
+def v1_response(items, limit: int) -> bytes:
+    """기존 경로: NewsItem 생성 → APIResponse 래핑 → FastAPI 응답 검증/직렬화"""
+    news_items = [NewsItem(**news_item_dict(item)) for item in items]
+    api_response = APIResponse(
+        statusCode=200,
+        headers={
+            "Content-Type": "application/json",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Headers": "Content-Type",
+            "Access-Control-Allow-Methods": "GET,POST,OPTIONS"
+        },
+        body=APIResponseBody(
+            message="content_list 엔드포인트",
+            news_items=news_items,
+            total_items=len(items),
+            query_params=QueryParams(limit=str(limit), offset='0', keyword='비트코인'),
+            timestamp=datetime.now().isoformat()
+        )
+    )
+    # FastAPI의 response_model 처리 (재검증 후 JSON 호환 dict로 변환 → JSONResponse)
+    content = APIResponse.model_validate(api_response.model_dump()).model_dump(mode='json')
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(',', ':')).encode('utf-8')
+
+
+def v2_response(items, limit: int) -> bytes:
+    """v2 경로: DynamoDB 아이템 → dict → orjson"""
+    return dumps({
+        'message': "content_list 엔드포인트",
+        'news_items': news_item_dicts(items),
+        'total_items': len(items),
+        'query_params': {'limit': str(limit), 'offset': '0', 'keyword': '비트코인', 'cursor': None},
+        'timestamp': datetime.now().isoformat(),
+        'next_cursor': None
+    })
+
+
+def measure(func, items, limit: int, iterations: int) -> float:
+    """요청당 평균 CPU 시간 (마이크로초)"""
+    for _ in range(min(100, iterations)):  # 워밍업
+        func(items, limit)
+    start = time.process_time()
+    for _ in range(iterations):
+        func(items, limit)
+    return (time.process_time() - start) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--limit', type=int, default=100)
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    items = make_items(args.limit)
+    v1_size = len(v1_response(items, args.limit))
+    v2_size = len(v2_response(items, args.limit))
+
+    v1_us = measure(v1_response, items, args.limit, args.iterations)
+    v2_us = measure(v2_response, items, args.limit, args.iterations)
+
+    print(f"limit={args.limit}, iterations={args.iterations}")
+    print(f"v1 (pydantic + json): {v1_us:9.1f} µs/req, {v1_size} bytes")
+    print(f"v2 (orjson)         : {v2_us:9.1f} µs/req, {v2_size} bytes")
+    print(f"CPU 절감: {v1_us - v2_us:.1f} µs/req ({(1 - v2_us / v1_us) * 100:.1f}%), {v1_us / v2_us:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
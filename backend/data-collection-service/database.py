@@ -1,195 +1,645 @@
 import boto3
 import os
-from typing import Dict, List, Optional
+import asyncio
+import random
+import email.utils
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
-from boto3.dynamodb.conditions import Attr
+from logging_config import get_logger
+from boto3.dynamodb.conditions import Attr, Key
+from datetime import datetime
+from collections import Counter
+
+from executor import dynamodb_executor
 
 # .env 파일 로드
 load_dotenv()
 
+logger = get_logger(__name__)
+item_logger = get_logger('items')  # 뉴스 1건마다 남는 로그 (샘플링/건수 제한 대상)
+
+# 저장이 끝날 때마다 증가시키는 데이터 버전 아이템 (news-api 캐시 무효화 기준)
+DATA_VERSION_KEY = "__meta__#data_version"
+
+# 집계 카운터 아이템 (전체/키워드별/소스별/일자별 건수를 평면 속성으로 보관)
+COUNTERS_KEY = "__meta__#counters"
+KEYWORD_PREFIX = "kw#"
+SOURCE_PREFIX = "src#"
+DAY_PREFIX = "day#"
+# 집계 카운터 갱신 재시도 (같은 request_token으로 재시도해서 이미 반영된 갱신은 다시 더하지 않음)
+COUNTER_UPDATE_MAX_RETRIES = int(os.getenv("COUNTER_UPDATE_MAX_RETRIES", "5"))
+COUNTER_UPDATE_BASE_DELAY = 0.1
+
+# 유사 기사 지문 색인 아이템 (수집 시각 1시간 단위 샤드, 대표 기사별 지문을 평면 속성으로 보관)
+FINGERPRINT_PREFIX = "__simhash__#"
+STORY_PREFIX = "s#"
+BATCH_GET_CHUNK_SIZE = 100
+BATCH_GET_MAX_RETRIES = 3
+
+# 저장 시 동시에 보내는 조건부 PutItem 수 (DynamoDB 스레드 풀 크기 이하)
+SAVE_WRITE_CONCURRENCY = int(os.getenv("SAVE_WRITE_CONCURRENCY", "16"))
+
+# BatchWriteItem 요청당 최대 아이템 수, 동시에 보내는 배치 수, UnprocessedItems 재시도 설정
+BATCH_WRITE_CHUNK_SIZE = 25
+SAVE_BATCH_CONCURRENCY = int(os.getenv("SAVE_BATCH_CONCURRENCY", "4"))
+BATCH_WRITE_MAX_RETRIES = int(os.getenv("BATCH_WRITE_MAX_RETRIES", "5"))
+BATCH_WRITE_BASE_DELAY = 0.05
+
+# 키워드별 수집 워터마크 아이템 (저장한 뉴스 중 가장 최신 pubDate, 수집 시 GetItem 1회로 조회)
+WATERMARK_PREFIX = "__watermark__#"
+WATERMARK_BOOTSTRAP_ITEMS = 100  # 워터마크가 없을 때 키워드 피드 인덱스에서 읽는 최근 수집분
+
+# 인기 검색어/키워드 집계 아이템 (시간 구간별 count-min sketch + top-k 후보)
+TREND_PREFIX = "__trend__#"
+
+# 키워드 피드 별칭 아이템 (이미 저장된 기사를 다른 키워드로 다시 수집했을 때 그 키워드의 피드 항목)
+# keyword/collected_at이 키워드 피드 인덱스에, content_type이 글로벌 인덱스의 별도 파티션에 들어간다
+KEYWORD_ALIAS_PREFIX = "__kwalias__#"
+KEYWORD_ALIAS_TYPE = "keyword_alias"
+
 class DynamoDBManager:
     def __init__(self):
         self.dynamodb = None
         self.table = None
         self.table_name = os.getenv("DYNAMODB_TABLE_NAME", "naver_news_articles")
+        self.keyword_gsi_name = "keyword-collected_at-index"  # 키워드별 피드 인덱스 (워터마크 초기값 조회용)
+        self.executor = dynamodb_executor  # 모든 DynamoDB 호출은 전용 스레드 풀에서 실행
+        self.ready = False  # 클라이언트 생성 및 연결 확인(예열) 완료 여부
+        self.ready_check_timeout = float(os.getenv("READY_CHECK_TIMEOUT", "2"))
+        # DynamoDB 호출이 이 횟수만큼 연속 실패하면 /ready를 준비 안 됨으로 (다시 성공할 때까지)
+        self.ready_max_failures = int(os.getenv("READY_MAX_CONSECUTIVE_FAILURES", "3"))
         
+    async def warm_up(self) -> None:
+        """클라이언트 생성 및 연결 예열 (테이블 전체를 읽는 작업 없음)"""
+        if self.table is None:
+            await self.executor.run('connect', self.connect, timeout=30)
+        await self._ping()
+        self.ready = True
+
+    async def _ping(self) -> None:
+        """GetItem 1회로 DynamoDB 접근 확인 (TLS 연결도 미리 맺어둠)"""
+        await self.executor.run(
+            'get_item',
+            self.table.get_item,
+            Key={'id': DATA_VERSION_KEY},
+            timeout=self.ready_check_timeout
+        )
+
+    async def check_ready(self) -> bool:
+        """준비 상태 (예열 완료 + 최근 DynamoDB 호출이 ready_max_failures번 연속 실패하지 않음)
+
+        평소에는 요청/백그라운드 작업의 호출 결과만 보고 판단하므로 probe마다 DynamoDB를
+        호출하지 않는다. 연속 실패로 준비 해제된 뒤에만 GetItem 1회로 복구 여부를 확인한다.
+        """
+        if not self.ready:
+            return False
+        if self.executor.consecutive_failures < self.ready_max_failures:
+            return True
+        try:
+            await self._ping()  # 성공하면 연속 실패 수가 0으로 돌아감
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️  DynamoDB 준비 상태 확인 실패 (연속 실패 {self.executor.consecutive_failures}회): {e}")
+            return False
+
     def connect(self):
         """DynamoDB 연결 (PC에 설정된 AWS 자격증명 사용)"""
         try:
             # AWS 자격증명은 PC에 이미 설정되어 있으므로 별도 지정 불필요
             self.dynamodb = boto3.resource(
                 'dynamodb',
-                region_name=os.getenv("AWS_REGION", "ap-northeast-2")
+                region_name=os.getenv("AWS_REGION", "ap-northeast-2"),
+                # 로컬 DynamoDB(벤치마크/개발용)를 쓸 때만 지정, 없으면 AWS 기본 엔드포인트
+                endpoint_url=os.getenv("DYNAMODB_ENDPOINT_URL") or None,
+                # 연결 풀 크기, 연결/응답 타임아웃, adaptive 재시도 (executor 설정과 함께 관리)
+                config=self.executor.client_config()
             )
             
             self.table = self.dynamodb.Table(self.table_name)
             
             # 테이블 존재 확인
             response = self.table.meta.client.describe_table(TableName=self.table_name)
-            print(f"✅ DynamoDB 연결 성공: {self.table_name}")
-            print(f"📊 테이블 상태: {response['Table']['TableStatus']}")
-            print(f"🔑 AWS 자격증명: PC에 설정된 기본 프로파일 사용")
+            logger.info(f"✅ DynamoDB 연결 성공: {self.table_name}")
+            logger.info(f"📊 테이블 상태: {response['Table']['TableStatus']}")
+            logger.info(f"🔑 AWS 자격증명: PC에 설정된 기본 프로파일 사용")
             
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
-                print(f"❌ 테이블을 찾을 수 없습니다: {self.table_name}")
-                print("💡 다음 명령어로 테이블을 생성하세요:")
-                print(f"aws dynamodb create-table --table-name {self.table_name} --attribute-definitions AttributeName=id,AttributeType=S --key-schema AttributeName=id,KeyType=HASH --provisioned-throughput ReadCapacityUnits=5,WriteCapacityUnits=5 --region {os.getenv('AWS_REGION', 'ap-northeast-2')}")
+                logger.error(f"❌ 테이블을 찾을 수 없습니다: {self.table_name}")
+                logger.error("💡 다음 명령어로 테이블을 생성하세요:")
+                logger.error(f"aws dynamodb create-table --table-name {self.table_name} --attribute-definitions AttributeName=id,AttributeType=S --key-schema AttributeName=id,KeyType=HASH --provisioned-throughput ReadCapacityUnits=5,WriteCapacityUnits=5 --region {os.getenv('AWS_REGION', 'ap-northeast-2')}")
             elif e.response['Error']['Code'] == 'UnauthorizedOperation':
-                print("❌ AWS 자격증명 오류. 다음을 확인하세요:")
-                print("1. AWS CLI가 설치되어 있는지: aws --version")
-                print("2. 자격증명이 설정되어 있는지: aws configure list")
-                print("3. DynamoDB 권한이 있는지 확인")
+                logger.error("❌ AWS 자격증명 오류. 다음을 확인하세요:")
+                logger.error("1. AWS CLI가 설치되어 있는지: aws --version")
+                logger.error("2. 자격증명이 설정되어 있는지: aws configure list")
+                logger.error("3. DynamoDB 권한이 있는지 확인")
             raise e
         except Exception as e:
-            print(f"❌ DynamoDB 연결 실패: {e}")
+            logger.error(f"❌ DynamoDB 연결 실패: {e}")
             raise e
     
-    def save_news_items(self, news_items: List[Dict]) -> Dict:
-        """뉴스 아이템들을 DynamoDB에 저장"""
-        saved_count = 0
-        failed_count = 0
-        saved_items = []
-        
-        for item in news_items:
+    async def _write_batch(self, items: List[Dict]) -> Dict[str, str]:
+        """BatchWriteItem 1건 (최대 25개, UnprocessedItems 재시도) → {저장하지 못한 id: 사유}"""
+        requests = [{'PutRequest': {'Item': item}} for item in items]
+        retry_delay = BATCH_WRITE_BASE_DELAY
+        for attempt in range(BATCH_WRITE_MAX_RETRIES + 1):
+            try:
+                response = await self.executor.run(
+                    'batch_write_item',
+                    self.dynamodb.batch_write_item,
+                    RequestItems={self.table_name: requests}
+                )
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'ValidationException':
+                    raise
+                # 배치 안의 아이템 하나가 잘못되면 배치 전체가 거절되므로 건별 저장으로 원인 아이템만 실패 처리
+                return await self._put_each([request['PutRequest']['Item'] for request in requests])
+
+            requests = response.get('UnprocessedItems', {}).get(self.table_name, [])
+            if not requests or attempt == BATCH_WRITE_MAX_RETRIES:
+                break
+            # 처리량 초과로 남은 아이템은 지수 백오프(지터 포함) 후 재요청
+            await asyncio.sleep(retry_delay * (1 + random.random()))
+            retry_delay *= 2
+
+        return {request['PutRequest']['Item']['id']: 'UnprocessedItems 재시도 초과' for request in requests}
+
+    async def _put_each(self, items: List[Dict]) -> Dict[str, str]:
+        """건별 PutItem (배치가 거절됐을 때 실패 아이템 구분용) → {저장하지 못한 id: 사유}"""
+        failures = {}
+        for item in items:
+            try:
+                await self.executor.run('put_item', self.table.put_item, Item=item)
+            except Exception as e:
+                failures[item['id']] = str(e)
+        return failures
+
+    async def _put_new(self, item: Dict, counts: Optional[Counter] = None) -> str:
+        """없는 기사만 저장하는 조건부 PutItem → 'saved' | 'merged'(기존 기사에 키워드 추가) | 'existing'"""
+        try:
+            await self.executor.run(
+                'put_item',
+                self.table.put_item,
+                Item=item,
+                ConditionExpression='attribute_not_exists(id)'
+            )
+            return 'saved'
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+        if await self.merge_keywords(item['id'], item.get('keywords') or {item.get('keyword', 'Unknown')}, counts):
+            return 'merged'
+        return 'existing'
+
+    async def merge_keywords(self, news_id: str, keywords: Iterable[str], counts: Optional[Counter] = None) -> set:
+        """이미 저장된 기사에 수집 키워드 추가 (keywords 문자열 집합 ADD) → 새로 추가된 키워드 집합
+
+        키워드 피드 인덱스는 기사의 keyword(처음 수집한 키워드)로만 파티션되므로
+        새로 추가된 키워드마다 별칭 아이템을 써서 그 키워드의 피드에도 나오게 한다.
+        추가된 키워드의 집계 카운터(kw#)는 counts에 모으고, counts가 없으면 바로 갱신한다.
+        """
+        keywords = set(keywords)
+        response = await self.executor.run(
+            'update_item',
+            self.table.update_item,
+            Key={'id': news_id},
+            UpdateExpression='ADD keywords :keywords',
+            ConditionExpression='attribute_exists(id)',
+            ExpressionAttributeValues={':keywords': keywords},
+            ReturnValues='ALL_OLD'
+        )
+        stored = response.get('Attributes', {})
+        added = keywords - set(stored.get('keywords') or ()) - {stored.get('keyword')}
+        if added and stored.get('content_type') == 'news':  # 저장만 해 둔 중복 기사는 피드에 넣지 않음
+            await self.put_keyword_aliases(stored, added)
+            merged_counts = Counter(KEYWORD_PREFIX + keyword for keyword in added)
+            if counts is None:
+                await self.update_counters(merged_counts)
+            else:
+                counts.update(merged_counts)
+        return added
+
+    async def put_keyword_aliases(self, article: Dict, keywords: Iterable[str]) -> None:
+        """키워드 피드 별칭 아이템 저장 (기사 collected_at을 그대로 써서 피드 정렬/기간 조건이 기사와 같음)"""
+        for keyword in keywords:
             try:
-                # DynamoDB에 저장
-                self.table.put_item(Item=item)
-                saved_count += 1
-                saved_items.append({
-                    'title': item['title'],
-                    'id': item['id']
+                await self.executor.run('put_item', self.table.put_item, Item={
+                    'id': f"{KEYWORD_ALIAS_PREFIX}{keyword}#{article['id']}",
+                    'content_type': KEYWORD_ALIAS_TYPE,
+                    'keyword': keyword,
+                    'collected_at': article['collected_at'],
+                    'article_id': article['id'],
+                    'created_at': datetime.now().isoformat()
                 })
-                print(f"✅ 저장 성공: {item['id']} - {item['title'][:50]}...")
-                
             except Exception as e:
-                failed_count += 1
-                print(f"❌ 저장 실패: {item.get('title', 'Unknown')} - {str(e)}")
-        
+                logger.warning(f"⚠️  키워드 피드 별칭 저장 실패: {keyword} → {article['id']} - {e}")
+
+    async def get_stored_keywords(self, news_ids: Iterable[str]) -> Optional[Dict[str, set]]:
+        """이미 저장된 기사의 수집 키워드 → {id: 키워드 집합} (없는 기사는 제외, 조회 실패 시 None)"""
+        try:
+            stored = await self._batch_get(news_ids, {
+                'ProjectionExpression': 'id, #keyword, keywords, duplicate_keyword',
+                'ExpressionAttributeNames': {'#keyword': 'keyword'}
+            })
+        except Exception as e:
+            logger.warning(f"⚠️  저장 여부 확인 실패 (조건부 저장으로 처리): {e}")
+            return None
         return {
-            'saved_count': saved_count,
-            'failed_count': failed_count,
-            'saved_items': saved_items
+            news_id: set(item.get('keywords') or ()) | {item.get('keyword') or item.get('duplicate_keyword', '')}
+            for news_id, item in stored.items()
         }
-    
-    def get_latest_pub_date(self) -> Optional[str]:
-        """DB에 저장된 뉴스 중 가장 최신 pubDate를 조회 (하나만)"""
+
+    async def add_keyword(self, news_ids: List[str], keyword: str) -> int:
+        """이미 저장된 기사들에 수집 키워드 추가 (동시 UpdateItem, 바뀐 기사가 있으면 데이터 버전 증가)"""
+        if not news_ids:
+            return 0
+        counts = Counter()
+        results = await asyncio.gather(
+            *(self.merge_keywords(news_id, {keyword}, counts) for news_id in news_ids), return_exceptions=True
+        )
+        merged = sum(1 for result in results if result and not isinstance(result, Exception))
+        for news_id, result in zip(news_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(f"⚠️  키워드 병합 실패: {news_id} - {result}")
+        await self.update_counters(counts)
+        if merged:
+            await self.bump_data_version()
+        return merged
+
+    async def save_news_items(self, news_items: List[Dict], new_ids: Optional[Iterable[str]] = None) -> Dict:
+        """뉴스 아이템들을 DynamoDB에 저장
+
+        new_ids는 저장 전 BatchGetItem 확인(get_stored_keywords)에서 없던 기사 id로, 이 기사들은
+        BatchWriteItem 25개 단위(최대 SAVE_BATCH_CONCURRENCY개 배치 동시 실행)로 저장한다.
+        확인하지 못한 기사만 기사 id 조건부 PutItem(최대 SAVE_WRITE_CONCURRENCY개 동시)으로 저장해서,
+        이미 저장된 기사는 DB가 쓰기 1회 비용으로 거절하고 이번 수집 키워드만 keywords에 합친다.
+        BatchWriteItem은 조건을 걸 수 없으므로 확인과 저장 사이(이미지 처리 시간)에 다른 키워드 수집이
+        같은 기사를 먼저 저장하면 그 기사의 keyword를 이번 수집 키워드로 덮어쓰고 카운터에 두 번 더한다.
+        """
+        start_time = time.time()
+        new_ids = set(new_ids or ())
+        checked_new = [item for item in news_items if item['id'] in new_ids]
+        batches = [checked_new[i:i + BATCH_WRITE_CHUNK_SIZE] for i in range(0, len(checked_new), BATCH_WRITE_CHUNK_SIZE)]
+        unchecked = [item for item in news_items if item['id'] not in new_ids]
+        batch_semaphore = asyncio.Semaphore(SAVE_BATCH_CONCURRENCY)
+        semaphore = asyncio.Semaphore(SAVE_WRITE_CONCURRENCY)
+        merged_counts = Counter()  # 기존 기사에 추가된 키워드 (카운터 갱신 1회에 합침)
+
+        async def write_batch(batch: List[Dict]) -> List[Tuple[Dict, Optional[str], Optional[str]]]:
+            async with batch_semaphore:
+                try:
+                    failures = await self._write_batch(batch)
+                except Exception as e:
+                    failures = {item['id']: str(e) for item in batch}
+            return [(item, None, failures[item['id']]) if item['id'] in failures else (item, 'saved', None)
+                    for item in batch]
+
+        async def write(item: Dict) -> List[Tuple[Dict, Optional[str], Optional[str]]]:
+            async with semaphore:
+                try:
+                    return [(item, await self._put_new(item, merged_counts), None)]
+                except Exception as e:
+                    return [(item, None, str(e))]
+
+        outcomes = await asyncio.gather(
+            *(write_batch(batch) for batch in batches), *(write(item) for item in unchecked)
+        )
+
+        saved_items = []
+        existing_items = []
+        failed_items = []
+        merged_count = 0
+        for item, outcome, error in (outcome for group in outcomes for outcome in group):
+            if error is not None:
+                failed_items.append({'id': item['id'], 'title': item.get('title', 'Unknown'), 'error': error})
+                logger.error(f"❌ 저장 실패: {item.get('title', 'Unknown')} - {error}")
+            elif outcome == 'saved':
+                saved_items.append({'title': item['title'], 'id': item['id']})
+            else:
+                existing_items.append({'title': item['title'], 'id': item['id']})
+                merged_count += outcome == 'merged'
+                item_logger.info("  ♻️  이미 저장된 기사: %s - %.50s...", item['id'], item['title'])
+
+        duration = time.time() - start_time
+        logger.info(f"💾 저장 완료: {len(saved_items)}개 저장, {len(existing_items)}개 기존 기사, {len(failed_items)}개 실패 "
+                    f"({len(batches)}개 배치 + 조건부 {len(unchecked)}개, {duration:.2f}초, "
+                    f"{len(news_items) / duration if duration else 0:.0f}개/초)")
+
+        saved_ids = {saved['id'] for saved in saved_items}
+        await self.update_counters(
+            self._count_items([item for item in news_items if item['id'] in saved_ids]) + merged_counts
+        )
+        if saved_items or merged_count:  # 기존 기사의 keywords만 바뀐 경우도 news-api 캐시 무효화
+            await self.bump_data_version()
+
+        return {
+            'saved_count': len(saved_items),
+            'existing_count': len(existing_items),
+            'merged_count': merged_count,
+            'failed_count': len(failed_items),
+            'saved_items': saved_items,
+            'existing_items': existing_items,
+            'failed_items': failed_items,
+            'batches': len(batches),
+            'conditional_writes': len(unchecked),
+            'duration_seconds': round(duration, 3)
+        }
+
+    async def bump_data_version(self) -> Optional[int]:
+        """데이터 버전 증가 (news-api Pod들이 이 값이 바뀌면 캐시를 비움)"""
         try:
-            response = self.table.scan(
-                ProjectionExpression='pubDate',
-                FilterExpression=Attr('pubDate').exists()
+            response = await self.executor.run(
+                'update_item',
+                self.table.update_item,
+                Key={'id': DATA_VERSION_KEY},
+                UpdateExpression='ADD #version :one SET updated_at = :now',
+                ExpressionAttributeNames={'#version': 'version'},
+                ExpressionAttributeValues={':one': 1, ':now': datetime.now().isoformat()},
+                ReturnValues='UPDATED_NEW'
             )
-            
-            if not response['Items']:
-                print("📅 기존 수집 데이터가 없습니다.")
-                return None
-                
-            # 가장 최신 pubDate 찾기 (RFC-2822 형식)
-            pub_dates = [item['pubDate'] for item in response['Items']]
-            latest_date = max(pub_dates)
-            
-            print(f"📅 DB 최신 뉴스: {latest_date}")
-            return latest_date
-            
+            version = int(response['Attributes']['version'])
+            logger.info(f"🔖 데이터 버전 갱신: {version}")
+            return version
         except Exception as e:
-            print(f"❌ 최신 pubDate 조회 실패: {str(e)}")
+            logger.warning(f"⚠️  데이터 버전 갱신 실패: {e}")
             return None
 
-    def get_all_pub_dates(self) -> List[str]:
-        """DB에 저장된 모든 뉴스의 pubDate 조회"""
+    @staticmethod
+    def _count_items(items: List[Dict]) -> Counter:
+        """아이템 목록을 카운터 속성별 건수로 집계
+
+        키워드별 건수는 기사를 찾은 수집 키워드마다 1씩 (keyword + 나중에 병합된 keywords)이라
+        합이 total_items보다 클 수 있다.
+        """
+        counts = Counter()
+        for item in items:
+            if item.get('content_type', 'news') != 'news':  # 저장만 해 둔 중복 기사는 집계하지 않음
+                continue
+            keyword = item.get('keyword', 'Unknown')
+            counts['total_items'] += 1
+            counts[KEYWORD_PREFIX + keyword] += 1
+            counts.update(KEYWORD_PREFIX + merged for merged in set(item.get('keywords') or ()) - {keyword})
+            counts[SOURCE_PREFIX + item.get('source', 'Unknown')] += 1
+            counts[DAY_PREFIX + item.get('collected_at', '')[:10]] += 1
+        return counts
+
+    async def update_counters(self, counts: Counter) -> bool:
+        """집계 카운터를 counts만큼 원자적으로 증가 (UpdateItem 1회, 실패 시 백오프 재시도)
+
+        ADD는 멱등이 아니라서 응답만 못 받은 요청을 다시 보내면 두 번 더해진다. 갱신마다 request_token을
+        함께 기록하고 같은 토큰이면 거절하도록 조건을 걸어, 재시도가 조건부 거절되면 이미 반영된 것으로 본다.
+        (재시도 사이에 다른 갱신이 끼어들면 토큰이 바뀌어 구분할 수 없으므로 그때만 두 번 더해질 수 있다)
+        재시도를 모두 실패하면 카운터가 어긋난 채로 남으므로 rebuild_counters로 다시 만들어야 한다.
+        """
+        counts = +counts  # 0 이하 제거
+        if not counts:
+            return True
+
+        names = {'#token': 'request_token'}
+        values = {':now': datetime.now().isoformat(), ':token': uuid.uuid4().hex}
+        add_clauses = []
+        for i, (attribute, count) in enumerate(counts.items()):
+            names[f'#c{i}'] = attribute
+            values[f':c{i}'] = count
+            add_clauses.append(f'#c{i} :c{i}')
+
+        retry_delay = COUNTER_UPDATE_BASE_DELAY
+        for attempt in range(COUNTER_UPDATE_MAX_RETRIES + 1):
+            try:
+                await self.executor.run(
+                    'update_item',
+                    self.table.update_item,
+                    Key={'id': COUNTERS_KEY},
+                    UpdateExpression=f"ADD {', '.join(add_clauses)} SET updated_at = :now, #token = :token",
+                    ConditionExpression='attribute_not_exists(#token) OR #token <> :token',
+                    ExpressionAttributeNames=names,
+                    ExpressionAttributeValues=values
+                )
+                return True
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                    return True  # 응답을 못 받았던 이전 시도가 이미 반영됨
+                error = e
+            except Exception as e:
+                error = e
+            if attempt == COUNTER_UPDATE_MAX_RETRIES:
+                logger.error(f"❌ 집계 카운터 갱신 실패 ({attempt + 1}회 시도, POST /api/counters/rebuild로 재생성 필요): {error}")
+                return False
+            logger.warning(f"⚠️  집계 카운터 갱신 실패, 재시도 ({attempt + 1}/{COUNTER_UPDATE_MAX_RETRIES}): {error}")
+            await asyncio.sleep(retry_delay * (1 + random.random()))
+            retry_delay *= 2
+
+    async def rebuild_counters(self) -> Dict:
+        """전체 테이블을 한 번 스캔하여 집계 카운터 재생성 (기존 데이터 이관용)"""
+        scan_params = {
+            'FilterExpression': Attr('content_type').eq('news'),
+            'ProjectionExpression': 'keyword, keywords, #source, collected_at',
+            'ExpressionAttributeNames': {'#source': 'source'}
+        }
+        counts = Counter()
+        while True:
+            response = await self.executor.run('scan', self.table.scan, **scan_params)
+            counts.update(self._count_items(response.get('Items', [])))
+
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                break
+            scan_params['ExclusiveStartKey'] = last_evaluated_key
+
+        counters_item = {'id': COUNTERS_KEY, 'total_items': 0, 'updated_at': datetime.now().isoformat()}
+        counters_item.update(counts)
+        await self.executor.run('put_item', self.table.put_item, Item=counters_item)
+        logger.info(f"🧮 집계 카운터 재생성 완료: {counters_item['total_items']}개")
+        return await self.get_counters()
+
+    async def get_counters(self) -> Dict:
+        """집계 카운터 조회 (GetItem 1회)"""
+        response = await self.executor.run('get_item', self.table.get_item, Key={'id': COUNTERS_KEY})
+        item = response.get('Item', {})
+
+        def distribution(prefix: str) -> Dict[str, int]:
+            return {
+                key[len(prefix):]: int(value)
+                for key, value in item.items() if key.startswith(prefix)
+            }
+
+        return {
+            'total_items': int(item.get('total_items', 0)),
+            'keyword_distribution': distribution(KEYWORD_PREFIX),
+            'source_distribution': distribution(SOURCE_PREFIX),
+            'daily_distribution': dict(sorted(distribution(DAY_PREFIX).items())),
+            'updated_at': item.get('updated_at')
+        }
+
+    async def _batch_get(self, ids: Iterable[str], request_template: Optional[Dict] = None) -> Dict[str, Dict]:
+        """BatchGetItem 100개 단위 조회 (UnprocessedKeys 재시도) → {id: 아이템}"""
+        unique_ids = list(dict.fromkeys(ids))
+        found = {}
+        for i in range(0, len(unique_ids), BATCH_GET_CHUNK_SIZE):
+            keys = [{'id': item_id} for item_id in unique_ids[i:i + BATCH_GET_CHUNK_SIZE]]
+            retry_delay = 0.05
+            for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+                response = await self.executor.run(
+                    'batch_get_item',
+                    self.dynamodb.batch_get_item,
+                    RequestItems={self.table_name: {'Keys': keys, **(request_template or {})}}
+                )
+                for item in response.get('Responses', {}).get(self.table_name, []):
+                    found[item['id']] = item
+
+                keys = response.get('UnprocessedKeys', {}).get(self.table_name, {}).get('Keys', [])
+                if not keys or attempt == BATCH_GET_MAX_RETRIES:
+                    break
+                # 처리량 초과로 남은 키는 지수 백오프(지터 포함) 후 재요청
+                await asyncio.sleep(retry_delay * (1 + random.random()))
+                retry_delay *= 2
+        return found
+
+    async def get_fingerprint_shards(self, shard_ids: Iterable[str]) -> Dict[str, Dict]:
+        """지문 색인 샤드 조회 → {샤드 id: 아이템}"""
+        return await self._batch_get(shard_ids)
+
+    async def add_fingerprints(self, shard_id: str, entries: Dict[str, str], expires_at: int) -> None:
+        """지문 색인 샤드에 대표 기사 지문 추가 (UpdateItem 1회, 샤드 아이템이 없으면 생성)
+
+        expires_at(epoch 초)은 보관 기간이 지난 샤드를 테이블 TTL로 정리하기 위한 값이다.
+        """
+        names = {}
+        values = {':now': datetime.now().isoformat(), ':ttl': expires_at}
+        set_clauses = ['updated_at = :now', 'expires_at = :ttl']
+        for i, (attribute, entry) in enumerate(entries.items()):
+            names[f'#s{i}'] = attribute
+            values[f':s{i}'] = entry
+            set_clauses.append(f'#s{i} = :s{i}')
+
+        await self.executor.run(
+            'update_item',
+            self.table.update_item,
+            Key={'id': shard_id},
+            UpdateExpression=f"SET {', '.join(set_clauses)}",
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values
+        )
+
+    async def get_trend_bucket(self, bucket_id: str) -> Optional[Dict]:
+        """인기어 집계 구간 아이템 조회 (갱신 전 읽기이므로 강한 일관성)"""
+        response = await self.executor.run(
+            'get_item',
+            self.table.get_item,
+            Key={'id': bucket_id},
+            ConsistentRead=True
+        )
+        return response.get('Item')
+
+    async def put_trend_bucket(self, item: Dict, expected_revision: int) -> bool:
+        """인기어 집계 구간 아이템 저장 (읽은 뒤 다른 수집 실행이 먼저 저장했으면 False)"""
+        if expected_revision:
+            condition = {
+                'ConditionExpression': '#revision = :revision',
+                'ExpressionAttributeNames': {'#revision': 'revision'},
+                'ExpressionAttributeValues': {':revision': expected_revision}
+            }
+        else:
+            condition = {'ConditionExpression': 'attribute_not_exists(id)'}
+
         try:
-            response = self.table.scan(
-                ProjectionExpression='pubDate',
-                FilterExpression=Attr('pubDate').exists()
-            )
-            
-            pub_dates = [item['pubDate'] for item in response['Items']]
-            print(f"📊 DB에서 {len(pub_dates)}개 뉴스의 pubDate 조회 완료")
-            return pub_dates
-            
-        except Exception as e:
-            print(f"❌ pubDate 조회 실패: {str(e)}")
-            return []
-    
-    def get_latest_pub_date(self) -> Optional[str]:
-        """DB에 저장된 뉴스 중 가장 최신 pubDate를 조회 (하나만)"""
+            await self.executor.run('put_item', self.table.put_item, Item=item, **condition)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise
+
+    @staticmethod
+    def _pub_timestamp(pub_date: str) -> Optional[int]:
+        """RFC-2822 pubDate → epoch 초 (파싱 실패 시 None)"""
         try:
-            response = self.table.scan(
-                ProjectionExpression='pubDate',
-                FilterExpression=Attr('pubDate').exists()
-            )
-            
-            if not response['Items']:
-                print("📅 기존 수집 데이터가 없습니다.")
-                return None
-                
-            # 가장 최신 pubDate 찾기 (RFC-2822 형식)
-            pub_dates = [item['pubDate'] for item in response['Items']]
-            latest_date = max(pub_dates)
-            
-            return latest_date
-            
-        except Exception as e:
-            print(f"❌ 최신 pubDate 조회 실패: {str(e)}")
+            return int(email.utils.parsedate_to_datetime(pub_date).timestamp())
+        except (TypeError, ValueError):
+            return None
+
+    async def _bootstrap_watermark(self, keyword: str) -> Optional[Dict]:
+        """워터마크 아이템이 없는 키워드: 키워드 피드 인덱스의 최근 수집분으로 초기값 생성 (Query 1회)"""
+        response = await self.executor.run(
+            'query',
+            self.table.query,
+            IndexName=self.keyword_gsi_name,
+            KeyConditionExpression=Key('keyword').eq(keyword),
+            ScanIndexForward=False,
+            Limit=WATERMARK_BOOTSTRAP_ITEMS,
+            ProjectionExpression='pubDate'
+        )
+        pub_dates = [item['pubDate'] for item in response.get('Items', []) if item.get('pubDate')]
+        if not pub_dates:
             return None
+        await self.advance_watermark(keyword, pub_dates)
+        latest = max(pub_dates, key=lambda pub_date: self._pub_timestamp(pub_date) or 0)
+        return {'pubDate': latest, 'pub_ts': self._pub_timestamp(latest)}
 
-    def get_last_collected_time(self) -> Optional[str]:
-        """가장 최근 수집된 뉴스의 pubDate를 조회"""
+    async def get_watermark(self, keyword: str) -> Optional[str]:
+        """키워드별 수집 워터마크 (이미 저장한 뉴스 중 가장 최신 pubDate, GetItem 1회)"""
         try:
-            # pubDate 필드가 있는 아이템들만 조회
-            response = self.table.scan(
-                ProjectionExpression='pubDate',
-                FilterExpression=Attr('pubDate').exists()
+            response = await self.executor.run(
+                'get_item',
+                self.table.get_item,
+                Key={'id': WATERMARK_PREFIX + keyword},
+                ConsistentRead=True
             )
-            
-            if not response['Items']:
-                print("📅 기존 수집 데이터가 없습니다. 전체 수집을 시작합니다.")
+            watermark = response.get('Item')
+            if watermark is None:
+                watermark = await self._bootstrap_watermark(keyword)
+            if watermark is None:
+                logger.info(f"📅 '{keyword}' 기존 수집 데이터가 없습니다. 전체 수집을 시작합니다.")
                 return None
-                
-            # RFC-2822 형식을 datetime으로 변환해서 가장 최신 찾기
-            import email.utils
-            
-            latest_timestamp = None
-            latest_date_str = None
-            
-            for item in response['Items']:
-                try:
-                    pub_date_str = item['pubDate']
-                    timestamp = email.utils.parsedate_to_datetime(pub_date_str)
-                    
-                    if latest_timestamp is None or timestamp > latest_timestamp:
-                        latest_timestamp = timestamp
-                        latest_date_str = pub_date_str
-                except Exception as e:
-                    print(f"⚠️ 날짜 파싱 실패: {item.get('pubDate', 'Unknown')} - {e}")
-                    continue
-            
-            if latest_date_str:
-                print(f"📅 DB 최신 뉴스: {latest_date_str}")
-                return latest_date_str
-            else:
-                print("❌ 유효한 pubDate를 찾을 수 없습니다.")
-                return None
-                
+
+            logger.info(f"📅 '{keyword}' 수집 워터마크: {watermark['pubDate']}")
+            return watermark['pubDate']
+
         except Exception as e:
-            print(f"❌ 마지막 수집 시간 조회 실패: {str(e)}")
-            print("⚠️ 전체 수집으로 진행합니다.")
+            logger.error(f"❌ 수집 워터마크 조회 실패: {str(e)}")
+            logger.warning("⚠️ 전체 수집으로 진행합니다.")
             return None
-    
-    def get_crawl_statistics(self) -> Dict:
-        """크롤링 통계 조회"""
+
+    async def advance_watermark(self, keyword: str, pub_dates: Iterable[str]) -> None:
+        """키워드별 수집 워터마크를 이번에 처리한 가장 최신 pubDate로 올림 (더 최신일 때만 갱신되는 조건부 UpdateItem)"""
+        timestamps = [
+            (timestamp, pub_date) for pub_date in pub_dates
+            if (timestamp := self._pub_timestamp(pub_date)) is not None
+        ]
+        if not timestamps:
+            return
+        pub_ts, pub_date = max(timestamps)
+
         try:
-            # 테이블 스캔으로 전체 아이템 수 조회 (실제 운영에서는 별도 카운터 테이블 사용 권장)
-            response = self.table.scan(Select='COUNT')
-            total_items = response['Count']
-            
-            return {
-                'total_items': total_items,
-                'table_name': self.table_name
-            }
+            await self.executor.run(
+                'update_item',
+                self.table.update_item,
+                Key={'id': WATERMARK_PREFIX + keyword},
+                UpdateExpression='SET pub_ts = :ts, pubDate = :pub_date, updated_at = :now',
+                ConditionExpression='attribute_not_exists(pub_ts) OR pub_ts < :ts',
+                ExpressionAttributeValues={
+                    ':ts': pub_ts,
+                    ':pub_date': pub_date,
+                    ':now': datetime.now().isoformat()
+                }
+            )
+            logger.info(f"📅 '{keyword}' 수집 워터마크 갱신: {pub_date}")
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                logger.warning(f"⚠️  수집 워터마크 갱신 실패: {e}")
+            # 다른 수집 실행이 이미 더 최신으로 올려 둠
+
+    async def get_crawl_statistics(self) -> Dict:
+        """크롤링 통계 조회 (집계 카운터 아이템 사용)"""
+        try:
+            counters = await self.get_counters()
+            counters['table_name'] = self.table_name
+            return counters
         except Exception as e:
-            print(f"❌ 통계 조회 실패: {e}")
+            logger.error(f"❌ 통계 조회 실패: {e}")
             return {'total_items': 0, 'table_name': self.table_name}
 
 # 전역 인스턴스
@@ -0,0 +1,106 @@
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from dotenv import load_dotenv
+from logging_config import get_logger
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from metrics import (
+    CAPACITY_OPERATIONS, DYNAMODB_CALL_DURATION, DYNAMODB_CALL_ERRORS, record_consumed_capacity
+)
+
+# .env 파일 로드
+load_dotenv()
+
+logger = get_logger(__name__)
+
+
+class DynamoDBExecutor:
+    """boto3 동기 호출을 전용 스레드 풀에서 실행하는 비동기 래퍼
+
+    async 핸들러에서 boto3를 직접 호출하면 이벤트 루프가 막히므로 모든 DynamoDB 호출은
+    이 풀을 거친다. 풀 크기로 동시 호출 수를 제한하고 호출마다 타임아웃을 적용한다.
+    """
+
+    def __init__(self):
+        self.max_workers = int(os.getenv("DYNAMODB_MAX_WORKERS", "16"))
+        self.call_timeout = float(os.getenv("DYNAMODB_CALL_TIMEOUT", "5"))
+
+        # botocore 타임아웃/재시도는 호출 타임아웃 안에 모든 시도가 끝나도록 맞춤:
+        # (연결 + 응답) x 시도 횟수 < 호출 타임아웃. 호출 타임아웃이 지난 뒤에도 스레드가 재시도를
+        # 이어가며 풀을 붙잡지 않도록, 지정값이 시도당 몫보다 크면 줄인다 (10%는 재시도 대기 몫)
+        self.max_attempts = max(1, int(os.getenv("DYNAMODB_MAX_ATTEMPTS", "5")))
+        attempt_budget = self.call_timeout * 0.9 / self.max_attempts
+        self.connect_timeout = min(float(os.getenv("DYNAMODB_CONNECT_TIMEOUT", "1")), attempt_budget / 3)
+        self.read_timeout = min(float(os.getenv("DYNAMODB_READ_TIMEOUT", "3")), attempt_budget - self.connect_timeout)
+        # 연속 실패 수 (/ready 판단용, DynamoDB 응답을 받으면 0으로 되돌림)
+        self.consecutive_failures = 0
+        self.last_success_at: Optional[float] = None
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="dynamodb"
+        )
+
+    def client_config(self) -> Config:
+        """boto3 클라이언트 설정 (연결 풀, 연결/응답 타임아웃, adaptive 재시도)"""
+        return Config(
+            # 스레드 풀 크기만큼 HTTP 연결을 재사용할 수 있도록 설정
+            max_pool_connections=self.max_workers,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+            # 스로틀링이 나면 클라이언트 쪽에서 호출 속도를 줄이는 재시도 방식
+            retries={'mode': 'adaptive', 'max_attempts': self.max_attempts}
+        )
+
+    async def run(self, operation: str, func: Callable, *args,
+                  timeout: Optional[float] = None, **kwargs) -> Any:
+        """func(*args, **kwargs)를 풀에서 실행 (timeout 초과 시 asyncio.TimeoutError)
+
+        operation은 메트릭 라벨로 쓰이며, 데이터 조회/저장 호출은 ConsumedCapacity도 함께 기록한다.
+        """
+        if operation in CAPACITY_OPERATIONS:
+            kwargs.setdefault('ReturnConsumedCapacity', 'TOTAL')
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        start_time = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(future, timeout or self.call_timeout)
+        except asyncio.TimeoutError:
+            DYNAMODB_CALL_ERRORS.labels(operation, 'Timeout').inc()
+            self._record_result(ok=False)
+            logger.warning(f"⏱️  DynamoDB {operation} 타임아웃 ({timeout or self.call_timeout}초)")
+            raise
+        except ClientError as e:
+            DYNAMODB_CALL_ERRORS.labels(operation, e.response.get('Error', {}).get('Code', 'ClientError')).inc()
+            # 조건부 쓰기 거절/스로틀링 등 4xx는 DynamoDB가 응답한 것이므로 성공으로 침
+            self._record_result(ok=e.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 500) < 500)
+            raise
+        except Exception as e:
+            DYNAMODB_CALL_ERRORS.labels(operation, type(e).__name__).inc()
+            self._record_result(ok=False)
+            raise
+        finally:
+            DYNAMODB_CALL_DURATION.labels(operation).observe(time.perf_counter() - start_time)
+
+        self._record_result(ok=True)
+        record_consumed_capacity(operation, response)
+        return response
+
+    def _record_result(self, ok: bool) -> None:
+        """호출 결과 기록 (요청 시간 예산 소진은 DynamoDB 상태와 무관하므로 기록하지 않음)"""
+        if ok:
+            self.consecutive_failures = 0
+            self.last_success_at = time.time()
+        else:
+            self.consecutive_failures += 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+# 전역 인스턴스
+dynamodb_executor = DynamoDBExecutor()
@@ -9,10 +9,13 @@ from urllib.parse import urljoin, urlparse
 from botocore.exceptions import ClientError
 from datetime import datetime
 from dotenv import load_dotenv
+from logging_config import get_logger
 
 # .env 파일 로드
 load_dotenv()
 
+logger = get_logger(__name__)
+
 class ImageExtractor:
     def __init__(self):
         self.s3_client = None
@@ -25,14 +28,15 @@ class ImageExtractor:
             try:
                 self.s3_client = boto3.client(
                     's3',
-                    region_name=os.getenv("AWS_REGION", "ap-northeast-2")
+                    region_name=os.getenv("AWS_REGION", "ap-northeast-2"),
+                    endpoint_url=os.getenv("S3_ENDPOINT_URL") or None  # 로컬 S3 호환 저장소 (벤치마크/개발용)
                 )
-                print(f"✅ S3 서비스 준비 완료")
+                logger.info(f"✅ S3 서비스 준비 완료")
             except Exception as e:
-                print(f"⚠️  S3 초기화 실패: {str(e)[:50]}...")
+                logger.warning(f"⚠️  S3 초기화 실패: {str(e)[:50]}...")
                 self.s3_client = None
         else:
-            print("⚠️  S3 미설정 - 이미지 업로드 비활성화")
+            logger.warning("⚠️  S3 미설정 - 이미지 업로드 비활성화")
     
     def extract_image_from_article(self, article_url: str) -> Optional[str]:
         """뉴스 기사 URL에서 이미지 URL을 추출"""
@@ -175,7 +179,7 @@ class ImageExtractor:
             }
             
         except Exception as e:
-            print(f"❌ S3 업로드 실패: {str(e)[:50]}...")
+            logger.error(f"❌ S3 업로드 실패: {str(e)[:50]}...")
             raise e
     
     def process_news_image(self, article_url: str, id: str) -> Optional[Dict]:
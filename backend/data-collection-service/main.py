@@ -1,5 +1,6 @@
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 import uvicorn
 import os
 import time
@@ -8,19 +9,21 @@ from typing import Optional
 import asyncio
 import email.utils
 import concurrent.futures
-import logging
-import json
 from datetime import datetime
-import sys
-import pytz
 
 from models import CrawlResponse, CrawlStatus
 from naver_api import naver_api
 from database import db_manager
 from image_extractor import image_extractor
+from story_dedup import story_deduplicator
+from trending import trend_recorder
+from executor import dynamodb_executor
+from logging_config import get_logger, log_pipeline
+from metrics import setup_metrics, COLLECTION_DURATION, COLLECTION_ITEMS, COLLECTION_ERRORS
 
-# 한국 시간대 설정
-KST = pytz.timezone('Asia/Seoul')
+# time-to-ready 측정 기준 (프로세스 시작 시각)
+PROCESS_STARTED_AT = time.time()
+startup_state = {'ready_at': None}
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -38,43 +41,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# JSON 포맷터 클래스
-class JSONFormatter(logging.Formatter):
-    def format(self, record):
-        log_entry = {
-            "timestamp": datetime.now(KST).isoformat(),
-            "level": record.levelname,
-            "service": "news-api-service",
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno
-        }
-        
-        # extra 필드 추가
-        if hasattr(record, 'extra_data'):
-            log_entry.update(record.extra_data)
-
-        return json.dumps(log_entry, ensure_ascii=False)  # 한글 깨짐 방지
-
-# 로거 설정
-def setup_logging():
-    logger = logging.getLogger("news_api")
-    logger.setLevel(logging.INFO)
-    
-    # 기존 핸들러 제거
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-    
-    # 새로운 핸들러 추가
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JSONFormatter())
-    logger.addHandler(handler)
-    
-    return logger
+# Prometheus 메트릭 (/metrics, 라우트별 지연 히스토그램/처리 중 요청 수)
+setup_metrics(app)
 
-# 로거 인스턴스 생성
-logger = setup_logging()
+# 로거 인스턴스 생성 (큐 기반 비동기 출력, logging_config 참고)
+logger = get_logger()
+item_logger = get_logger('items')  # 뉴스 1건마다 남는 로그 (샘플링/건수 제한 대상)
 
 # 크롤링 상태 관리
 crawl_status = CrawlStatus(
@@ -95,26 +67,41 @@ def is_news_newer(news_pub_date: str, latest_pub_date: str) -> bool:
         return news_timestamp > latest_timestamp
         
     except Exception as e:
-        print(f"⚠️ 날짜 파싱 오류: {e}, 문자열 비교로 대체")
+        logger.warning(f"⚠️ 날짜 파싱 오류: {e}, 문자열 비교로 대체")
         # 파싱 실패 시 문자열 비교로 대체
         return news_pub_date > latest_pub_date
 
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작시 DynamoDB 연결"""
-    try:
-        db_manager.connect()
-        stats = db_manager.get_crawl_statistics()
-        crawl_status.total_collected = stats['total_items']
-        logger.info(f"📈 기존 수집된 뉴스: {stats['total_items']}개")
-        
-        if image_extractor.s3_client:
-            logger.info(f"🖼️  이미지 수집 기능 활성화")
-        else:
-            logger.warning(f"⚠️  이미지 수집 기능 비활성화")
-            
-    except Exception as e:
-        logger.error(f"❌ 시작 시 오류: {e}")
+    """앱 시작 (DynamoDB 연결은 백그라운드에서 예열, /ready로 준비 상태 노출)"""
+    if image_extractor.s3_client:
+        logger.info(f"🖼️  이미지 수집 기능 활성화")
+    else:
+        logger.warning(f"⚠️  이미지 수집 기능 비활성화")
+    asyncio.create_task(warm_up())
+
+async def warm_up():
+    """DynamoDB 클라이언트 예열 (성공할 때까지 재시도)"""
+    retry_delay = 1
+    while True:
+        try:
+            await db_manager.warm_up()
+            startup_state['ready_at'] = time.time()
+            time_to_ready = startup_state['ready_at'] - PROCESS_STARTED_AT
+            logger.info("✅ 수집 서비스 준비 완료!", extra={
+                'extra_data': {'time_to_ready_seconds': round(time_to_ready, 3)}
+            })
+            return
+        except Exception as e:
+            logger.error(f"❌ DynamoDB 예열 실패: {e} ({retry_delay}초 후 재시도)")
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 30)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """DynamoDB 스레드 풀 정리"""
+    dynamodb_executor.shutdown()
+    log_pipeline.stop()
 
 @app.get("/")
 async def root():
@@ -126,10 +113,35 @@ async def root():
         "endpoints": [
             "POST /api/collect - 뉴스 수집 실행",
             "GET /api/status - 수집 상태 조회",
-            "GET /health - 헬스체크"
+            "POST /api/counters/rebuild - 집계 카운터 재생성 (기존 데이터 이관용)",
+            "GET /health - 헬스체크 (liveness, 외부 의존성 확인 없음)",
+            "GET /ready - 준비 상태 확인 (readiness, 예열 완료 + 최근 DynamoDB 호출 상태)",
+            "GET /metrics - Prometheus 메트릭 (요청 지연, 수집 건수/시간, DynamoDB 호출/ConsumedCapacity)"
         ]
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 확인 (예열 완료 + DynamoDB 호출 연속 실패 없음, 수집 요청 수신 기준)
+
+    probe마다 DynamoDB를 호출하지 않고 요청/백그라운드 작업의 호출 결과로 판단한다.
+    """
+    dynamodb_ready = await db_manager.check_ready()
+    ready_at = startup_state['ready_at']
+    body = {
+        "status": "ready" if dynamodb_ready else "not_ready",
+        "timestamp": datetime.now().isoformat(),
+        "service": "data-collection-service",
+        "checks": {
+            "dynamodb": "ok" if dynamodb_ready else "unavailable",
+            "dynamodb_consecutive_failures": db_manager.executor.consecutive_failures,
+            "naver_api": "configured" if naver_api.client_id else "not_configured",
+            "image_service": "enabled" if image_extractor.s3_client else "disabled"
+        },
+        "time_to_ready_seconds": round(ready_at - PROCESS_STARTED_AT, 3) if ready_at else None
+    }
+    return JSONResponse(status_code=200 if dynamodb_ready else 503, content=body)
+
 @app.get("/health")
 async def health_check():
     return {
@@ -184,13 +196,13 @@ async def collect_news_with_time_filter(query: str, display: int = 10, start: in
     crawl_status.is_running = True
     crawl_status.last_query = query
     crawl_status.last_error = None
+    start_time = time.time()
     
     try:
-        start_time = time.time()
         logger.info(f"🚀 뉴스 수집 시작: '{query}' (display={display}, images={'enabled' if include_images else 'disabled'})")
         
-        # DB에서 가장 최신 pubDate 조회 (하나만)
-        latest_pub_date = db_manager.get_last_collected_time()
+        # 이 키워드로 이미 저장한 가장 최신 pubDate (워터마크 아이템 GetItem 1회)
+        latest_pub_date = await db_manager.get_watermark(query)
         if latest_pub_date:
             logger.info(f"📅 DB 최신 뉴스 시간: {latest_pub_date}")
         else:
@@ -209,6 +221,7 @@ async def collect_news_with_time_filter(query: str, display: int = 10, start: in
         
         # 최신 뉴스 시간과 비교하여 더 최신 뉴스만 필터링
         original_count = len(db_items)
+        COLLECTION_ITEMS.labels(query, 'fetched').inc(original_count)
         if latest_pub_date and db_items:
             logger.info(f"🔍 최신 뉴스와 날짜 비교 시작: 기준 {latest_pub_date}")
             filtered_items = []
@@ -218,21 +231,41 @@ async def collect_news_with_time_filter(query: str, display: int = 10, start: in
                 if not news_pub_date:
                     # pubDate가 없는 경우는 일단 수집
                     filtered_items.append(item)
-                    logger.info(f"  ✅ 수집: {item.get('title', 'Unknown')[:50]}... (pubDate 없음)")
+                    item_logger.info("  ✅ 수집: %.50s... (pubDate 없음)", item.get('title', 'Unknown'))
                     continue
                 
                 # 가장 최신 뉴스와만 비교
                 if is_news_newer(news_pub_date, latest_pub_date):
                     filtered_items.append(item)
-                    logger.info(f"  ✅ 수집: {item.get('title', 'Unknown')[:50]}... ({news_pub_date})")
+                    item_logger.info("  ✅ 수집: %.50s... (%s)", item.get('title', 'Unknown'), news_pub_date)
                 else:
-                    logger.info(f"  ⏭️  스킵: {item.get('title', 'Unknown')[:50]}... (기존보다 오래됨)")
+                    item_logger.info("  ⏭️  스킵: %.50s... (기존보다 오래됨)", item.get('title', 'Unknown'))
 
             db_items = filtered_items
             logger.info(f"🕐 날짜 필터링 완료: {original_count}개 → {len(db_items)}개 (더 최신 뉴스만)")
         else:
             logger.info(f"📊 첫 수집 또는 기존 데이터 없음: {len(db_items)}개 모두 처리")
 
+        # 이미 저장된 기사 (겹치는 페이지, 재시도한 수집 등으로 다시 받은 기사)는
+        # 이미지 처리/저장 없이 이번 수집 키워드만 합침 (BatchGetItem으로 한 번에 확인)
+        checked_new_ids = set()
+        if db_items:
+            stored_keywords = await db_manager.get_stored_keywords([item['id'] for item in db_items])
+            if stored_keywords is not None:  # 확인한 기사는 조건 없이 배치로 저장 (확인 실패 시 조건부 저장)
+                checked_new_ids = {item['id'] for item in db_items if item['id'] not in stored_keywords}
+            stored_keywords = stored_keywords or {}
+            already_stored = [item for item in db_items if item['id'] in stored_keywords]
+            if already_stored:
+                db_items = [item for item in db_items if item['id'] not in stored_keywords]
+                await db_manager.add_keyword(
+                    [item['id'] for item in already_stored if query not in stored_keywords[item['id']]], query
+                )
+                await db_manager.advance_watermark(query, [item.get('pubDate') for item in already_stored])
+                COLLECTION_ITEMS.labels(query, 'existing').inc(len(already_stored))
+                logger.info(f"♻️  이미 저장된 기사 {len(already_stored)}개 제외 (키워드만 병합)")
+
+        COLLECTION_ITEMS.labels(query, 'new').inc(len(db_items))
+
         if not db_items:
             message = "새로운 뉴스가 없습니다" if latest_pub_date else "수집된 뉴스가 없습니다"
             logger.warning(f"⚠️ {message}")
@@ -246,7 +279,13 @@ async def collect_news_with_time_filter(query: str, display: int = 10, start: in
                 'duration_seconds': round(time.time() - start_time, 2)
             }
 
-        logger.info(f"📊 처리할 뉴스: {len(db_items)}개")
+        # 유사 기사 묶기 (다른 언론사가 낸 같은 기사는 이미지 처리/저장 대상에서 제외)
+        stories = await story_deduplicator.assign_stories(db_items)
+        db_items = stories['representatives']
+        duplicates = stories['duplicates']
+        COLLECTION_ITEMS.labels(query, 'duplicate').inc(len(duplicates))
+
+        logger.info(f"📊 처리할 뉴스: {len(db_items)}개 (중복 {len(duplicates)}개 제외)")
 
         # 이미지 처리 (병렬)
         if include_images and image_extractor.s3_client:
@@ -256,8 +295,23 @@ async def collect_news_with_time_filter(query: str, display: int = 10, start: in
                 item['image_url'] = None
                 item['cloudfront_image_url'] = None
         
-        # DynamoDB에 저장
-        save_result = db_manager.save_news_items(db_items)
+        # DynamoDB에 저장 (중복 기사는 DEDUP_STORE_DUPLICATES일 때만 이미지 없이 함께 저장)
+        stored_duplicates = duplicates if story_deduplicator.store_duplicates else []
+        for item in stored_duplicates:
+            item['image_url'] = None
+            item['cloudfront_image_url'] = None
+        save_result = await db_manager.save_news_items(db_items + stored_duplicates, new_ids=checked_new_ids)
+        saved_ids = {saved['id'] for saved in save_result['saved_items']}
+        await story_deduplicator.commit(stories['pending'], saved_ids)
+
+        # 다음 수집 기준 갱신 (저장한 기사, 그 사이 다른 수집이 먼저 저장한 기사, 중복으로 묶은 기사)
+        existing_ids = {existing['id'] for existing in save_result['existing_items']}
+        processed = [item for item in db_items if item['id'] in saved_ids] + duplicates
+        stored_meanwhile = [item for item in db_items if item['id'] in existing_ids]
+        await db_manager.advance_watermark(query, [item.get('pubDate') for item in processed + stored_meanwhile])
+
+        # 인기 검색어/키워드 구간 집계 (같은 이야기를 여러 언론사가 쓴 것도 화제성이므로 중복 기사 포함)
+        await trend_recorder.record(processed)
         
         # 상태 업데이트
         crawl_status.total_collected += save_result['saved_count']
@@ -267,6 +321,9 @@ async def collect_news_with_time_filter(query: str, display: int = 10, start: in
         
         # 이미지 통계
         image_success = sum(1 for item in db_items if item.get('cloudfront_image_url'))
+        COLLECTION_ITEMS.labels(query, 'saved').inc(save_result['saved_count'])
+        COLLECTION_ITEMS.labels(query, 'failed').inc(save_result.get('failed_count', 0))
+        COLLECTION_ITEMS.labels(query, 'images').inc(image_success)
         
         result = {
             'message': f'Successfully collected {save_result["saved_count"]} new news for "{query}"',
@@ -275,8 +332,11 @@ async def collect_news_with_time_filter(query: str, display: int = 10, start: in
             'latest_db_news_time': latest_pub_date,
             'original_fetched': original_count,
             'filtered_count': len(db_items),
+            'duplicates_collapsed': len(duplicates),
             'saved_count': save_result['saved_count'],
+            'existing_count': save_result.get('existing_count', 0),
             'failed_count': save_result.get('failed_count', 0),
+            'failed_items': save_result.get('failed_items', []),
             'images_processed': image_success,
             'duration_seconds': round(duration, 2)
         }
@@ -287,9 +347,11 @@ async def collect_news_with_time_filter(query: str, display: int = 10, start: in
     except Exception as e:
         error_msg = f"뉴스 수집 실패: {str(e)}"
         crawl_status.last_error = error_msg
+        COLLECTION_ERRORS.labels(query).inc()
         logger.error(f"❌ {error_msg}")
         raise Exception(error_msg)
     finally:
+        COLLECTION_DURATION.labels(query).observe(time.time() - start_time)
         crawl_status.is_running = False
 
 @app.post("/api/collect", response_model=CrawlResponse)
@@ -304,6 +366,8 @@ async def collect_news(
     
     if crawl_status.is_running:
         raise HTTPException(status_code=400, detail="뉴스 수집이 이미 실행 중입니다")
+    if not db_manager.ready:
+        raise HTTPException(status_code=503, detail="DynamoDB 연결 준비 중입니다")
     
     try:
         result = await collect_news_with_time_filter(query, display, start, sort, include_images)
@@ -319,7 +383,7 @@ async def collect_news(
 @app.get("/api/status")
 async def get_status():
     """수집 상태 조회"""
-    stats = db_manager.get_crawl_statistics()
+    stats = await db_manager.get_crawl_statistics()
     
     return {
         "statusCode": 200,
@@ -330,17 +394,42 @@ async def get_status():
                 "last_error": crawl_status.last_error
             },
             "collection_stats": {
-                "total_collected": stats['total_items']
+                "total_collected": stats['total_items'],
+                "keyword_distribution": stats.get('keyword_distribution', {}),
+                "source_distribution": stats.get('source_distribution', {}),
+                "daily_distribution": stats.get('daily_distribution', {})
             },
             "services": {
                 "naver_api": "connected" if naver_api.client_id else "not_configured",
                 "dynamodb": "connected" if db_manager.table else "not_connected",
                 "image_processing": image_extractor.s3_client is not None
             },
+            "story_dedup": story_deduplicator.stats(),
+            "trending": trend_recorder.stats(),
             "timestamp": datetime.now().isoformat()
         }
     }
 
+@app.post("/api/counters/rebuild")
+async def rebuild_counters():
+    """집계 카운터 재생성 (기존 데이터 이관 시 1회 실행, 전체 테이블 스캔)"""
+    if crawl_status.is_running:
+        raise HTTPException(status_code=400, detail="뉴스 수집 중에는 카운터를 재생성할 수 없습니다")
+    
+    try:
+        counters = await db_manager.rebuild_counters()
+        crawl_status.total_collected = counters['total_items']
+        return {
+            "statusCode": 200,
+            "body": {
+                "message": "집계 카운터 재생성 완료",
+                "counters": counters,
+                "timestamp": datetime.now().isoformat()
+            }
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"카운터 재생성 실패: {str(e)}")
+
 @app.get("/api/stress-test")
 async def stress_test():
     """CPU 부하 + 실제 뉴스 수집"""
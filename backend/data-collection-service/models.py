@@ -15,6 +15,7 @@ class NewsItem(BaseModel):
     collected_at: str
     content_type: str
     source: str
+    story_id: Optional[str] = None  # 유사 기사 묶음 id (대표 기사는 자기 id)
 
 class CrawlRequest(BaseModel):
     query: str = "비트코인"
@@ -4,32 +4,60 @@ import urllib.error
 import json
 import os
 import re
-import uuid
+import hashlib
 from typing import Dict, List
 from datetime import datetime
 from dotenv import load_dotenv
+from logging_config import get_logger
 
 # .env 파일 로드
 load_dotenv()
 
+logger = get_logger(__name__)
+
+# 같은 기사라도 유입 경로마다 달라지는 추적용 쿼리 파라미터 (기사 id 계산에서 제외)
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'ref', 'from', 'nv', 'sid', 'ncid', 'cmpid', 'mc_cid', 'mc_eid'})
+
+
+def normalize_link(link: str) -> str:
+    """기사 URL 정규화 (http/https·www·대소문자·추적 파라미터·파라미터 순서·끝 슬래시 차이 제거)"""
+    parsed = urllib.parse.urlsplit(link.strip())
+    host = (parsed.hostname or '').lower().removeprefix('www.')
+    if parsed.port and parsed.port not in (80, 443):
+        host = f"{host}:{parsed.port}"
+    query = sorted(
+        (key, value) for key, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    path = parsed.path.rstrip('/') or '/'
+    return f"{host}{path}" + (f"?{urllib.parse.urlencode(query)}" if query else '')
+
+
+def article_id(item: Dict) -> str:
+    """기사 고유 id (정규화한 originallink 해시, 다시 수집해도 같은 id → 조건부 저장으로 중복 거절)"""
+    source = item.get('originallink') or item.get('link')
+    key = normalize_link(source) if source else f"{item.get('title', '')}|{item.get('pubDate', '')}"
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+
+
 class NaverNewsAPI:
     def __init__(self):
         self.client_id = os.getenv("NAVER_CLIENT_ID")
         self.client_secret = os.getenv("NAVER_CLIENT_SECRET")
-        self.search_url = "https://openapi.naver.com/v1/search/news.json"
+        self.search_url = os.getenv("NAVER_SEARCH_URL", "https://openapi.naver.com/v1/search/news.json")
         
-        print(f"🔑 네이버 API 설정 확인:")
-        print(f"   Client ID: {'설정됨' if self.client_id else '❌ 없음'}")
-        print(f"   Client Secret: {'설정됨' if self.client_secret else '❌ 없음'}")
+        logger.info(f"🔑 네이버 API 설정 확인:")
+        logger.info(f"   Client ID: {'설정됨' if self.client_id else '❌ 없음'}")
+        logger.info(f"   Client Secret: {'설정됨' if self.client_secret else '❌ 없음'}")
         
         if not self.client_id or not self.client_secret:
-            print("\n❌ 네이버 API 키가 설정되지 않았습니다!")
-            print("📝 해결 방법:")
-            print("1. 프로젝트 루트에 .env 파일이 있는지 확인")
-            print("2. .env 파일에 다음 내용이 있는지 확인:")
-            print("   NAVER_CLIENT_ID=your_client_id")
-            print("   NAVER_CLIENT_SECRET=your_client_secret")
-            print("3. .env 파일이 main.py와 같은 폴더에 있는지 확인")
+            logger.error("❌ 네이버 API 키가 설정되지 않았습니다!")
+            logger.error("📝 해결 방법:")
+            logger.error("1. 프로젝트 루트에 .env 파일이 있는지 확인")
+            logger.error("2. .env 파일에 다음 내용이 있는지 확인:")
+            logger.error("   NAVER_CLIENT_ID=your_client_id")
+            logger.error("   NAVER_CLIENT_SECRET=your_client_secret")
+            logger.error("3. .env 파일이 main.py와 같은 폴더에 있는지 확인")
             raise ValueError("네이버 API 키가 설정되지 않았습니다.")
     
     def search_news(self, query: str, display: int = 10, start: int = 1, sort: str = "date") -> Dict:
@@ -53,7 +81,7 @@ class NaverNewsAPI:
             query_string = urllib.parse.urlencode(params)
             full_url = f"{self.search_url}?{query_string}"
             
-            print(f"🔍 네이버 API 호출: {query} (display={display}, start={start})")
+            logger.info(f"🔍 네이버 API 호출: {query} (display={display}, start={start})")
             
             # API 호출
             request = urllib.request.Request(full_url, headers=headers)
@@ -65,7 +93,7 @@ class NaverNewsAPI:
                 response_data = response.read().decode('utf-8')
                 news_data = json.loads(response_data)
                 
-                print(f"✅ API 응답 성공: {news_data.get('total', 0)}개 결과")
+                logger.info(f"✅ API 응답 성공: {news_data.get('total', 0)}개 결과")
                 return news_data
                 
         except urllib.error.HTTPError as e:
@@ -80,10 +108,14 @@ class NaverNewsAPI:
         formatted_items = []
         current_time = datetime.now().isoformat()
         
+        seen_ids = set()
+        
         for item in news_data.get('items', []):
-            # 고유 ID 생성 (Lambda 코드와 동일한 방식)
-            now = datetime.now()
-            news_id = now.strftime('%Y%m%d_%H%M%S_') + str(uuid.uuid4())[:8]
+            # 기사 URL 기반 고유 ID (같은 기사는 몇 번을 수집해도 같은 ID)
+            news_id = article_id(item)
+            if news_id in seen_ids:  # 같은 응답 안에 같은 기사가 두 번 있는 경우
+                continue
+            seen_ids.add(news_id)
             
             # DynamoDB 아이템 구성 (Lambda 코드와 동일)
             db_item = {
@@ -91,6 +123,7 @@ class NaverNewsAPI:
                 'title': self._clean_html_tags(item.get('title', '')),
                 'description': self._clean_html_tags(item.get('description', '')),
                 'keyword': query,
+                'keywords': {query},  # 이 기사를 찾은 수집 키워드 전체 (이미 있는 기사면 저장 시 합쳐짐)
                 'pubDate': item.get('pubDate', ''),
                 'originallink': item.get('originallink', ''),
                 'link': item.get('link', ''),
@@ -0,0 +1,182 @@
+import hashlib
+import os
+import re
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from logging_config import get_logger
+from database import db_manager, FINGERPRINT_PREFIX, STORY_PREFIX
+
+# .env 파일 로드
+load_dotenv()
+
+logger = get_logger(__name__)
+item_logger = get_logger('items')  # 뉴스 1건마다 남는 로그 (샘플링/건수 제한 대상)
+
+# 언론사마다 붙이는 말머리 ([속보], (종합), 【단독】 등)는 지문에서 제외
+TAG_RE = re.compile(r'\[[^\]]*\]|\([^)]*\)|【[^】]*】')
+NON_WORD_RE = re.compile(r'\W+')
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+
+
+def shingles(text: str) -> List[str]:
+    """지문용 문자 3-gram (공백/문장부호를 지워 띄어쓰기·조사 차이에 덜 민감하게)"""
+    compact = NON_WORD_RE.sub('', TAG_RE.sub(' ', text.lower()))
+    return [compact[i:i + SHINGLE_SIZE] for i in range(len(compact) - SHINGLE_SIZE + 1)]
+
+
+def simhash(item: Dict) -> int:
+    """제목 + 설명 기반 64비트 SimHash (비슷한 글일수록 다른 비트 수가 적음)"""
+    weights = Counter(shingles(item.get('title') or ''))
+    weights.update(shingles(item.get('description') or ''))
+
+    vector = [0] * SIMHASH_BITS
+    for token, weight in weights.items():
+        value = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            vector[bit] += weight if value >> bit & 1 else -weight
+    return sum(1 << bit for bit in range(SIMHASH_BITS) if vector[bit] > 0)
+
+
+def shard_id(collected_at: str) -> str:
+    """지문 색인 샤드 id (collected_at의 시 단위)"""
+    return f"{FINGERPRINT_PREFIX}{collected_at[:13]}"
+
+
+class StoryDeduplicator:
+    """수집 단계의 유사 기사 묶기 (같은 통신사 기사를 여러 언론사가 조금씩 다른 제목으로 낸 경우)
+
+    기사마다 제목 + 설명으로 SimHash 지문을 만들고, 보관 기간(DEDUP_WINDOW_HOURS) 안의 대표 기사
+    지문과 비교해서 다른 비트 수가 SIMHASH_MAX_DISTANCE 이하이면 같은 이야기(story)로 묶는다.
+    지문 색인은 수집 시각 1시간 단위 샤드 아이템에 저장되며, 지나간 시간대 샤드는 더 바뀌지
+    않으므로 Pod 메모리에 보관하고 매번 최근 샤드만 다시 읽는다 (BatchGetItem 1회).
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv("DEDUP_ENABLED", "true").lower() == "true"
+        self.max_distance = int(os.getenv("SIMHASH_MAX_DISTANCE", "12"))
+        self.window_hours = int(os.getenv("DEDUP_WINDOW_HOURS", "24"))
+        # true면 중복 기사도 저장 (글로벌 인덱스에 들어가지 않도록 content_type/keyword를 바꿔서)
+        self.store_duplicates = os.getenv("DEDUP_STORE_DUPLICATES", "false").lower() == "true"
+
+        self._sealed_shards: Dict[str, List[Tuple[int, str]]] = {}  # 지나간 시간대 샤드 -> [(지문, story_id)]
+
+        self.representatives = 0
+        self.duplicates = 0
+
+    @staticmethod
+    def _entries(shard: Dict) -> List[Tuple[int, str]]:
+        """샤드 아이템 → [(지문, story_id)]"""
+        return [
+            (int(str(value).partition('|')[0], 16), attribute[len(STORY_PREFIX):])
+            for attribute, value in shard.items() if attribute.startswith(STORY_PREFIX)
+        ]
+
+    async def _load_candidates(self, now: datetime) -> List[Tuple[int, str]]:
+        """보관 기간 안의 대표 기사 지문 (최근 2시간 샤드만 DynamoDB에서 다시 읽음)"""
+        shard_ids = [shard_id((now - timedelta(hours=hours)).isoformat()) for hours in range(self.window_hours + 1)]
+        recent = set(shard_ids[:2])  # 현재/직전 시간대는 다른 수집 실행이 아직 쓰는 중일 수 있음
+
+        for stale in set(self._sealed_shards) - set(shard_ids):  # 보관 기간이 지난 샤드
+            del self._sealed_shards[stale]
+
+        to_load = [sid for sid in shard_ids if sid in recent or sid not in self._sealed_shards]
+        loaded = await db_manager.get_fingerprint_shards(to_load)
+
+        candidates = []
+        for sid in shard_ids:
+            if sid in self._sealed_shards:
+                entries = self._sealed_shards[sid]
+            else:
+                entries = self._entries(loaded.get(sid, {}))
+                if sid not in recent:
+                    self._sealed_shards[sid] = entries
+            candidates.extend(entries)
+        return candidates
+
+    async def assign_stories(self, items: List[Dict]) -> Dict:
+        """기사마다 simhash/story_id 지정 후 대표 기사와 중복 기사로 분리
+
+        대표 기사는 story_id가 자기 id이고, 중복 기사는 가장 가까운 대표 기사의 story_id를 받는다.
+        반환값의 pending은 저장이 끝난 뒤 commit()으로 지문 색인에 반영한다.
+        """
+        result = {'representatives': items, 'duplicates': [], 'pending': {}}
+        if not self.enabled or not items:
+            return result
+
+        start_time = time.time()
+        # 지문 색인 조회 실패는 수집을 막지 않음 (이번 배치 안에서만 중복 확인)
+        try:
+            candidates = await self._load_candidates(datetime.now())
+        except Exception as e:
+            logger.warning(f"⚠️  지문 색인 조회 실패 (이번 배치 안에서만 중복 확인): {e}")
+            candidates = []
+
+        representatives, duplicates = [], []
+        pending: Dict[str, Dict[str, str]] = {}
+        for item in items:
+            fingerprint = simhash(item)
+            item['simhash'] = f"{fingerprint:016x}"
+
+            best: Optional[Tuple[int, str]] = None
+            for candidate, story_id in candidates:
+                if story_id == item['id']:  # 다시 수집한 같은 기사 (저장 시 DB가 거절하고 키워드만 합침)
+                    continue
+                distance = (fingerprint ^ candidate).bit_count()
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, story_id)
+
+            if best is None:
+                item['story_id'] = item['id']
+                representatives.append(item)
+                candidates.append((fingerprint, item['id']))  # 같은 배치의 다음 기사도 이 기사와 비교
+                collected_at = item.get('collected_at', '')
+                pending.setdefault(shard_id(collected_at), {})[STORY_PREFIX + item['id']] = \
+                    f"{item['simhash']}|{collected_at}"
+            else:
+                item['story_id'] = best[1]
+                if self.store_duplicates:
+                    # 글로벌 인덱스(content_type/keyword)에 들어가지 않아 피드에는 대표 기사만 남음
+                    item['content_type'] = 'news_duplicate'
+                    item['duplicate_keyword'] = item.pop('keyword', '')
+                duplicates.append(item)
+                item_logger.info("  🔁 중복 기사: %.50s... (story %s, 거리 %d)", item.get('title', ''), best[1], best[0])
+
+        self.representatives += len(representatives)
+        self.duplicates += len(duplicates)
+        logger.info(f"🧬 유사 기사 묶기: {len(items)}개 → 대표 {len(representatives)}개, 중복 {len(duplicates)}개 "
+                    f"(비교 대상 {len(candidates)}개, {(time.time() - start_time) * 1000:.0f}ms)")
+        return {'representatives': representatives, 'duplicates': duplicates, 'pending': pending}
+
+    async def commit(self, pending: Dict[str, Dict[str, str]], saved_ids: set) -> None:
+        """저장에 성공한 대표 기사의 지문만 색인에 반영 (샤드마다 UpdateItem 1회)"""
+        expires_at = int(time.time() + (self.window_hours + 1) * 3600)
+        for sid, entries in pending.items():
+            saved = {attribute: entry for attribute, entry in entries.items()
+                     if attribute[len(STORY_PREFIX):] in saved_ids}
+            if not saved:
+                continue
+            try:
+                await db_manager.add_fingerprints(sid, saved, expires_at)
+            except Exception as e:
+                logger.warning(f"⚠️  지문 색인 갱신 실패: {sid} - {e}")
+
+    def stats(self) -> Dict:
+        total = self.representatives + self.duplicates
+        return {
+            'enabled': self.enabled,
+            'max_distance': self.max_distance,
+            'window_hours': self.window_hours,
+            'store_duplicates': self.store_duplicates,
+            'cached_shards': len(self._sealed_shards),
+            'representatives': self.representatives,
+            'duplicates': self.duplicates,
+            'duplicate_ratio': round(self.duplicates / total, 4) if total else 0.0
+        }
+
+# 전역 인스턴스
+story_deduplicator = StoryDeduplicator()
@@ -0,0 +1,92 @@
+"""같은 기사를 두 키워드로 수집했을 때 키워드 병합/키워드 피드 별칭 확인 (moto DynamoDB)
+
+    cd backend/data-collection-service
+    pip install -r requirements.txt -r ../requirements-dev.txt
+    python -m pytest tests
+"""
+import pytest
+
+ARTICLES = [
+    {
+        "title": f"<b>반도체</b> 업계 동향 {i}번째 기사 제목 {chr(0xAC00 + i * 97)}{chr(0xB000 + i * 53)}",
+        "description": f"기사 {i} 본문 요약 {chr(0xC000 + i * 71) * 3}",
+        "pubDate": f"Tue, 10 Sep 2024 1{i}:00:00 +0900",
+        "originallink": f"https://news.example.com/articles/{i}?utm_source=naver",
+        "link": f"https://n.news.naver.com/article/{i}",
+    }
+    for i in range(3)
+]
+
+
+@pytest.fixture(autouse=True)
+def naver_articles(monkeypatch):
+    """네이버 검색 API 대신 ARTICLES를 돌려줌"""
+    import main
+    monkeypatch.setattr(main.naver_api, "search_news", lambda query, display=10, start=1, sort="date": {
+        "total": len(ARTICLES), "items": [dict(article) for article in ARTICLES]
+    })
+
+
+def collect(client, query):
+    response = client.post("/api/collect", params={"query": query, "include_images": False})
+    assert response.status_code == 200
+    return response.json()["body"]
+
+
+def test_article_collected_under_two_keywords(collector):
+    from boto3.dynamodb.conditions import Key
+    from database import COUNTERS_KEY, KEYWORD_ALIAS_PREFIX, KEYWORD_ALIAS_TYPE, KEYWORD_PREFIX
+
+    client, table = collector
+    assert collect(client, "반도체")["saved_count"] == len(ARTICLES)
+    assert collect(client, "AI")["saved_count"] == 0  # 이미 저장된 기사 → 키워드만 병합
+
+    articles = table.query(
+        IndexName="content_type-collected_at-index", KeyConditionExpression=Key("content_type").eq("news")
+    )["Items"]
+    assert len(articles) == len(ARTICLES)
+    for article in articles:
+        assert article["keyword"] == "반도체"
+        assert article["keywords"] == {"반도체", "AI"}
+
+    # 두 번째 키워드의 피드 인덱스에는 기사마다 별칭 아이템 (기사와 같은 collected_at)
+    feed = table.query(
+        IndexName="keyword-collected_at-index", KeyConditionExpression=Key("keyword").eq("AI")
+    )["Items"]
+    collected_at = {article["id"]: article["collected_at"] for article in articles}
+    assert {item["article_id"]: item["collected_at"] for item in feed} == collected_at
+    for item in feed:
+        assert item["id"] == f"{KEYWORD_ALIAS_PREFIX}AI#{item['article_id']}"
+        assert item["content_type"] == KEYWORD_ALIAS_TYPE
+
+    # 같은 키워드로 다시 수집해도 별칭/키워드는 늘지 않음
+    assert collect(client, "AI")["saved_count"] == 0
+    assert len(table.query(
+        IndexName="keyword-collected_at-index", KeyConditionExpression=Key("keyword").eq("AI")
+    )["Items"]) == len(ARTICLES)
+
+    # 집계 카운터: 기사 수는 한 번만, 키워드별 건수는 병합된 키워드도 포함
+    counters = table.get_item(Key={"id": COUNTERS_KEY})["Item"]
+    assert counters["total_items"] == len(ARTICLES)
+    assert counters[KEYWORD_PREFIX + "반도체"] == counters[KEYWORD_PREFIX + "AI"] == len(ARTICLES)
+
+
+def test_checked_new_ids_use_batch_write(collector):
+    from database import db_manager, BATCH_WRITE_CHUNK_SIZE
+
+    client, table = collector
+    items = [
+        {"id": f"batch-{i}", "title": f"기사 {i}", "keyword": "반도체", "content_type": "news",
+         "source": "example.com", "pubDate": "Tue, 10 Sep 2024 10:00:00 +0900",
+         "collected_at": "2024-09-10T10:00:00"}
+        for i in range(BATCH_WRITE_CHUNK_SIZE + 5)
+    ]
+    table.put_item(Item={**items[-1], "keyword": "AI"})  # 확인 이후 다른 수집이 먼저 저장한 기사
+
+    # 확인에서 없던 기사는 BatchWriteItem, 확인하지 못한 기사는 조건부 PutItem (기존 기사면 키워드 병합)
+    result = client.portal.call(db_manager.save_news_items, items, {item["id"] for item in items[:-1]})
+    assert result["batches"] == 2
+    assert result["conditional_writes"] == 1
+    assert result["saved_count"] == len(items) - 1
+    assert result["merged_count"] == 1
+    assert table.get_item(Key={"id": items[-1]["id"]})["Item"]["keywords"] == {"반도체"}
@@ -0,0 +1,214 @@
+import hashlib
+import heapq
+import os
+import re
+import sys
+import time
+from array import array
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+from dotenv import load_dotenv
+from logging_config import get_logger
+from database import db_manager, TREND_PREFIX
+from metrics import TREND_BUCKET_UPDATES
+
+# .env 파일 로드
+load_dotenv()
+
+logger = get_logger(__name__)
+
+# 집계 구간 단위 (분) - 1시간 창은 10분 구간, 6/24시간 창은 1시간 구간을 합쳐서 조회
+TREND_LEVELS = {'m': 10, 'h': 60}
+
+# 스케치 키 접두어 (검색어와 수집 키워드를 같은 스케치에 구분해서 집계)
+TERM_KEY = "t:"
+KEYWORD_KEY = "k:"
+
+TOKEN_RE = re.compile(r'[0-9A-Za-z가-힣]+')
+# 제목 끝에 붙는 조사 (긴 것부터 제거, 남는 어근이 2글자 이상일 때만)
+JOSA_SUFFIXES = ('에서', '으로', '에게', '까지', '부터', '은', '는', '이', '가', '을', '를', '의', '에', '로', '와', '과', '도', '만')
+STOPWORDS = frozenset({
+    '속보', '단독', '종합', '포토', '영상', '오늘', '내일', '어제', '올해', '지난해', '이번', '관련',
+    '위해', '대한', '통해', '그리고', '하지만', '있다', '없다', '했다', '한다', '밝혀', '기자', '뉴스'
+})
+
+
+def extract_terms(title: str) -> Set[str]:
+    """제목에서 집계할 검색어 (2글자 이상, 숫자만/불용어 제외, 기사당 1회)"""
+    terms = set()
+    for token in TOKEN_RE.findall(title.lower()):
+        for suffix in JOSA_SUFFIXES:
+            if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+                token = token[:-len(suffix)]
+                break
+        if len(token) >= 2 and not token.isdigit() and token not in STOPWORDS:
+            terms.add(token)
+    return terms
+
+
+def bucket_id(level: str, timestamp: datetime) -> str:
+    """집계 구간 아이템 id (구간 시작 시각, 예: __trend__#m#2024-09-10T14:20)"""
+    minutes = TREND_LEVELS[level]
+    start = timestamp.replace(minute=timestamp.minute - timestamp.minute % minutes, second=0, microsecond=0)
+    return f"{TREND_PREFIX}{level}#{start.strftime('%Y-%m-%dT%H:%M')}"
+
+
+class CountMinSketch:
+    """고정 크기 count-min sketch (depth x width uint32 카운터, 추정값은 실제 이상)
+
+    행마다 blake2b 다이제스트의 4바이트씩을 열 위치로 쓴다. news-api가 같은 방식으로
+    구간 아이템의 스케치를 합쳐서 추정하므로 해시/직렬화 방식을 바꾸면 양쪽을 함께 바꿔야 한다.
+    """
+
+    def __init__(self, width: int, depth: int, counters: Optional[array] = None):
+        self.width = width
+        self.depth = depth
+        self.counters = counters if counters is not None else array('I', bytes(4 * width * depth))
+
+    def _positions(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=4 * self.depth).digest()
+        return [
+            row * self.width + int.from_bytes(digest[4 * row:4 * row + 4], 'little') % self.width
+            for row in range(self.depth)
+        ]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """카운트 추가 후 추정값 반환"""
+        positions = self._positions(key)
+        for position in positions:
+            self.counters[position] += count
+        return min(self.counters[position] for position in positions)
+
+    def to_bytes(self) -> bytes:
+        counters = self.counters
+        if sys.byteorder != 'little':  # 저장 형식은 little-endian 고정
+            counters = array('I', counters)
+            counters.byteswap()
+        return counters.tobytes()
+
+    @classmethod
+    def from_item(cls, item: Dict) -> "CountMinSketch":
+        counters = array('I')
+        counters.frombytes(bytes(item['sketch']))
+        if sys.byteorder != 'little':
+            counters.byteswap()
+        return cls(int(item['width']), int(item['depth']), counters)
+
+
+class TrendRecorder:
+    """저장된 기사로 인기 검색어/키워드 구간 집계 갱신
+
+    구간 아이템 1개 = 고정 크기 count-min sketch + 검색어/키워드별 상위 TREND_TOP_K 후보라서
+    기사 수와 관계없이 크기가 일정하다 (기본 1024 x 4 카운터 = 16KB). 여러 수집 실행이 같은
+    구간을 갱신할 수 있으므로 revision 조건부 PutItem으로 저장하고, 충돌하면 다시 읽어서 합친다.
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv("TRENDING_ENABLED", "true").lower() == "true"
+        self.width = int(os.getenv("TREND_SKETCH_WIDTH", "1024"))
+        self.depth = int(os.getenv("TREND_SKETCH_DEPTH", "4"))
+        self.top_k = int(os.getenv("TREND_TOP_K", "100"))
+        self.retention_hours = int(os.getenv("TREND_RETENTION_HOURS", "25"))
+        self.max_retries = int(os.getenv("TREND_UPDATE_MAX_RETRIES", "3"))
+
+        self.updates = 0
+        self.conflicts = 0
+        self.failures = 0
+
+    def _merge(self, bucket: Optional[Dict], level: str, bucket_key: str, counts: Dict[str, int], articles: int) -> Dict:
+        """기존 구간 아이템 + 이번 배치 집계 → 새 구간 아이템"""
+        if bucket and int(bucket['width']) == self.width and int(bucket['depth']) == self.depth:
+            sketch = CountMinSketch.from_item(bucket)
+            top = {
+                'top_terms': {term: int(count) for term, count in bucket.get('top_terms', {}).items()},
+                'top_keywords': {term: int(count) for term, count in bucket.get('top_keywords', {}).items()}
+            }
+        else:  # 새 구간 (또는 스케치 크기 설정이 바뀐 구간은 새로 시작)
+            bucket = None
+            sketch = CountMinSketch(self.width, self.depth)
+            top = {'top_terms': {}, 'top_keywords': {}}
+
+        for key, count in counts.items():
+            estimate = sketch.add(key, count)
+            candidates = top['top_keywords'] if key.startswith(KEYWORD_KEY) else top['top_terms']
+            candidates[key[2:]] = estimate
+
+        for name, candidates in top.items():  # 상위 top_k개만 후보로 유지
+            if len(candidates) > self.top_k:
+                top[name] = dict(heapq.nlargest(self.top_k, candidates.items(), key=lambda entry: entry[1]))
+
+        revision = int(bucket['revision']) if bucket else 0
+        minutes = TREND_LEVELS[level]
+        return {
+            'id': bucket_key,
+            'level': level,
+            'bucket_minutes': minutes,
+            'width': self.width,
+            'depth': self.depth,
+            'sketch': sketch.to_bytes(),
+            'top_terms': top['top_terms'],
+            'top_keywords': top['top_keywords'],
+            'articles': (int(bucket['articles']) if bucket else 0) + articles,
+            'revision': revision + 1,
+            'updated_at': datetime.now().isoformat(),
+            'expires_at': int(time.time() + self.retention_hours * 3600 + minutes * 60)  # 테이블 TTL
+        }
+
+    async def _update_bucket(self, level: str, bucket_key: str, counts: Dict[str, int], articles: int) -> bool:
+        """구간 아이템 1개 읽고-합치고-조건부 저장 (충돌 시 재시도)"""
+        for _ in range(self.max_retries + 1):
+            bucket = await db_manager.get_trend_bucket(bucket_key)
+            item = self._merge(bucket, level, bucket_key, counts, articles)
+            if await db_manager.put_trend_bucket(item, int(bucket['revision']) if bucket else 0):
+                TREND_BUCKET_UPDATES.labels(level, 'updated').inc()
+                return True
+            self.conflicts += 1
+            TREND_BUCKET_UPDATES.labels(level, 'conflict').inc()
+        return False
+
+    async def record(self, items: Iterable[Dict]) -> None:
+        """기사 목록을 수집 시각의 구간별로 집계해서 반영 (실패해도 수집은 계속)"""
+        if not self.enabled:
+            return
+
+        batches = defaultdict(lambda: {'counts': defaultdict(int), 'articles': 0})
+        for item in items:
+            try:
+                collected_at = datetime.fromisoformat(item.get('collected_at', ''))
+            except ValueError:
+                continue
+            keys = [TERM_KEY + term for term in extract_terms(item.get('title') or '')]
+            if item.get('keyword'):
+                keys.append(KEYWORD_KEY + item['keyword'])
+            for level in TREND_LEVELS:
+                batch = batches[(level, bucket_id(level, collected_at))]
+                batch['articles'] += 1
+                for key in keys:
+                    batch['counts'][key] += 1
+
+        for (level, bucket_key), batch in batches.items():
+            try:
+                if await self._update_bucket(level, bucket_key, batch['counts'], batch['articles']):
+                    self.updates += 1
+                    continue
+                logger.warning(f"⚠️  인기어 집계 충돌로 갱신 포기: {bucket_key}")
+            except Exception as e:
+                logger.warning(f"⚠️  인기어 집계 갱신 실패: {bucket_key} - {e}")
+            self.failures += 1
+            TREND_BUCKET_UPDATES.labels(level, 'failed').inc()
+
+    def stats(self) -> Dict:
+        return {
+            'enabled': self.enabled,
+            'sketch_width': self.width,
+            'sketch_depth': self.depth,
+            'top_k': self.top_k,
+            'bucket_bytes': 4 * self.width * self.depth,
+            'updates': self.updates,
+            'conflicts': self.conflicts,
+            'failures': self.failures
+        }
+
+# 전역 인스턴스
+trend_recorder = TrendRecorder()
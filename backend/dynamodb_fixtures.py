@@ -0,0 +1,29 @@
+"""서비스 테스트 공용 moto DynamoDB 테이블 fixture
+
+각 서비스의 tests/conftest.py가 backend 디렉터리를 sys.path에 넣고 fixture를 import해서 쓴다.
+서비스 모듈이 import 시점에 환경변수를 읽으므로 conftest는 서비스 모듈보다 먼저 TEST_ENV를 설정한다.
+
+    cd backend
+    pip install -r requirements-dev.txt
+"""
+import boto3
+import moto
+import pytest
+
+from table_schema import create_table
+
+TABLE_NAME = "naver_news_articles_test"
+TEST_ENV = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_REGION": "ap-northeast-2",
+    "AWS_DEFAULT_REGION": "ap-northeast-2",
+    "DYNAMODB_TABLE_NAME": TABLE_NAME,
+}
+
+
+@pytest.fixture(scope="session")
+def dynamodb_table():
+    """운영과 같은 구성의 테이블 (세션 동안 moto 안에서 1개)"""
+    with moto.mock_aws():
+        yield create_table(boto3.resource("dynamodb", region_name=TEST_ENV["AWS_REGION"]), TABLE_NAME)
@@ -0,0 +1,142 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from dotenv import load_dotenv
+from data_version import data_version_poller
+from metrics import CACHE_EVENTS
+
+# .env 파일 로드
+load_dotenv()
+
+
+class ResponseCache:
+    """Pod 단위 뉴스 조회 결과 캐시 (TTL + LRU)
+
+    수집기가 저장할 때마다 올리는 데이터 버전(data version)을 주기적으로 확인해서
+    버전이 바뀌면 이전 버전으로 저장된 항목을 모두 무효로 본다. 무효화/만료된 항목도
+    LRU 한도 안에서는 지우지 않고 남겨두며, DynamoDB 조회가 실패하거나 시간 예산을
+    넘기면 get_stale로 꺼내 대체 응답에 쓴다.
+    """
+
+    def __init__(self, version_loader: Callable[[], Awaitable[Optional[int]]], name: str = 'response'):
+        self.name = name  # 메트릭 라벨
+        self.max_entries = int(os.getenv("NEWS_CACHE_MAX_ENTRIES", "512"))
+        self.ttl_seconds = float(os.getenv("NEWS_CACHE_TTL_SECONDS", "60"))
+        self.version_check_interval = float(os.getenv("DATA_VERSION_CHECK_INTERVAL", "5"))
+        self.enabled = self.max_entries > 0 and self.ttl_seconds > 0
+
+        self._version_loader = version_loader
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (만료 시각, 데이터 버전, 값)
+        self._lock = threading.Lock()
+
+        self.data_version: Optional[int] = None
+        self._version_checked_at = 0.0
+
+        # 캐시 크기 산정용 카운터
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.stale_hits = 0
+
+    async def refresh_data_version(self, force: bool = False) -> Optional[int]:
+        """데이터 버전 확인 (version_check_interval 간격으로만 DynamoDB 조회)"""
+        now = time.monotonic()
+        if not force and now - self._version_checked_at < self.version_check_interval:
+            return self.data_version
+
+        self._version_checked_at = now
+        version = await self._version_loader()
+        if version is None:  # 조회 실패 시 기존 캐시 유지 (TTL로 만료)
+            return self.data_version
+
+        with self._lock:
+            if self.data_version is not None and version != self.data_version:
+                # 이전 버전 항목은 get에서 미적중 처리 (get_stale용으로 남겨둠)
+                self.invalidations += 1
+                CACHE_EVENTS.labels(self.name, 'invalidation').inc()
+            self.data_version = version
+        return version
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (호출 전에 refresh_data_version으로 무효화 여부 확인)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                CACHE_EVENTS.labels(self.name, 'miss').inc()
+                return None
+
+            expires_at, version, value = entry
+            if version != self.data_version:
+                self.misses += 1
+                CACHE_EVENTS.labels(self.name, 'miss').inc()
+                return None
+            if expires_at <= time.monotonic():
+                self.expirations += 1
+                CACHE_EVENTS.labels(self.name, 'expiration').inc()
+                self.misses += 1
+                CACHE_EVENTS.labels(self.name, 'miss').inc()
+                return None
+
+            self._entries.move_to_end(key)  # LRU 갱신
+            self.hits += 1
+            CACHE_EVENTS.labels(self.name, 'hit').inc()
+            return value
+
+    def set(self, key: Hashable, value: Any, version: Optional[int]) -> None:
+        """캐시 저장 (version은 값을 읽기 전에 확인한 데이터 버전 - 조회 중에 버전이 바뀌면
+        이전 데이터가 새 버전으로 저장되지 않도록 호출하는 쪽에서 미리 잡아 둔 값을 넘긴다)"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)  # 가장 오래 사용되지 않은 항목 제거
+                self.evictions += 1
+                CACHE_EVENTS.labels(self.name, 'eviction').inc()
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """만료/무효화 여부와 관계없이 남아 있는 값 (DynamoDB 조회 실패 시 대체 응답용)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self.stale_hits += 1
+            CACHE_EVENTS.labels(self.name, 'stale_hit').inc()
+            return entry[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'data_version': self.data_version,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+            'stale_hits': self.stale_hits
+        }
+
+# 전역 인스턴스
+news_cache = ResponseCache(version_loader=data_version_poller.get, name='news')
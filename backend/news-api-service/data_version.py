@@ -0,0 +1,69 @@
+import asyncio
+import contextvars
+import os
+import time
+from typing import Dict, Optional
+from dotenv import load_dotenv
+from database import db_manager
+
+# .env 파일 로드
+load_dotenv()
+
+
+class DataVersionPoller:
+    """수집기가 올리는 데이터 버전(__meta__#data_version) 공유 조회
+
+    응답 캐시, 최신 뉴스 윈도우, 검색 색인, 뉴스 스트림이 모두 데이터 버전으로 갱신 여부를
+    정한다. 각자 GetItem을 보내지 않도록 마지막 조회 후 poll_interval이 지나지 않았으면 그 결과를
+    그대로 돌려주고, 동시에 들어온 조회는 진행 중인 GetItem 1회를 함께 기다린다.
+    """
+
+    def __init__(self):
+        self.poll_interval = float(os.getenv("DATA_VERSION_POLL_INTERVAL", "2"))
+
+        self.version: Optional[int] = None  # 마지막으로 읽은 버전 (조회 실패 시 이전 값 유지)
+        self._result: Optional[int] = None  # 마지막 조회 결과 (실패면 None)
+        self._checked_at = float('-inf')
+        self._inflight: Optional[asyncio.Task] = None
+
+        self.polls = 0    # 실제 GetItem 수
+        self.shared = 0   # 이전 결과/진행 중인 조회를 함께 쓴 수
+
+    async def get(self) -> Optional[int]:
+        """데이터 버전 (조회 실패 시 None)"""
+        if time.monotonic() - self._checked_at < self.poll_interval:
+            self.shared += 1
+            return self._result
+
+        if self._inflight is None:
+            # 요청의 시간 예산(deadline)을 물려받지 않도록 빈 컨텍스트에서 실행
+            self._inflight = asyncio.get_running_loop().create_task(self._poll(), context=contextvars.Context())
+        else:
+            self.shared += 1
+        # 기다리던 쪽이 취소되어도 조회는 계속 진행 (다른 쪽이 결과를 받음)
+        return await asyncio.shield(self._inflight)
+
+    async def _poll(self) -> Optional[int]:
+        try:
+            self.polls += 1
+            result = await db_manager.get_data_version()
+            self._result = result
+            self._checked_at = time.monotonic()
+            if result is not None:
+                self.version = result
+            return result
+        finally:
+            self._inflight = None
+
+    def stats(self) -> Dict:
+        requests = self.polls + self.shared
+        return {
+            'version': self.version,
+            'poll_interval': self.poll_interval,
+            'polls': self.polls,
+            'shared': self.shared,
+            'shared_ratio': round(self.shared / requests, 4) if requests else 0.0
+        }
+
+# 전역 인스턴스
+data_version_poller = DataVersionPoller()
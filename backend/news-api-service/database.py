@@ -1,162 +1,569 @@
 import boto3
 import os
 from boto3.dynamodb.conditions import Key, Attr
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
+from logging_config import get_logger
 import time
+import asyncio
+import random
+
+from executor import dynamodb_executor
 
 # .env 파일 로드
 load_dotenv()
 
+logger = get_logger(__name__)
+query_logger = get_logger('queries')  # 요청마다 남는 조회 로그 (샘플링/건수 제한 대상)
+
+# 수집기가 저장할 때마다 증가시키는 데이터 버전 아이템 (GSI에는 포함되지 않음)
+DATA_VERSION_KEY = "__meta__#data_version"
+
+# BatchGetItem 요청당 최대 키 수 및 UnprocessedKeys 재시도 설정
+BATCH_GET_CHUNK_SIZE = 100
+BATCH_GET_MAX_RETRIES = int(os.getenv("BATCH_GET_MAX_RETRIES", "5"))
+BATCH_GET_BASE_DELAY = 0.05
+
+# 내보내기(/api/news/export) 시 Query 1회에 읽는 아이템 수
+EXPORT_PAGE_SIZE = int(os.getenv("EXPORT_PAGE_SIZE", "500"))
+
+# 글로벌 인덱스 페이지네이션 키 (테이블 키 + 인덱스 키)
+INDEX_KEY_ATTRIBUTES = ('id', 'content_type', 'collected_at')
+KEYWORD_INDEX_KEY_ATTRIBUTES = ('id', 'keyword', 'collected_at')
+
+# 수집기가 저장 시 원자적으로 갱신하는 집계 카운터 아이템
+COUNTERS_KEY = "__meta__#counters"
+KEYWORD_PREFIX = "kw#"
+SOURCE_PREFIX = "src#"
+DAY_PREFIX = "day#"
+
+# 수집기가 저장 시 갱신하는 인기어 집계 구간 아이템 (count-min sketch + top-k 후보)
+TREND_PREFIX = "__trend__#"
+
+# 키워드 피드 별칭 아이템 (이미 저장된 기사를 다른 키워드로 다시 수집했을 때 수집기가 쓰는 그 키워드의 피드 항목)
+KEYWORD_ALIAS_PREFIX = "__kwalias__#"
+KEYWORD_ALIAS_TYPE = "keyword_alias"
+KEYWORD_ALIAS_ATTRIBUTES = ('content_type', 'article_id')  # 키워드 피드 조회 시 별칭을 기사로 바꾸는 데 필요한 속성
+
+
+def keyword_alias_id(keyword: str, article_id: str) -> str:
+    """키워드 피드 별칭 아이템 id (수집기와 같은 형식)"""
+    return f"{KEYWORD_ALIAS_PREFIX}{keyword}#{article_id}"
+
+
+def keyword_alias_article_id(item_id: str) -> str:
+    """별칭 아이템 id → 기사 id (별칭이 아니면 그대로)"""
+    return item_id.rpartition('#')[2] if item_id.startswith(KEYWORD_ALIAS_PREFIX) else item_id
+
+
 class DynamoDBManager:
     def __init__(self):
         self.dynamodb = None
         self.table = None
         self.table_name = os.getenv("DYNAMODB_TABLE_NAME", "naver_news_articles")
         self.gsi_name = "content_type-collected_at-index"  # 글로벌 인덱스 이름
+        self.keyword_gsi_name = "keyword-collected_at-index"  # 키워드별 피드 인덱스 이름
+        self.keyword_index_ready = False  # 키워드 피드 인덱스가 ACTIVE일 때만 사용 (그 전에는 필터 조회)
+        self.executor = dynamodb_executor  # 모든 DynamoDB 호출은 전용 스레드 풀에서 실행
+        self.ready = False  # 클라이언트 생성 및 연결 확인(예열) 완료 여부
+        self.ready_check_timeout = float(os.getenv("READY_CHECK_TIMEOUT", "2"))
+        # DynamoDB 호출이 이 횟수만큼 연속 실패하면 /ready를 준비 안 됨으로 (다시 성공할 때까지)
+        self.ready_max_failures = int(os.getenv("READY_MAX_CONSECUTIVE_FAILURES", "3"))
         
+    async def warm_up(self) -> None:
+        """클라이언트 생성 및 연결 예열 (테이블 전체를 읽는 작업 없음)"""
+        if self.table is None:
+            await self.executor.run('connect', self.connect, timeout=30)
+        await self._ping()
+        self.ready = True
+
+    async def _ping(self) -> None:
+        """GetItem 1회로 DynamoDB 접근 확인 (TLS 연결도 미리 맺어둠)"""
+        await self.executor.run(
+            'get_item',
+            self.table.get_item,
+            Key={'id': DATA_VERSION_KEY},
+            timeout=self.ready_check_timeout
+        )
+
+    async def check_ready(self) -> bool:
+        """준비 상태 (예열 완료 + 최근 DynamoDB 호출이 ready_max_failures번 연속 실패하지 않음)
+
+        평소에는 요청/백그라운드 작업의 호출 결과만 보고 판단하므로 probe마다 DynamoDB를
+        호출하지 않는다. 연속 실패로 준비 해제된 뒤에만 GetItem 1회로 복구 여부를 확인한다.
+        """
+        if not self.ready:
+            return False
+        if self.executor.consecutive_failures < self.ready_max_failures:
+            return True
+        try:
+            await self._ping()  # 성공하면 연속 실패 수가 0으로 돌아감
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️  DynamoDB 준비 상태 확인 실패 (연속 실패 {self.executor.consecutive_failures}회): {e}")
+            return False
+
     def connect(self):
         """DynamoDB 연결"""
         try:
             self.dynamodb = boto3.resource(
                 'dynamodb',
-                region_name=os.getenv("AWS_REGION", "ap-northeast-2")
+                region_name=os.getenv("AWS_REGION", "ap-northeast-2"),
+                # 로컬 DynamoDB(벤치마크/개발용)를 쓸 때만 지정, 없으면 AWS 기본 엔드포인트
+                endpoint_url=os.getenv("DYNAMODB_ENDPOINT_URL") or None,
+                # 연결 풀 크기, 연결/응답 타임아웃, adaptive 재시도 (executor 설정과 함께 관리)
+                config=self.executor.client_config()
             )
             
             self.table = self.dynamodb.Table(self.table_name)
             
             # 테이블 존재 확인
             response = self.table.meta.client.describe_table(TableName=self.table_name)
-            print(f"✅ DynamoDB 연결 성공: {self.table_name}")
-            print(f"📊 테이블 상태: {response['Table']['TableStatus']}")
+            logger.info(f"✅ DynamoDB 연결 성공: {self.table_name}")
+            logger.info(f"📊 테이블 상태: {response['Table']['TableStatus']}")
             
             # 글로벌 인덱스 확인
             gsi_exists = False
             for gsi in response['Table'].get('GlobalSecondaryIndexes', []):
                 if gsi['IndexName'] == self.gsi_name:
                     gsi_exists = True
-                    print(f"🔍 글로벌 인덱스 확인: {self.gsi_name} ({gsi['IndexStatus']})")
+                    logger.info(f"🔍 글로벌 인덱스 확인: {self.gsi_name} ({gsi['IndexStatus']})")
                     break
             
+            # 키워드별 피드 인덱스 확인 (생성 중인 동안에는 기존 필터 조회 사용)
+            keyword_gsi = next(
+                (gsi for gsi in response['Table'].get('GlobalSecondaryIndexes', [])
+                 if gsi['IndexName'] == self.keyword_gsi_name),
+                None
+            )
+            self.keyword_index_ready = keyword_gsi is not None and keyword_gsi['IndexStatus'] == 'ACTIVE'
+            if keyword_gsi:
+                logger.info(f"🗂️  키워드 피드 인덱스 확인: {self.keyword_gsi_name} ({keyword_gsi['IndexStatus']})")
+            else:
+                logger.warning(f"⚠️  키워드 피드 인덱스를 찾을 수 없음: {self.keyword_gsi_name} (키워드 조회는 필터 방식으로 동작)")
+                logger.warning("💡 infra/terraform에서 terraform apply를 실행하면 인덱스가 추가됩니다 (dynamodb.tf keyword_feed_index)")
+            
             if not gsi_exists:
-                print(f"⚠️  글로벌 인덱스를 찾을 수 없음: {self.gsi_name}")
-                print("💡 다음 명령어로 글로벌 인덱스를 생성하세요:")
-                print(f"aws dynamodb update-table --table-name {self.table_name} --attribute-definitions AttributeName=content_type,AttributeType=S AttributeName=collected_at,AttributeType=S --global-secondary-index-updates '[{{\"Create\":{{\"IndexName\":\"{self.gsi_name}\",\"KeySchema\":[{{\"AttributeName\":\"content_type\",\"KeyType\":\"HASH\"}},{{\"AttributeName\":\"collected_at\",\"KeyType\":\"RANGE\"}}],\"Projection\":{{\"ProjectionType\":\"ALL\"}},\"ProvisionedThroughput\":{{\"ReadCapacityUnits\":5,\"WriteCapacityUnits\":5}}}}}}]'")
+                logger.warning(f"⚠️  글로벌 인덱스를 찾을 수 없음: {self.gsi_name}")
+                logger.warning("💡 다음 명령어로 글로벌 인덱스를 생성하세요:")
+                logger.warning(f"aws dynamodb update-table --table-name {self.table_name} --attribute-definitions AttributeName=content_type,AttributeType=S AttributeName=collected_at,AttributeType=S --global-secondary-index-updates '[{{\"Create\":{{\"IndexName\":\"{self.gsi_name}\",\"KeySchema\":[{{\"AttributeName\":\"content_type\",\"KeyType\":\"HASH\"}},{{\"AttributeName\":\"collected_at\",\"KeyType\":\"RANGE\"}}],\"Projection\":{{\"ProjectionType\":\"ALL\"}},\"ProvisionedThroughput\":{{\"ReadCapacityUnits\":5,\"WriteCapacityUnits\":5}}}}}}]'")
             
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
-                print(f"❌ 테이블을 찾을 수 없습니다: {self.table_name}")
-                print("💡 먼저 data-collection-service를 실행하여 테이블을 생성하세요.")
+                logger.error(f"❌ 테이블을 찾을 수 없습니다: {self.table_name}")
+                logger.error("💡 먼저 data-collection-service를 실행하여 테이블을 생성하세요.")
             raise e
         except Exception as e:
-            print(f"❌ DynamoDB 연결 실패: {e}")
+            logger.error(f"❌ DynamoDB 연결 실패: {e}")
             raise e
     
-    def get_news(self, limit: int = 20, offset: int = 0, keyword: Optional[str] = None) -> Dict:
-        """뉴스 목록 조회 (글로벌 인덱스 사용 - collected_at 내림차순)"""
+    async def get_news(self, limit: int = 20, offset: int = 0, keyword: Optional[str] = None,
+                       start_key: Optional[Dict] = None, projection: Optional[Sequence[str]] = None,
+                       since: Optional[str] = None, until: Optional[str] = None) -> Dict:
+        """뉴스 목록 조회 (글로벌 인덱스 사용 - collected_at 내림차순)
+
+        start_key(cursor에서 복원한 ExclusiveStartKey)가 있으면 그 지점부터 이어서 조회하므로
+        몇 번째 페이지든 첫 페이지와 같은 비용으로 조회된다. offset은 구 클라이언트 호환용.
+        projection을 지정하면 해당 속성만 ProjectionExpression으로 읽는다 (cursor용 키 속성은 항상 포함).
+        since/until(collected_at, 양 끝 포함)은 KeyConditionExpression으로 처리하므로 범위 안의 아이템만 읽는다.
+        """
         try:
             start_time = time.time()
             
             # 글로벌 인덱스를 사용한 쿼리
             query_params = {
                 'IndexName': self.gsi_name,
-                'KeyConditionExpression': Key('content_type').eq('news'),
+                'KeyConditionExpression': self._key_condition(Key('content_type').eq('news'), since, until),
                 'ScanIndexForward': False,  # collected_at 내림차순 정렬 (최신순)
                 'Select': 'ALL_ATTRIBUTES'
             }
             
+            # 필요한 속성만 조회 (응답 크기/직렬화 비용 절감)
+            if projection:
+                query_params.pop('Select')
+                query_params.update(self._projection_params(projection, INDEX_KEY_ATTRIBUTES))
+            
             # 키워드 필터링 추가
             if keyword:
                 query_params['FilterExpression'] = (
-                    Attr('keyword').contains(keyword) | 
+                    Attr('keyword').contains(keyword) |
+                    Attr('keywords').contains(keyword) | 
                     Attr('title').contains(keyword) | 
                     Attr('description').contains(keyword)
                 )
+            else:
+                # 필터가 없으면 필요한 만큼만 읽도록 Limit 지정
+                query_params['Limit'] = offset + limit + 1
             
-            # DynamoDB Query 실행 (GSI 사용)
-            items = []
-            last_evaluated_key = None
-            
-            # 페이지네이션을 고려하여 필요한 만큼 데이터 조회
-            target_count = offset + limit
-            
-            while len(items) < target_count:
-                if last_evaluated_key:
-                    query_params['ExclusiveStartKey'] = last_evaluated_key
-                
-                response = self.table.query(**query_params)
-                batch_items = response.get('Items', [])
-                items.extend(batch_items)
-                
-                last_evaluated_key = response.get('LastEvaluatedKey')
-                if not last_evaluated_key:  # 더 이상 조회할 데이터가 없음
-                    break
-            
-            # 수동 pagination 처리
-            total_count = len(items)
-            paginated_items = items[offset:offset + limit]
+            result = await self._query_page(query_params, limit, offset, start_key, INDEX_KEY_ATTRIBUTES)
             
             duration = time.time() - start_time
-            print(f"🔍 뉴스 조회 완료 (GSI 사용): {total_count}개 중 {len(paginated_items)}개 반환 ({duration:.2f}초)")
+            query_logger.info("🔍 뉴스 조회 완료 (GSI 사용): %d개 중 %d개 반환 (%.2f초)",
+                              result['total_count'], result['returned_count'], duration)
             
-            return {
-                'items': paginated_items,
-                'total_count': total_count,
-                'returned_count': len(paginated_items)
-            }
+            return result
             
         except Exception as e:
-            print(f"❌ DynamoDB 조회 에러: {e}")
-            return {'items': [], 'total_count': 0, 'returned_count': 0}
+            # 빈 목록으로 숨기지 않고 호출하는 쪽에서 보관 데이터로 대체하거나 오류로 응답
+            logger.error(f"❌ DynamoDB 조회 에러: {e!r}")
+            raise
 
-    def get_statistics(self) -> Dict:
-        """뉴스 통계 정보 (글로벌 인덱스 사용)"""
+    async def get_keyword_feed(self, keyword: str, limit: int = 20, offset: int = 0,
+                               start_key: Optional[Dict] = None, projection: Optional[Sequence[str]] = None,
+                               since: Optional[str] = None, until: Optional[str] = None) -> Dict:
+        """키워드별 피드 조회 (keyword 파티션 글로벌 인덱스 - collected_at 내림차순)
+
+        수집기가 저장한 keyword 속성으로 파티션된 인덱스를 Query하므로 필터 없이 Limit만큼만 읽는다.
+        다른 키워드로 먼저 저장된 기사는 별칭 아이템으로 들어 있으므로 BatchGetItem으로 기사로 바꾼다.
+        수집 키워드가 아닌 검색어는 결과가 0개이며, 이 경우 호출하는 쪽에서 검색 색인/필터 조회로 대체한다.
+        since/until은 get_news와 같이 정렬 키 조건으로 처리한다.
+        """
         try:
-            # 전체 아이템 수 (GSI 사용)
-            response = self.table.query(
-                IndexName=self.gsi_name,
-                KeyConditionExpression=Key('content_type').eq('news'),
-                Select='COUNT'
-            )
-            total_count = response['Count']
-            
-            # 키워드별 통계를 위한 샘플링 (최대 100개)
-            items_response = self.table.query(
-                IndexName=self.gsi_name,
-                KeyConditionExpression=Key('content_type').eq('news'),
-                ScanIndexForward=False,
-                Limit=100
-            )
-            items = items_response.get('Items', [])
+            start_time = time.time()
+
+            query_params = {
+                'IndexName': self.keyword_gsi_name,
+                'KeyConditionExpression': self._key_condition(Key('keyword').eq(keyword), since, until),
+                'ScanIndexForward': False,  # collected_at 내림차순 정렬 (최신순)
+                'Limit': offset + limit + 1
+            }
+            if projection:
+                query_params.update(self._projection_params(
+                    [*KEYWORD_ALIAS_ATTRIBUTES, *projection], KEYWORD_INDEX_KEY_ATTRIBUTES
+                ))
+
+            # cursor는 별칭을 바꾸기 전 아이템(인덱스 키) 기준으로 계산됨
+            result = await self._query_page(query_params, limit, offset, start_key, KEYWORD_INDEX_KEY_ATTRIBUTES)
+            result['items'] = await self._resolve_aliases(result['items'], projection)
+            result['returned_count'] = len(result['items'])
+
+            duration = time.time() - start_time
+            query_logger.info("🗂️  키워드 피드 조회 완료: '%s' %d개 반환 (%.2f초)", keyword, result['returned_count'], duration)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"❌ 키워드 피드 조회 에러: {e!r}")
+            raise
+
+    async def _query_page(self, query_params: Dict, limit: int, offset: int,
+                          start_key: Optional[Dict], key_attributes: Sequence[str]) -> Dict:
+        """글로벌 인덱스 Query를 페이지 단위로 실행 (offset 건너뛰기, 다음 페이지 키 계산)"""
+        # DynamoDB Query 실행 (GSI 사용)
+        items = []
+        skipped_count = 0
+        last_evaluated_key = start_key
+        has_more = False
+        
+        while True:
+            if last_evaluated_key:
+                query_params['ExclusiveStartKey'] = last_evaluated_key
             
-            keyword_stats = {}
-            source_stats = {}
+            response = await self.executor.run('query', self.table.query, **query_params)
             
+            for item in response.get('Items', []):
+                if skipped_count < offset:  # offset 구간은 보관하지 않고 건너뜀
+                    skipped_count += 1
+                    continue
+                if len(items) == limit:  # 다음 페이지가 존재함
+                    has_more = True
+                    break
+                items.append(item)
+            
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if has_more or not last_evaluated_key:  # 페이지를 채웠거나 더 이상 조회할 데이터가 없음
+                break
+        
+        has_more = has_more or (len(items) == limit and last_evaluated_key is not None)
+        
+        # 다음 페이지 시작 키는 마지막으로 반환한 아이템 기준으로 구성
+        # (DynamoDB 페이지 중간에서 끊긴 경우에도 누락/중복 없이 이어서 조회)
+        next_key = self._index_key(items[-1], key_attributes) if has_more and items else None
+        
+        return {
+            'items': items,
+            'total_count': skipped_count + len(items),
+            'returned_count': len(items),
+            'last_evaluated_key': next_key
+        }
+
+    async def _resolve_aliases(self, items: List[Dict], projection: Optional[Sequence[str]] = None) -> List[Dict]:
+        """키워드 피드의 별칭 아이템 → 원래 기사 (BatchGetItem, 순서 유지, 그 사이 지워진 기사는 제외)"""
+        article_ids = [item['article_id'] for item in items if item.get('content_type') == KEYWORD_ALIAS_TYPE]
+        if not article_ids:
+            return items
+        articles = {article['id']: article for article in (await self.batch_get_news(article_ids, projection))['items']}
+        return [
+            articles.get(item['article_id']) if item.get('content_type') == KEYWORD_ALIAS_TYPE else item
+            for item in items
+            if item.get('content_type') != KEYWORD_ALIAS_TYPE or item['article_id'] in articles
+        ]
+
+    async def get_keyword_aliases(self, since: Optional[str]) -> List[Dict]:
+        """collected_at >= since 인 기사에 붙은 키워드 피드 별칭 (article_id, keyword만 조회)
+
+        윈도우/검색 색인은 collected_at 증분 조회로 갱신되므로 기존 기사에 나중에 추가된
+        수집 키워드는 이 조회로 반영한다 (별칭은 글로벌 인덱스의 별도 파티션에 있음).
+        """
+        query_params = {
+            'IndexName': self.gsi_name,
+            'KeyConditionExpression': self._key_condition(Key('content_type').eq(KEYWORD_ALIAS_TYPE), since),
+            'ProjectionExpression': 'article_id, #keyword',
+            'ExpressionAttributeNames': {'#keyword': 'keyword'}
+        }
+        aliases = []
+        while True:
+            response = await self.executor.run('query', self.table.query, **query_params)
+            aliases.extend(response.get('Items', []))
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                return aliases
+            query_params['ExclusiveStartKey'] = last_evaluated_key
+
+    async def get_news_since(self, since: Optional[str], max_items: int,
+                             projection: Optional[Sequence[str]] = None) -> List[Dict]:
+        """collected_at >= since 인 뉴스를 오래된 순으로 조회 (since가 없으면 최신 max_items개, projection 지정 시 해당 속성만)"""
+        items, _ = await self.get_news_since_page(since, max_items, projection=projection)
+        return items
+
+    async def get_news_since_page(self, since: Optional[str], max_items: int, start_key: Optional[Dict] = None,
+                                  projection: Optional[Sequence[str]] = None) -> Tuple[List[Dict], Optional[Dict]]:
+        """get_news_since를 start_key부터 이어서 조회 → (items, 다음 페이지 LastEvaluatedKey, 마지막이면 None)
+
+        같은 collected_at을 가진 뉴스가 max_items개보다 많아도 since를 올리지 않고 다음 페이지로 넘어갈 수 있다.
+        """
+        if since:
+            key_condition = Key('content_type').eq('news') & Key('collected_at').gte(since)
+        else:
+            key_condition = Key('content_type').eq('news')
+
+        query_params = {
+            'IndexName': self.gsi_name,
+            'KeyConditionExpression': key_condition,
+            'ScanIndexForward': bool(since)  # 증분 조회는 오래된 순, 최초 조회는 최신순
+        }
+        if projection:
+            query_params.update(self._projection_params(projection))
+        if start_key:
+            query_params['ExclusiveStartKey'] = start_key
+
+        items = []
+        last_evaluated_key = None
+        while len(items) < max_items:
+            query_params['Limit'] = max_items - len(items)
+            response = await self.executor.run('query', self.table.query, **query_params)
+            items.extend(response.get('Items', []))
+
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            if not last_evaluated_key:
+                break
+            query_params['ExclusiveStartKey'] = last_evaluated_key
+
+        return items, last_evaluated_key
+
+    async def iter_news_export(self, keyword: Optional[str] = None, since: Optional[str] = None,
+                               until: Optional[str] = None, start_key: Optional[Dict] = None,
+                               projection: Optional[Sequence[str]] = None,
+                               page_size: int = EXPORT_PAGE_SIZE) -> AsyncIterator[Tuple[List[Dict], Optional[Dict]]]:
+        """내보내기용 페이지 단위 조회 (collected_at 오름차순, 한 번에 한 페이지만 메모리에 보관)
+
+        keyword가 있으면 키워드 피드 인덱스(별칭은 기사로 바꿈), 없으면 content_type 글로벌 인덱스를 Query하고
+        since/until(collected_at, 양 끝 포함)은 KeyConditionExpression으로 처리한다.
+        (items, 이어서 조회할 LastEvaluatedKey)를 차례로 돌려주며 마지막 페이지의 키는 None이다.
+        """
+        if keyword and self.keyword_index_ready:
+            index_name, partition = self.keyword_gsi_name, Key('keyword').eq(keyword)
+            key_attributes = KEYWORD_INDEX_KEY_ATTRIBUTES
+        else:
+            index_name, partition = self.gsi_name, Key('content_type').eq('news')
+            key_attributes = INDEX_KEY_ATTRIBUTES
+
+        query_params = {
+            'IndexName': index_name,
+            'KeyConditionExpression': self._key_condition(partition, since, until),
+            'ScanIndexForward': True,  # 오래된 순 (이어받기 지점이 뒤로 밀리지 않도록)
+            'Limit': page_size
+        }
+        if projection:
+            query_params.update(self._projection_params(
+                [*KEYWORD_ALIAS_ATTRIBUTES, *projection] if index_name == self.keyword_gsi_name else projection,
+                key_attributes
+            ))
+        if keyword and not self.keyword_index_ready:
+            # 키워드 피드 인덱스가 없으면 기존 필터 조회와 같은 조건으로 내보냄
+            query_params['FilterExpression'] = (
+                Attr('keyword').contains(keyword) |
+                Attr('keywords').contains(keyword) |
+                Attr('title').contains(keyword) |
+                Attr('description').contains(keyword)
+            )
+
+        last_evaluated_key = start_key
+        while True:
+            if last_evaluated_key:
+                query_params['ExclusiveStartKey'] = last_evaluated_key
+            response = await self.executor.run('query', self.table.query, **query_params)
+            last_evaluated_key = response.get('LastEvaluatedKey')
+            items = response.get('Items', [])
+            if index_name == self.keyword_gsi_name:
+                items = await self._resolve_aliases(items, projection)
+            yield items, last_evaluated_key
+            if not last_evaluated_key:
+                break
+
+    async def get_news_by_id(self, news_id: str, projection: Optional[Sequence[str]] = None) -> Optional[Dict]:
+        """뉴스 1건 조회 (GetItem)"""
+        params = {'Key': {'id': news_id}}
+        if projection:
+            params.update(self._projection_params(projection))
+
+        response = await self.executor.run('get_item', self.table.get_item, **params)
+        item = response.get('Item')
+        if not item or item.get('content_type') != 'news':  # 메타 아이템 등은 제외
+            return None
+        return item
+
+    @staticmethod
+    def _batch_get_chunks(ids: Sequence[str]) -> List[List[Dict]]:
+        """BatchGetItem 요청 단위(100개)로 키 분할"""
+        return [
+            [{'id': item_id} for item_id in ids[i:i + BATCH_GET_CHUNK_SIZE]]
+            for i in range(0, len(ids), BATCH_GET_CHUNK_SIZE)
+        ]
+
+    async def _batch_get_chunk(self, keys: List[Dict], request_template: Dict) -> Tuple[List[Dict], List[Dict]]:
+        """BatchGetItem 1건 (UnprocessedKeys 재시도) → (아이템, 끝까지 처리되지 않은 키)"""
+        items = []
+        retry_delay = BATCH_GET_BASE_DELAY
+        for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+            response = await self.executor.run(
+                'batch_get_item',
+                self.dynamodb.batch_get_item,
+                RequestItems={self.table_name: {'Keys': keys, **request_template}}
+            )
+            items.extend(response.get('Responses', {}).get(self.table_name, []))
+
+            keys = response.get('UnprocessedKeys', {}).get(self.table_name, {}).get('Keys', [])
+            if not keys or attempt == BATCH_GET_MAX_RETRIES:
+                break
+            # 처리량 초과로 남은 키는 지수 백오프(지터 포함) 후 재요청
+            await asyncio.sleep(retry_delay * (1 + random.random()))
+            retry_delay *= 2
+        return items, keys
+
+    async def batch_get_news(self, news_ids: Sequence[str], projection: Optional[Sequence[str]] = None) -> Dict:
+        """뉴스 여러 건 조회 (BatchGetItem 100개 단위 분할, 병렬 실행, UnprocessedKeys 재시도)"""
+        start_time = time.time()
+        unique_ids = list(dict.fromkeys(news_ids))
+        request_template = self._projection_params(projection) if projection else {}
+
+        chunks = self._batch_get_chunks(unique_ids)
+        results = await asyncio.gather(*(self._batch_get_chunk(chunk, request_template) for chunk in chunks))
+
+        found = {}
+        unprocessed = []
+        for items, keys in results:
             for item in items:
-                # 키워드 통계
-                keyword = item.get('keyword', 'Unknown')
-                keyword_stats[keyword] = keyword_stats.get(keyword, 0) + 1
-                
-                # 소스 통계
-                source = item.get('source', 'Unknown')
-                source_stats[source] = source_stats.get(source, 0) + 1
+                if item.get('content_type') == 'news':
+                    found[item['id']] = item
+            unprocessed.extend(key['id'] for key in keys)
+
+        # 요청한 순서대로 반환
+        ordered_items = [found[news_id] for news_id in unique_ids if news_id in found]
+        missing = [news_id for news_id in unique_ids if news_id not in found and news_id not in unprocessed]
+
+        duration = time.time() - start_time
+        query_logger.info("📦 뉴스 일괄 조회 완료: %d개 요청, %d개 반환, %d개 배치 (%.2f초)",
+                          len(unique_ids), len(ordered_items), len(chunks), duration)
+
+        return {
+            'items': ordered_items,
+            'missing_ids': missing,
+            'unprocessed_ids': unprocessed
+        }
+
+    def _key_condition(self, partition, since: Optional[str] = None, until: Optional[str] = None):
+        """파티션 조건에 collected_at 범위(양 끝 포함)를 정렬 키 조건으로 추가 (범위 밖 아이템은 읽지 않음)"""
+        if since and until:
+            return partition & Key('collected_at').between(since, until)
+        if since:
+            return partition & Key('collected_at').gte(since)
+        if until:
+            return partition & Key('collected_at').lte(until)
+        return partition
+
+    def _projection_params(self, projection: Sequence[str],
+                           key_attributes: Sequence[str] = INDEX_KEY_ATTRIBUTES) -> Dict:
+        """ProjectionExpression 구성 (예약어 충돌을 피하기 위해 속성 이름은 치환)"""
+        attributes = list(dict.fromkeys([*key_attributes, *projection]))
+        names = {f'#p{i}': attribute for i, attribute in enumerate(attributes)}
+        return {
+            'ProjectionExpression': ', '.join(names),
+            'ExpressionAttributeNames': names
+        }
+
+    def _index_key(self, item: Dict, key_attributes: Sequence[str] = INDEX_KEY_ATTRIBUTES) -> Dict:
+        """글로벌 인덱스 ExclusiveStartKey 구성 (테이블 키 + 인덱스 키)"""
+        return {attribute: item[attribute] for attribute in key_attributes}
+
+    async def get_data_version(self) -> Optional[int]:
+        """수집기가 기록한 데이터 버전 조회 (조회 실패 시 None)"""
+        try:
+            response = await self.executor.run('get_item', self.table.get_item, Key={'id': DATA_VERSION_KEY})
+            return int(response.get('Item', {}).get('version', 0))
+        except Exception as e:
+            logger.warning(f"⚠️  데이터 버전 조회 실패: {e}")
+            return None
+
+    async def get_trend_buckets(self, bucket_ids: Sequence[str]) -> List[Dict]:
+        """수집기가 관리하는 인기어 집계 구간 아이템 조회 (없는 구간은 제외)"""
+        chunks = self._batch_get_chunks(list(dict.fromkeys(bucket_ids)))
+        results = await asyncio.gather(*(self._batch_get_chunk(chunk, {}) for chunk in chunks))
+        buckets = []
+        for items, keys in results:
+            if keys:
+                raise RuntimeError(f"인기어 집계 구간 {len(keys)}개를 읽지 못했습니다")
+            buckets.extend(items)
+        return buckets
+
+    async def get_statistics(self) -> Dict:
+        """뉴스 통계 정보 (수집기가 관리하는 집계 카운터 아이템 GetItem 1회)
+
+        keyword_distribution은 기사를 찾은 수집 키워드마다 1씩 세므로 합이 total_items보다 클 수 있다.
+        """
+        try:
+            response = await self.executor.run('get_item', self.table.get_item, Key={'id': COUNTERS_KEY})
+            item = response.get('Item', {})
+            
+            def distribution(prefix: str) -> Dict[str, int]:
+                return {
+                    key[len(prefix):]: int(value)
+                    for key, value in item.items() if key.startswith(prefix)
+                }
             
+            total_items = int(item.get('total_items', 0))
             return {
-                'total_items': total_count,
-                'keyword_distribution': dict(sorted(keyword_stats.items(), key=lambda x: x[1], reverse=True)),
-                'source_distribution': source_stats,
-                'sample_size': len(items),
-                'index_used': self.gsi_name
+                'total_items': total_items,
+                'keyword_distribution': dict(sorted(distribution(KEYWORD_PREFIX).items(), key=lambda x: x[1], reverse=True)),
+                'source_distribution': distribution(SOURCE_PREFIX),
+                # 이전 응답 필드 유지: 집계 카운터는 표본이 아니라 전체 기사 기준, 읽은 곳은 카운터 아이템
+                'sample_size': total_items,
+                'index_used': COUNTERS_KEY,
+                'daily_distribution': dict(sorted(distribution(DAY_PREFIX).items())),
+                'updated_at': item.get('updated_at')
             }
             
         except Exception as e:
-            print(f"❌ 통계 조회 실패: {e}")
+            logger.error(f"❌ 통계 조회 실패: {e}")
             return {
                 'total_items': 0, 
                 'keyword_distribution': {}, 
                 'source_distribution': {},
-                'index_used': self.gsi_name
+                'sample_size': 0,
+                'index_used': COUNTERS_KEY,
+                'daily_distribution': {},
+                'updated_at': None
             }
 
 # 전역 인스턴스
@@ -0,0 +1,53 @@
+import asyncio
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 요청 1건에 쓸 수 있는 전체 시간 (DynamoDB 호출 여러 번 + 재시도 포함)
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "3"))
+
+# 클라이언트/게이트웨이가 남은 시간을 넘겨줄 때 쓰는 헤더 (기본 예산보다 짧게만 조정 가능)
+DEADLINE_HEADER = "x-request-timeout-ms"
+
+_deadline: ContextVar[Optional[float]] = ContextVar('request_deadline', default=None)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """요청의 시간 예산을 다 써서 더 이상 DynamoDB를 호출하지 않음"""
+    pass
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[None]:
+    """지금부터 seconds 안에 끝나야 하는 구간 (이미 더 짧은 예산이 있으면 그대로 유지)"""
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires_at if current is None else min(current, expires_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """남은 예산 (초, 예산이 없는 구간이면 None)"""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def request_budget(header_value: Optional[str]) -> float:
+    """요청 예산 (헤더로 받은 남은 시간이 더 짧으면 그 값)"""
+    if header_value:
+        try:
+            return max(0.0, min(REQUEST_DEADLINE_SECONDS, int(header_value) / 1000))
+        except ValueError:
+            pass
+    return REQUEST_DEADLINE_SECONDS
@@ -0,0 +1,167 @@
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from dotenv import load_dotenv
+from logging_config import get_logger
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from deadline import DeadlineExceeded, remaining
+from metrics import (
+    CAPACITY_OPERATIONS, DYNAMODB_CALL_DURATION, DYNAMODB_CALL_ERRORS, DYNAMODB_HEDGED_REQUESTS,
+    record_consumed_capacity
+)
+
+# .env 파일 로드
+load_dotenv()
+
+logger = get_logger(__name__)
+
+# 같은 요청을 한 번 더 보내도 결과가 같은 읽기 호출 (hedged read 대상)
+HEDGE_OPERATIONS = frozenset({'get_item', 'query', 'batch_get_item'})
+
+
+class DynamoDBExecutor:
+    """boto3 동기 호출을 전용 스레드 풀에서 실행하는 비동기 래퍼
+
+    async 핸들러에서 boto3를 직접 호출하면 이벤트 루프가 막히므로 모든 DynamoDB 호출은
+    이 풀을 거친다. 풀 크기로 동시 호출 수를 제한하고 호출마다 타임아웃을 적용한다.
+
+    요청에 시간 예산(deadline)이 있으면 타임아웃은 남은 예산을 넘지 않고, 예산을 다 쓰면
+    DeadlineExceeded를 낸다. DYNAMODB_HEDGE_DELAY_MS를 지정하면 읽기 호출이 그 시간 안에
+    끝나지 않을 때 같은 호출을 한 번 더 보내 먼저 끝난 결과를 쓴다 (꼬리 지연 완화).
+    """
+
+    def __init__(self):
+        self.max_workers = int(os.getenv("DYNAMODB_MAX_WORKERS", "16"))
+        self.call_timeout = float(os.getenv("DYNAMODB_CALL_TIMEOUT", "5"))
+
+        # botocore 타임아웃/재시도는 호출 타임아웃 안에 모든 시도가 끝나도록 맞춤:
+        # (연결 + 응답) x 시도 횟수 < 호출 타임아웃. 호출 타임아웃이 지난 뒤에도 스레드가 재시도를
+        # 이어가며 풀을 붙잡지 않도록, 지정값이 시도당 몫보다 크면 줄인다 (10%는 재시도 대기 몫)
+        self.max_attempts = max(1, int(os.getenv("DYNAMODB_MAX_ATTEMPTS", "3")))
+        attempt_budget = self.call_timeout * 0.9 / self.max_attempts
+        self.connect_timeout = min(float(os.getenv("DYNAMODB_CONNECT_TIMEOUT", "1")), attempt_budget / 3)
+        self.read_timeout = min(float(os.getenv("DYNAMODB_READ_TIMEOUT", "2")), attempt_budget - self.connect_timeout)
+
+        # hedged read (0이면 사용하지 않음), 동시에 나가는 중복 호출은 풀의 1/4까지만
+        self.hedge_delay = float(os.getenv("DYNAMODB_HEDGE_DELAY_MS", "0")) / 1000
+        self.max_hedges_in_flight = max(1, self.max_workers // 4)
+        self._hedges_in_flight = 0
+
+        # 연속 실패 수 (/ready 판단용, DynamoDB 응답을 받으면 0으로 되돌림)
+        self.consecutive_failures = 0
+        self.last_success_at: Optional[float] = None
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="dynamodb"
+        )
+
+    def client_config(self) -> Config:
+        """boto3 클라이언트 설정 (연결 풀, 연결/응답 타임아웃, adaptive 재시도)"""
+        return Config(
+            # 스레드 풀 크기만큼 HTTP 연결을 재사용할 수 있도록 설정
+            max_pool_connections=self.max_workers,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+            # 스로틀링이 나면 클라이언트 쪽에서 호출 속도를 줄이는 재시도 방식
+            retries={'mode': 'adaptive', 'max_attempts': self.max_attempts}
+        )
+
+    async def run(self, operation: str, func: Callable, *args,
+                  timeout: Optional[float] = None, hedge: Optional[bool] = None, **kwargs) -> Any:
+        """func(*args, **kwargs)를 풀에서 실행 (timeout 초과 시 asyncio.TimeoutError)
+
+        operation은 메트릭 라벨로 쓰이며, 데이터 조회/저장 호출은 ConsumedCapacity도 함께 기록한다.
+        요청 예산이 timeout보다 적게 남았으면 남은 예산까지만 기다리고 DeadlineExceeded를 낸다.
+        hedge를 지정하지 않으면 HEDGE_OPERATIONS에 해당하는 읽기 호출만 hedged read로 실행한다.
+        """
+        if operation in CAPACITY_OPERATIONS:
+            kwargs.setdefault('ReturnConsumedCapacity', 'TOTAL')
+
+        timeout = timeout or self.call_timeout
+        budget = remaining()
+        limited_by_deadline = budget is not None and budget < timeout
+        if limited_by_deadline:
+            if budget <= 0:
+                DYNAMODB_CALL_ERRORS.labels(operation, 'DeadlineExceeded').inc()
+                raise DeadlineExceeded(f"DynamoDB {operation} 호출 전 요청 시간 예산 소진")
+            timeout = budget
+
+        call = functools.partial(func, *args, **kwargs)
+        if hedge is None:
+            hedge = operation in HEDGE_OPERATIONS
+        start_time = time.perf_counter()
+        try:
+            if hedge and self.hedge_delay > 0:
+                response = await asyncio.wait_for(self._hedged(operation, call), timeout)
+            else:
+                future = asyncio.get_running_loop().run_in_executor(self._executor, call)
+                response = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            if limited_by_deadline:
+                DYNAMODB_CALL_ERRORS.labels(operation, 'DeadlineExceeded').inc()
+                logger.warning(f"⏱️  DynamoDB {operation} 요청 시간 예산 소진 ({timeout:.3f}초)")
+                raise DeadlineExceeded(f"DynamoDB {operation} 호출 중 요청 시간 예산 소진")
+            DYNAMODB_CALL_ERRORS.labels(operation, 'Timeout').inc()
+            self._record_result(ok=False)
+            logger.warning(f"⏱️  DynamoDB {operation} 타임아웃 ({timeout}초)")
+            raise
+        except ClientError as e:
+            DYNAMODB_CALL_ERRORS.labels(operation, e.response.get('Error', {}).get('Code', 'ClientError')).inc()
+            # 조건부 쓰기 거절/스로틀링 등 4xx는 DynamoDB가 응답한 것이므로 성공으로 침
+            self._record_result(ok=e.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 500) < 500)
+            raise
+        except Exception as e:
+            DYNAMODB_CALL_ERRORS.labels(operation, type(e).__name__).inc()
+            self._record_result(ok=False)
+            raise
+        finally:
+            DYNAMODB_CALL_DURATION.labels(operation).observe(time.perf_counter() - start_time)
+
+        self._record_result(ok=True)
+        record_consumed_capacity(operation, response)
+        return response
+
+    async def _hedged(self, operation: str, call: Callable) -> Any:
+        """hedge_delay 안에 끝나지 않으면 같은 호출을 한 번 더 보내고 먼저 끝난 결과 사용"""
+        loop = asyncio.get_running_loop()
+        primary = loop.run_in_executor(self._executor, call)
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay)
+        if done or self._hedges_in_flight >= self.max_hedges_in_flight:
+            return await primary
+
+        self._hedges_in_flight += 1
+        DYNAMODB_HEDGED_REQUESTS.labels(operation, 'sent').inc()
+        secondary = loop.run_in_executor(self._executor, call)
+        try:
+            done, pending = await asyncio.wait({primary, secondary}, return_when=asyncio.FIRST_COMPLETED)
+            winner = next((future for future in done if future.exception() is None), None)
+            if winner is None and pending:  # 먼저 끝난 쪽이 실패하면 나머지 결과를 기다림
+                done, _ = await asyncio.wait(pending)
+            winner = winner or done.pop()
+            DYNAMODB_HEDGED_REQUESTS.labels(operation, 'hedge_won' if winner is secondary else 'primary_won').inc()
+            return winner.result()
+        finally:
+            self._hedges_in_flight -= 1
+            for future in (primary, secondary):
+                # 늦게 끝난 쪽의 예외는 버림 ("exception never retrieved" 경고 방지)
+                future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    def _record_result(self, ok: bool) -> None:
+        """호출 결과 기록 (요청 시간 예산 소진은 DynamoDB 상태와 무관하므로 기록하지 않음)"""
+        if ok:
+            self.consecutive_failures = 0
+            self.last_success_at = time.time()
+        else:
+            self.consecutive_failures += 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+# 전역 인스턴스
+dynamodb_executor = DynamoDBExecutor()
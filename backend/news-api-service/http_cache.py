@@ -0,0 +1,63 @@
+import hashlib
+import os
+from typing import Dict, Optional
+from fastapi import Request, Response
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+
+class HTTPCachePolicy:
+    """읽기 엔드포인트용 ETag / Cache-Control 처리
+
+    ETag는 수집기의 데이터 버전과 요청 조건으로 만들기 때문에 DynamoDB를 조회하기 전에
+    If-None-Match를 비교해서 304를 돌려줄 수 있다.
+    """
+
+    def __init__(self):
+        # 엔드포인트별 Cache-Control (수집 주기 10분 기준, CDN/브라우저가 짧게 캐시 후 재검증)
+        self.policies = {
+            'news': os.getenv("CACHE_CONTROL_NEWS", "public, max-age=30, stale-while-revalidate=300"),
+            'statistics': os.getenv("CACHE_CONTROL_STATISTICS", "public, max-age=60, stale-while-revalidate=600"),
+            'trending': os.getenv("CACHE_CONTROL_TRENDING", "public, max-age=60, stale-while-revalidate=300"),
+        }
+
+    @staticmethod
+    def etag(*parts) -> str:
+        """요청 조건/데이터 버전으로 강한 ETag 생성"""
+        digest = hashlib.sha256('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+        return f'"{digest[:32]}"'
+
+    @staticmethod
+    def matches(request: Request, etag: Optional[str]) -> bool:
+        """If-None-Match가 현재 ETag와 일치하는지 (weak 비교)"""
+        if not etag:
+            return False
+        header = request.headers.get('if-none-match')
+        if not header:
+            return False
+        if header.strip() == '*':
+            return True
+        candidates = [candidate.strip() for candidate in header.split(',')]
+        return any(candidate.removeprefix('W/') == etag for candidate in candidates)
+
+    def headers(self, endpoint: str, etag: Optional[str]) -> Dict[str, str]:
+        headers = {'Cache-Control': self.policies.get(endpoint, 'no-cache')}
+        if etag:
+            headers['ETag'] = etag
+        return headers
+
+    def apply(self, response: Response, endpoint: str, etag: Optional[str]) -> None:
+        response.headers.update(self.headers(endpoint, etag))
+
+    @staticmethod
+    def fallback_headers(source: str) -> Dict[str, str]:
+        """보관 데이터로 대신 응답할 때 (ETag 없이, 다시 요청하면 DynamoDB에서 조회하도록)"""
+        return {'Cache-Control': 'no-store', 'X-Data-Fallback': source}
+
+    def not_modified(self, endpoint: str, etag: str) -> Response:
+        return Response(status_code=304, headers=self.headers(endpoint, etag))
+
+# 전역 인스턴스
+http_cache = HTTPCachePolicy()
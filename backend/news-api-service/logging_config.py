@@ -0,0 +1,171 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+import pytz
+from dotenv import load_dotenv
+
+from metrics import LOG_RECORDS_DROPPED
+
+# .env 파일 로드
+load_dotenv()
+
+KST = pytz.timezone('Asia/Seoul')
+
+SERVICE_NAME = "news-api-service"
+ROOT_LOGGER_NAME = "news_api"
+
+# 요청/아이템마다 남는 대량 로그 전용 로거 (기본으로 샘플링 + 초당 건수 제한)
+QUERY_LOGGER_NAME = f"{ROOT_LOGGER_NAME}.queries"
+
+
+def _parse_limits(value: str) -> Dict[str, float]:
+    """'logger=값,logger=값' 형식의 설정 해석"""
+    limits = {}
+    for entry in value.split(','):
+        name, _, number = entry.partition('=')
+        if name.strip() and number.strip():
+            limits[name.strip()] = float(number)
+    return limits
+
+
+# JSON 포맷터 클래스 (전용 writer 스레드에서 실행)
+class JSONFormatter(logging.Formatter):
+    def format(self, record):
+        log_entry = {
+            "timestamp": datetime.fromtimestamp(record.created, KST).isoformat(),
+            "level": record.levelname,
+            "service": SERVICE_NAME,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno
+        }
+
+        # extra 필드 추가
+        if hasattr(record, 'extra_data'):
+            log_entry.update(record.extra_data)
+        if record.exc_text:
+            log_entry["exception"] = record.exc_text
+
+        return json.dumps(log_entry, ensure_ascii=False, default=str)  # 한글 깨짐 방지
+
+
+class SamplingFilter(logging.Filter):
+    """로거별 샘플링 비율 + 초당 건수 제한 (WARNING 이상은 항상 통과)
+
+    설정은 로거 이름 접두사 기준이며 가장 긴 접두사가 적용된다.
+    예) LOG_SAMPLE_RATES="news_api.queries=0.1", LOG_RATE_LIMITS="news_api.queries=20"
+    """
+
+    def __init__(self, sample_rates: Dict[str, float], rate_limits: Dict[str, float]):
+        super().__init__()
+        self.sample_rates = sample_rates
+        self.rate_limits = rate_limits
+        self._buckets: Dict[str, list] = {}  # 로거 접두사 -> [남은 토큰, 마지막 충전 시각]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _lookup(settings: Dict[str, float], name: str) -> Optional[str]:
+        best = None
+        for prefix in settings:
+            if (name == prefix or name.startswith(prefix + '.')) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return best
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        prefix = self._lookup(self.sample_rates, record.name)
+        if prefix is not None and random.random() >= self.sample_rates[prefix]:
+            LOG_RECORDS_DROPPED.labels('sampled').inc()
+            return False
+
+        prefix = self._lookup(self.rate_limits, record.name)
+        if prefix is not None:
+            rate = self.rate_limits[prefix]
+            now = time.monotonic()
+            with self._lock:
+                bucket = self._buckets.setdefault(prefix, [rate, now])
+                bucket[0] = min(rate, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+                if bucket[0] < 1:
+                    LOG_RECORDS_DROPPED.labels('rate_limited').inc()
+                    return False
+                bucket[0] -= 1
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """요청 경로에서는 메시지 조립만 하고 큐에 넣음 (JSON 직렬화/stdout 쓰기는 writer 스레드)
+
+    큐가 가득 차면 기다리지 않고 버린다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.labels('queue_full').inc()
+
+
+class LogPipeline:
+    """큐 기반 비동기 로그 출력 (QueueHandler → 전용 writer 스레드 → stdout)"""
+
+    def __init__(self):
+        self.level = os.getenv("LOG_LEVEL", "INFO").upper()
+        self.queue_size = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+        self.sample_rates = _parse_limits(os.getenv("LOG_SAMPLE_RATES", f"{QUERY_LOGGER_NAME}=0.1"))
+        self.rate_limits = _parse_limits(os.getenv("LOG_RATE_LIMITS", f"{QUERY_LOGGER_NAME}=20"))
+
+        self.queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        writer = logging.StreamHandler(sys.stdout)
+        writer.setFormatter(JSONFormatter())
+        self.listener = logging.handlers.QueueListener(self.queue, writer, respect_handler_level=True)
+
+        self.handler = NonBlockingQueueHandler(self.queue)
+        self.handler.addFilter(SamplingFilter(self.sample_rates, self.rate_limits))
+
+        # 서비스 로거 설정 (하위 로거는 전파로 같은 핸들러 사용)
+        root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+        root_logger.setLevel(self.level)
+        for handler in root_logger.handlers[:]:  # 기존 핸들러 제거
+            root_logger.removeHandler(handler)
+        root_logger.addHandler(self.handler)
+        root_logger.propagate = False
+
+        self.listener.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """남은 로그를 모두 출력하고 writer 스레드 종료"""
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    """서비스 로거 (모듈 이름을 주면 news_api.<모듈> 하위 로거)"""
+    if not name or name == '__main__':
+        return logging.getLogger(ROOT_LOGGER_NAME)
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+# 전역 인스턴스
+log_pipeline = LogPipeline()
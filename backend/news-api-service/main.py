@@ -1,26 +1,46 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
 import os
 import time
 import random
+import asyncio
+import pytz
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple, Union
 from dotenv import load_dotenv
-import logging
-import json
 from datetime import datetime
-import sys
-import pytz
 
 # .env 파일 로드
 load_dotenv()
 
-# 한국 시간대 설정
-KST = pytz.timezone('Asia/Seoul')
+# 수집기가 collected_at을 기록하는 시간대 (Pod 기본값 UTC, since/until의 시간대 변환 기준)
+COLLECTED_AT_TIMEZONE = pytz.timezone(os.getenv("COLLECTED_AT_TIMEZONE", "UTC"))
+
+# time-to-ready 측정 기준 (프로세스 시작 시각)
+PROCESS_STARTED_AT = time.time()
+startup_state = {'ready_at': None}
 
-from models import NewsItem, APIResponse, APIResponseBody, QueryParams, HealthResponse
+from models import (
+    NewsItem, NewsItemSummary, APIResponse, APIResponseBody, QueryParams, HealthResponse,
+    NewsBatchRequest, NewsBatchResponseBody
+)
 from database import db_manager
+from deadline import DEADLINE_HEADER, DeadlineExceeded, deadline_scope, request_budget
+from executor import dynamodb_executor
+from logging_config import get_logger, log_pipeline
+from pagination import cursor_codec, InvalidCursorError, MAX_OFFSET
+from cache import news_cache
+from data_version import data_version_poller
+from search_index import search_index
+from serialization import dumps, gzip_stream, json_fragments, news_item_dict, news_item_dicts, parse_fields
+from http_cache import http_cache
+from singleflight import news_flight
+from news_stream import news_broadcaster
+from news_window import news_window
+from trending import trend_reader, window_bucket_ids
+from metrics import NEWS_FALLBACKS, setup_metrics
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -38,57 +58,93 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# JSON 포맷터 클래스
-class JSONFormatter(logging.Formatter):
-    def format(self, record):
-        log_entry = {
-            "timestamp": datetime.now(KST).isoformat(),
-            "level": record.levelname,
-            "service": "news-api-service",
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno
-        }
-        
-        # extra 필드 추가
-        if hasattr(record, 'extra_data'):
-            log_entry.update(record.extra_data)
-            
-        return json.dumps(log_entry, ensure_ascii=False) # 한글 깨짐 방지
-
-# 로거 설정
-def setup_logging():
-    logger = logging.getLogger("news_api")
-    logger.setLevel(logging.INFO)
-    
-    # 기존 핸들러 제거
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-    
-    # 새로운 핸들러 추가
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JSONFormatter())
-    logger.addHandler(handler)
-    
-    return logger
+# Prometheus 메트릭 (/metrics, 라우트별 지연 히스토그램/처리 중 요청 수)
+setup_metrics(app)
+
+# 요청별 시간 예산에서 제외 (연결이 유지되는 동안 계속 조회하는 스트리밍 응답)
+DEADLINE_EXEMPT_PATHS = ('/api/news/export', '/api/news/stream')
+
+@app.middleware("http")
+async def request_deadline(request: Request, call_next):
+    """요청마다 시간 예산 설정 (DynamoDB 호출 타임아웃이 남은 예산을 넘지 않도록)"""
+    if request.url.path.startswith(DEADLINE_EXEMPT_PATHS):
+        return await call_next(request)
+    with deadline_scope(request_budget(request.headers.get(DEADLINE_HEADER))):
+        return await call_next(request)
 
-# 로거 인스턴스 생성
-logger = setup_logging()
+# 로거 인스턴스 생성 (큐 기반 비동기 출력, logging_config 참고)
+logger = get_logger()
+query_logger = get_logger('queries')  # 요청마다 남는 조회 로그 (샘플링/건수 제한 대상)
 
 
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작시 DynamoDB 연결"""
-    try:
-        logger.info("🚀 뉴스 API 서비스 시작 중...")
-        db_manager.connect()
-        stats = db_manager.get_statistics()
-        logger.info(f"📊 현재 저장된 뉴스: {stats['total_items']}개")
-        logger.info("✅ API 서비스 준비 완료!")
-    except Exception as e:
-        logger.error(f"❌ 시작 시 오류: {e}")
-        logger.warning("⚠️  서비스가 정상적으로 시작되지 않았을 수 있습니다.")
+    """앱 시작 (DynamoDB 연결은 백그라운드에서 예열, /ready로 준비 상태 노출)"""
+    logger.info("🚀 뉴스 API 서비스 시작 중...")
+    asyncio.create_task(warm_up())
+    asyncio.create_task(search_index_sync_loop())
+    asyncio.create_task(news_stream_loop())
+    if news_window.enabled:
+        asyncio.create_task(news_window_loop())
+
+async def warm_up():
+    """DynamoDB 클라이언트 예열 (성공할 때까지 재시도)"""
+    retry_delay = 1
+    while True:
+        try:
+            await db_manager.warm_up()
+            startup_state['ready_at'] = time.time()
+            time_to_ready = startup_state['ready_at'] - PROCESS_STARTED_AT
+            logger.info("✅ API 서비스 준비 완료!", extra={
+                'extra_data': {'time_to_ready_seconds': round(time_to_ready, 3)}
+            })
+            return
+        except Exception as e:
+            logger.error(f"❌ DynamoDB 예열 실패: {e} ({retry_delay}초 후 재시도)")
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 30)
+
+async def search_index_sync_loop():
+    """검색 색인 백그라운드 동기화 (수집기 저장분을 증분 반영)"""
+    while True:
+        if not db_manager.ready:  # 예열 전에는 대기
+            await asyncio.sleep(1)
+            continue
+        try:
+            await search_index.sync()
+        except Exception as e:
+            logger.error(f"❌ 검색 색인 동기화 실패: {e}")
+        await asyncio.sleep(search_index.sync_interval)
+
+async def news_window_loop():
+    """최신 뉴스 윈도우 백그라운드 갱신 (watermark 이후 증분 반영)"""
+    while True:
+        if not db_manager.ready:  # 예열 전에는 대기
+            await asyncio.sleep(1)
+            continue
+        try:
+            await news_window.refresh()
+        except Exception as e:
+            logger.error(f"❌ 최신 뉴스 윈도우 갱신 실패: {e}")
+        await asyncio.sleep(news_window.refresh_interval)
+
+async def news_stream_loop():
+    """새 뉴스 스트림 업스트림 폴링 (Pod당 1개, 구독자들에게 나눠 전달)"""
+    while not db_manager.ready:  # 예열 전에는 대기
+        await asyncio.sleep(1)
+    while True:
+        try:
+            await news_broadcaster.start()
+            break
+        except Exception as e:
+            logger.error(f"❌ 뉴스 스트림 시작 실패: {e}")
+            await asyncio.sleep(news_broadcaster.poll_interval)
+    while True:
+        await asyncio.sleep(news_broadcaster.poll_interval)
+        try:
+            await news_broadcaster.poll()
+        except Exception as e:
+            logger.error(f"❌ 뉴스 스트림 폴링 실패: {e}")
 
 @app.get("/")
 async def root():
@@ -98,8 +154,18 @@ async def root():
         "description": "뉴스 조회 및 검색 API",
         "endpoints": [
             "GET / - 서비스 정보 및 상태 조회",
-            "GET /health - 헬스체크",
-            "GET /api/news - 뉴스 목록 조회 (키워드, 페이지네이션 지원)",
+            "GET /health - 헬스체크 (liveness, 외부 의존성 확인 없음)",
+            "GET /ready - 준비 상태 확인 (readiness, 예열 완료 + 최근 DynamoDB 호출 상태)",
+            "GET /api/news - 뉴스 목록 조회 (키워드, cursor 페이지네이션, fields 필드 선택 지원)",
+            "GET /api/v2/news - 뉴스 목록 조회 (경량 응답, 빠른 직렬화)",
+            "GET /api/news/export - 뉴스 일괄 내보내기 (NDJSON 스트리밍, gzip/이어받기 지원)",
+            "GET /api/news/stream - 새 뉴스 실시간 전달 (Server-Sent Events)",
+            "WS /api/news/ws - 새 뉴스 실시간 전달 (WebSocket)",
+            "GET /api/news/{news_id} - 뉴스 1건 조회",
+            "POST /api/news/batch - 뉴스 일괄 조회 (id 목록, 최대 500개)",
+            "GET /api/statistics - 뉴스 통계 (전체/키워드별/소스별/일자별 건수)",
+            "GET /metrics - Prometheus 메트릭 (요청 지연, DynamoDB 호출/ConsumedCapacity, 캐시, 에러)",
+            "GET /api/cache/stats - 조회 캐시, 최신 뉴스 윈도우, 검색 색인, 동일 조회 합치기, 실시간 스트림 통계",
             "GET /api/cpu-test - CPU 부하 테스트 (Auto Scaling 테스트용)",
             "GET /api/memory-test - 메모리 부하 테스트 (Auto Scaling 테스트용)", 
             "GET /api/db-stress - DynamoDB 부하 테스트",
@@ -115,6 +181,28 @@ async def test_cicd():
         "version": "v1.0.14"
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 확인 (예열 완료 + DynamoDB 호출 연속 실패 없음, 트래픽 수신 기준)
+
+    probe마다 DynamoDB를 호출하지 않고 요청/백그라운드 작업의 호출 결과로 판단한다.
+    """
+    dynamodb_ready = await db_manager.check_ready()
+    ready_at = startup_state['ready_at']
+    body = {
+        "status": "ready" if dynamodb_ready else "not_ready",
+        "timestamp": datetime.now().isoformat(),
+        "service": "news-api-service",
+        "checks": {
+            "dynamodb": "ok" if dynamodb_ready else "unavailable",
+            "dynamodb_consecutive_failures": db_manager.executor.consecutive_failures,
+            "search_index": "ready" if search_index.ready else "warming_up",  # 준비 전에는 DynamoDB 필터로 대체
+            "keyword_feed_index": "active" if db_manager.keyword_index_ready else "unavailable"
+        },
+        "time_to_ready_seconds": round(ready_at - PROCESS_STARTED_AT, 3) if ready_at else None
+    }
+    return JSONResponse(status_code=200 if dynamodb_ready else 503, content=body)
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     return HealthResponse(
@@ -123,62 +211,246 @@ async def health_check():
         service="news-api-service"
     )
 
+async def version_etag(*parts) -> Optional[str]:
+    """수집기 데이터 버전 기반 ETag (DynamoDB 조회 전에 계산, 버전을 모르면 None)"""
+    version = await news_cache.refresh_data_version()
+    if version is None:
+        return None
+    return http_cache.etag(version, *parts)
+
+def result_etag(path: str, page: Dict) -> str:
+    """데이터 버전을 알 수 없을 때 조회 결과로 만드는 ETag"""
+    return http_cache.etag(
+        path,
+        page['total_count'],
+        page['next_cursor'],
+        *(f"{item.get('id')}@{item.get('collected_at')}" for item in page['items'])
+    )
+
+def parse_time_bound(value: Optional[str], name: str, end_of_day: bool = False) -> Optional[str]:
+    """since/until 검증 및 정규화 (ISO 8601 → collected_at과 같은 naive 'YYYY-MM-DDTHH:MM:SS[.ffffff]')
+
+    collected_at은 수집기 Pod의 로컬 시각(COLLECTED_AT_TIMEZONE)으로 저장되므로 시간대가 있는 값은
+    그 시간대로 변환한 뒤 비교한다. 날짜만 주면 그날의 시작/끝(end_of_day).
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name}은(는) ISO 8601 형식이어야 합니다: {value}")
+    date_only = len(value) in (8, 10)  # YYYY-MM-DD / YYYYMMDD
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(COLLECTED_AT_TIMEZONE).replace(tzinfo=None)
+    elif date_only and end_of_day:
+        parsed = parsed.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return parsed.isoformat()
+
+def parse_time_range(since: Optional[str], until: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """since/until 쌍 검증 (until은 날짜만 주면 그날 끝까지 포함)"""
+    since = parse_time_bound(since, 'since')
+    until = parse_time_bound(until, 'until', end_of_day=True)
+    if since and until and since > until:
+        raise HTTPException(status_code=400, detail="since는 until보다 이전이어야 합니다")
+    return since, until
+
+async def query_news(limit: int, offset: int, keyword: Optional[str], cursor: Optional[str], sort: str,
+                     fields: Optional[Tuple[str, ...]] = None,
+                     since: Optional[str] = None, until: Optional[str] = None) -> Dict:
+    """뉴스 조회 공통 처리 (cursor 검증 → 캐시 → 동일 조회 합치기 → 검색 색인/DynamoDB)
+
+    since/until(collected_at 범위)이 있으면 검색 색인을 거치지 않고 DynamoDB 정렬 키 조건으로 조회한다.
+    """
+
+    # 조회 전에 데이터 버전을 잡아 둠 (조회 중에 버전이 바뀌어도 결과는 이 버전으로 캐시)
+    version = await news_cache.refresh_data_version()
+
+    # cursor는 발급 당시와 같은 검색 조건에서만 유효 (기간 조건은 지정한 경우에만 포함 - 기존 cursor 호환)
+    time_range = {name: value for name, value in (('since', since), ('until', until)) if value}
+    fingerprint = cursor_codec.query_fingerprint(keyword=keyword, sort=sort, **time_range)
+    start_key = None
+    if cursor:
+        try:
+            start_key = cursor_codec.decode(cursor, fingerprint)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        offset = 0  # cursor가 있으면 offset은 무시
+
+    # 수집 키워드의 최신순 조회는 키워드 피드 인덱스에서 Limit만큼만 읽음 (피드에서 발급된 cursor 포함)
+    feed_cursor = bool(start_key) and 'keyword' in start_key
+    use_feed = (bool(keyword) and sort == "date" and db_manager.keyword_index_ready
+                and (feed_cursor or not start_key))
+
+    # DynamoDB cursor로 이어지는 페이지는 색인이 준비되어도 DynamoDB에서 계속 조회
+    use_index = (bool(keyword) and search_index.ready and not time_range
+                 and not (start_key and 'offset' not in start_key))
+    if start_key and 'offset' in start_key:  # 검색 색인에서 발급된 cursor
+        offset = start_key['offset'] if use_index else min(start_key['offset'], MAX_OFFSET)
+        start_key = None
+
+    async def fetch() -> Dict:
+        result = None
+        if use_feed:
+            result = await db_manager.get_keyword_feed(
+                keyword, limit=limit, offset=offset, start_key=start_key, projection=fields, **time_range
+            )
+            if not feed_cursor and result['total_count'] == 0:
+                result = None  # 피드가 없는 검색어 → 검색 색인/필터 조회로 대체
+        if result is None and use_index:
+            # 최신순 페이지가 색인 horizon(색인된 가장 오래된 뉴스)을 넘어가면 None → DynamoDB 조회
+            result = await search_index.lookup(keyword, limit=limit, offset=offset, sort=sort, projection=fields)
+        if result is None:
+            # 색인 준비 전/색인 범위 밖에는 기존 FilterExpression 방식으로 조회
+            result = await db_manager.get_news(
+                limit=limit, offset=offset, keyword=keyword,
+                start_key=None if feed_cursor else start_key, projection=fields, **time_range
+            )
+        news_cache.set(cache_key, result, version)
+        return result
+
+    def fallback(error: Exception) -> Dict:
+        """DynamoDB 조회 실패/시간 예산 소진 → 보관 중인 데이터로 대체 (대체할 데이터가 없으면 503)"""
+        if isinstance(error, DeadlineExceeded):
+            reason = 'deadline'
+        elif isinstance(error, asyncio.TimeoutError):
+            reason = 'timeout'
+        else:
+            reason = 'error'
+        sources = (
+            # 갱신이 늦어진 윈도우라도 최신순 조회에 한해 그대로 사용
+            ('window', lambda: news_window.query(limit, offset, keyword=keyword, start_key=start_key, **time_range)
+                if not keyword or use_feed else None),
+            # 만료/무효화되었지만 LRU에 남아 있는 같은 조건의 이전 결과
+            ('stale_cache', lambda: news_cache.get_stale(cache_key)),
+            ('search_index', lambda: search_index.lookup_cached(keyword, limit=limit, offset=offset, sort=sort)
+                if keyword and search_index.ready and not time_range and not start_key else None),
+        )
+        for source, load in sources:
+            stale = load()
+            if stale is not None:
+                NEWS_FALLBACKS.labels(source, reason).inc()
+                logger.warning(f"⚠️  뉴스 조회 {reason} ({error!r}) → {source} 데이터로 응답")
+                return {**stale, 'fallback': source}
+
+        NEWS_FALLBACKS.labels('none', reason).inc()
+        raise HTTPException(
+            status_code=503,
+            detail=f"뉴스 조회 실패 ({reason}), 대체할 데이터가 없습니다",
+            headers={'Retry-After': '1'}
+        )
+
+    # 최신 뉴스 윈도우 안에서 끝나는 최신순 조회는 메모리에서 바로 응답
+    # (수집 키워드는 피드 인덱스와 같은 조건일 때만, 윈도우 밖으로 넘어가면 DynamoDB 조회)
+    result = None
+    if not keyword or use_feed:
+        result = news_window.lookup(
+            limit, offset, keyword=keyword, start_key=start_key,
+            since=since, until=until, current_version=version
+        )
+
+    # 캐시 확인 후, 같은 조건의 동시 요청은 DynamoDB 조회 1번으로 합쳐서 처리
+    # (검색 색인 결과는 색인이 반영한 버전이 바뀌면 다른 항목 - 색인이 따라잡으면 새로 조회)
+    index_version = search_index.synced_version if use_index else None
+    cache_key = ('news', keyword, limit, offset, cursor, sort, fields, since, until, index_version)
+    if result is None:
+        result = news_cache.get(cache_key)
+    if result is None:
+        try:
+            result = await news_flight.do((*cache_key, version), fetch)
+        except Exception as e:
+            result = fallback(e)
+
+    query_logger.info("News query successful", extra={
+        'extra_data': {
+            'returned_items': len(result['items']),
+            'total_count': result['total_count']
+        }
+    })
+
+    return {
+        'items': result['items'],
+        'total_count': result['total_count'],
+        'offset': offset,
+        'next_cursor': cursor_codec.encode(result['last_evaluated_key'], fingerprint),
+        # 검색 색인이 최신 뉴스 일부만 알 때(관련도순) total_count는 horizon 이후 기준
+        'complete': result.get('complete', True),
+        'horizon': result.get('horizon'),
+        'fragments': result.get('fragments'),  # 윈도우 응답의 미리 직렬화한 전체 필드 JSON
+        'fallback': result.get('fallback')  # DynamoDB 대신 응답한 보관 데이터 (정상 조회면 None)
+    }
+
 @app.get("/api/news", response_model=APIResponse)
 async def get_news(
+    request: Request,
+    response: Response,
     limit: int = Query(10, ge=1, le=100, description="조회할 뉴스 수"),
-    offset: int = Query(0, ge=0, description="시작 위치 (페이지네이션)"),
-    keyword: Optional[str] = Query('비트코인', description="검색 키워드")
+    offset: int = Query(0, ge=0, le=MAX_OFFSET, description="시작 위치 (구 클라이언트 호환용, cursor 사용 권장)"),
+    keyword: Optional[str] = Query('비트코인', description="검색 키워드"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 cursor (이전 응답의 next_cursor)"),
+    sort: str = Query("date", pattern="^(date|relevance)$", description="정렬 방식 (date: 최신순, relevance: 관련도순)"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (콤마 구분 또는 프리셋: list, full)"),
+    since: Optional[str] = Query(None, description="collected_at 시작 (ISO 8601, 포함)"),
+    until: Optional[str] = Query(None, description="collected_at 끝 (ISO 8601, 포함, 날짜만 주면 그날 끝까지)")
 ):
     """뉴스 목록 조회 (DynamoDB)"""
 
-    logger.info("News query requested", extra={
+    query_logger.info("News query requested", extra={
         'extra_data': {
             'limit': limit,
             'offset': offset,
-            'keyword': keyword
+            'keyword': keyword,
+            'cursor': bool(cursor),
+            'sort': sort,
+            'since': since,
+            'until': until
         }
     })
 
     try:
-        # DynamoDB에서 뉴스 조회
-        result = db_manager.get_news(limit=limit, offset=offset, keyword=keyword)
-        
-        # NewsItem 객체로 변환
-        news_items = []
-        for item in result['items']:
-            news_item = NewsItem(
-                id=item.get('id', ''),
-                title=item.get('title', ''),
-                description=item.get('description', ''),
-                keyword=item.get('keyword', ''),
-                originallink=item.get('originallink', ''),
-                link=item.get('link', ''),
-                pubDate=item.get('pubDate', ''),
-                image_url=item.get('image_url'),
-                cloudfront_image_url=item.get('cloudfront_image_url'),
-                collected_at=item.get('collected_at', ''),
-                content_type=item.get('content_type', 'news'),
-                source=item.get('source', '')
-            )
-            news_items.append(news_item)
+        selected_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    since, until = parse_time_range(since, until)
 
-        logger.info("News query successful", extra={
-            'extra_data': {
-                'returned_items': len(result['items']),
-                'total_count': result['total_count']
-            }
-        })
+    # 데이터가 바뀌지 않았으면 DynamoDB 조회 없이 304
+    etag = await version_etag(request.url.path, limit, offset, keyword, cursor, sort, selected_fields, since, until,
+                              search_index.synced_version if keyword else None)
+    if http_cache.matches(request, etag):
+        return http_cache.not_modified('news', etag)
+
+    try:
+        page = await query_news(limit, offset, keyword, cursor, sort, selected_fields, since, until)
+        if page['fallback']:
+            response.headers.update(http_cache.fallback_headers(page['fallback']))
+        else:
+            etag = etag or result_etag(request.url.path, page)
+            if http_cache.matches(request, etag):
+                return http_cache.not_modified('news', etag)
+            http_cache.apply(response, 'news', etag)
+        
+        # NewsItem 객체로 변환 (fields 지정 시 요청한 필드만 포함)
+        if selected_fields:
+            news_items = [NewsItemSummary(**news_item_dict(item, selected_fields)) for item in page['items']]
+        else:
+            news_items = [NewsItem(**news_item_dict(item)) for item in page['items']]
         
         # API 응답 형태로 구성
         response_body = APIResponseBody(
             message="content_list 엔드포인트",
             news_items=news_items,
-            total_items=result['total_count'],
+            total_items=page['total_count'],
             query_params=QueryParams(
                 limit=str(limit),
-                offset=str(offset),
-                keyword=keyword
+                offset=str(page['offset']),
+                keyword=keyword,
+                cursor=cursor,
+                fields=fields,
+                since=since,
+                until=until
             ),
+            next_cursor=page['next_cursor'],
+            complete=page['complete'],
+            horizon=page['horizon'],
             timestamp=datetime.now().isoformat()
         )
         
@@ -193,8 +465,110 @@ async def get_news(
             body=response_body
         )
         
+        if selected_fields:
+            # 요청하지 않은 필드는 null로 채우지 않고 응답에서 제외
+            return Response(
+                content=dumps(api_response.model_dump(exclude_unset=True)),
+                media_type="application/json",
+                headers=dict(response.headers)
+            )
         return api_response
         
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("News query failed", extra={
+            'extra_data': {
+                'limit': limit,
+                'offset': offset,
+                'keyword': keyword,
+                'error': str(e)
+            }
+        })
+        raise HTTPException(status_code=500, detail=f"뉴스 조회 실패: {str(e)}")
+
+@app.get("/api/v2/news", response_model=APIResponseBody)
+async def get_news_v2(
+    request: Request,
+    limit: int = Query(10, ge=1, le=100, description="조회할 뉴스 수"),
+    offset: int = Query(0, ge=0, le=MAX_OFFSET, description="시작 위치 (구 클라이언트 호환용, cursor 사용 권장)"),
+    keyword: Optional[str] = Query('비트코인', description="검색 키워드"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 cursor (이전 응답의 next_cursor)"),
+    sort: str = Query("date", pattern="^(date|relevance)$", description="정렬 방식 (date: 최신순, relevance: 관련도순)"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (콤마 구분 또는 프리셋: list, full)"),
+    since: Optional[str] = Query(None, description="collected_at 시작 (ISO 8601, 포함)"),
+    until: Optional[str] = Query(None, description="collected_at 끝 (ISO 8601, 포함, 날짜만 주면 그날 끝까지)")
+):
+    """뉴스 목록 조회 v2 (경량 응답)
+
+    statusCode/headers 래퍼 없이 APIResponseBody 스키마만 반환하며, pydantic 모델을 거치지 않고
+    DynamoDB 아이템을 orjson으로 바로 직렬화한다.
+    """
+
+    query_logger.info("News query requested", extra={
+        'extra_data': {
+            'limit': limit,
+            'offset': offset,
+            'keyword': keyword,
+            'cursor': bool(cursor),
+            'sort': sort,
+            'since': since,
+            'until': until,
+            'version': 'v2'
+        }
+    })
+
+    try:
+        selected_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    since, until = parse_time_range(since, until)
+
+    # 데이터가 바뀌지 않았으면 DynamoDB 조회 없이 304
+    etag = await version_etag(request.url.path, limit, offset, keyword, cursor, sort, selected_fields, since, until,
+                              search_index.synced_version if keyword else None)
+    if http_cache.matches(request, etag):
+        return http_cache.not_modified('news', etag)
+
+    try:
+        page = await query_news(limit, offset, keyword, cursor, sort, selected_fields, since, until)
+        if page['fallback']:
+            headers = http_cache.fallback_headers(page['fallback'])
+        else:
+            etag = etag or result_etag(request.url.path, page)
+            if http_cache.matches(request, etag):
+                return http_cache.not_modified('news', etag)
+            headers = http_cache.headers('news', etag)
+        
+        body = {
+            'message': "content_list 엔드포인트",
+            'news_items': (json_fragments(page['fragments']) if page['fragments'] is not None and not selected_fields
+                           else news_item_dicts(page['items'], selected_fields)),
+            'total_items': page['total_count'],
+            'query_params': {
+                'limit': str(limit),
+                'offset': str(page['offset']),
+                'keyword': keyword,
+                'cursor': cursor,
+                'fields': fields,
+                'since': since,
+                'until': until
+            },
+            'timestamp': datetime.now().isoformat(),
+            'next_cursor': page['next_cursor'],
+            'complete': page['complete'],
+            'horizon': page['horizon']
+        }
+        
+        # response_model은 문서화용 (Response를 직접 반환하면 FastAPI 재검증/재직렬화 생략)
+        return Response(
+            content=dumps(body),
+            media_type="application/json",
+            headers=headers
+        )
+        
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("News query failed", extra={
             'extra_data': {
@@ -206,6 +580,302 @@ async def get_news(
         })
         raise HTTPException(status_code=500, detail=f"뉴스 조회 실패: {str(e)}")
     
+@app.get("/api/news/export")
+async def export_news(
+    keyword: Optional[str] = Query(None, description="수집 키워드 (없으면 전체)"),
+    since: Optional[str] = Query(None, description="collected_at 시작 (ISO 8601, 포함)"),
+    until: Optional[str] = Query(None, description="collected_at 끝 (ISO 8601, 포함)"),
+    fields: Optional[str] = Query(None, description="내보낼 필드 (콤마 구분 또는 프리셋: list, full)"),
+    resume: Optional[str] = Query(None, description="이어받기 체크포인트 (응답의 _checkpoint 값)"),
+    gzip: bool = Query(False, description="gzip 압축 여부")
+):
+    """뉴스 일괄 내보내기 (NDJSON 스트리밍, collected_at 오름차순)
+
+    한 줄에 뉴스 1건씩 내보내고, DynamoDB 페이지가 끝날 때마다 {"_checkpoint": ...} 줄을 넣는다.
+    연결이 끊기면 마지막으로 받은 _checkpoint를 resume으로 넘겨 그 다음부터 이어받는다.
+    마지막 줄은 {"_end": true, "exported": n} 이다.
+    """
+    try:
+        selected_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    since, until = parse_time_range(since, until)
+
+    # 체크포인트는 같은 내보내기 조건(조회 인덱스 포함)에서만 유효
+    fingerprint = cursor_codec.query_fingerprint(
+        export=True, keyword=keyword, since=since, until=until,
+        feed=bool(keyword) and db_manager.keyword_index_ready
+    )
+    start_key = None
+    if resume:
+        try:
+            start_key = cursor_codec.decode(resume, fingerprint)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def ndjson_lines():
+        exported = 0
+        checkpoint = resume
+        start_time = time.time()
+        try:
+            async for items, last_key in db_manager.iter_news_export(
+                keyword=keyword, since=since, until=until, start_key=start_key, projection=selected_fields
+            ):
+                chunk = b''.join(dumps(news_item_dict(item, selected_fields)) + b'\n' for item in items)
+                exported += len(items)
+                checkpoint = cursor_codec.encode(last_key, fingerprint)
+                if checkpoint:
+                    chunk += dumps({'_checkpoint': checkpoint}) + b'\n'
+                yield chunk
+        except Exception as e:
+            logger.error("News export failed", extra={
+                'extra_data': {'exported': exported, 'error': str(e)}
+            })
+            yield dumps({'_error': str(e), '_checkpoint': checkpoint}) + b'\n'
+            return
+
+        logger.info("News export completed", extra={
+            'extra_data': {
+                'keyword': keyword,
+                'exported': exported,
+                'duration_seconds': round(time.time() - start_time, 2)
+            }
+        })
+        yield dumps({'_end': True, 'exported': exported}) + b'\n'
+
+    headers = {'Cache-Control': 'no-store'}
+    body = ndjson_lines()
+    if gzip:
+        body = gzip_stream(body)
+        headers['Content-Encoding'] = 'gzip'
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
+
+@app.get("/api/news/stream")
+async def stream_news(
+    request: Request,
+    keyword: Optional[str] = Query(None, description="이 키워드의 뉴스만 받기 (없으면 전체)")
+):
+    """새 뉴스 실시간 전달 (Server-Sent Events)
+
+    수집기가 저장한 뉴스를 event: news 로 1건씩 보낸다. 재접속 시 브라우저가 보내는
+    Last-Event-ID(collected_at|news_id) 다음 뉴스를 먼저 보내고 이어서 실시간 전달을 시작한다.
+    """
+    subscriber = news_broadcaster.subscribe(keyword)
+    last_event_id = request.headers.get('last-event-id')
+
+    def sse_frame(event: Dict) -> bytes:
+        return b'id: ' + event['id'].encode('utf-8') + b'\nevent: news\ndata: ' + event['data'] + b'\n\n'
+
+    async def events():
+        try:
+            yield f"retry: {int(news_broadcaster.poll_interval * 1000)}\n\n".encode('utf-8')
+            if last_event_id:
+                for event in await news_broadcaster.replay(subscriber, last_event_id):
+                    yield sse_frame(event)
+            while not (subscriber.dropped and subscriber.queue.empty()):
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), news_broadcaster.heartbeat_interval)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield b': keep-alive\n\n'  # 프록시/ALB 유휴 연결 종료 방지
+                    continue
+                if subscriber.is_replayed(event):  # replay 조회 중 전달된 뉴스 (이미 보냄)
+                    continue
+                yield sse_frame(event)
+        finally:
+            news_broadcaster.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.websocket("/api/news/ws")
+async def news_websocket(websocket: WebSocket, keyword: Optional[str] = None):
+    """새 뉴스 실시간 전달 (WebSocket, 메시지 1개 = 뉴스 1건 JSON)"""
+    await websocket.accept()
+    subscriber = news_broadcaster.subscribe(keyword)
+
+    async def receive_until_disconnect():
+        """클라이언트가 보내는 메시지(ping 등)는 무시하고 연결 종료만 감지"""
+        while True:
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                raise WebSocketDisconnect(message.get('code', 1000))
+
+    disconnected = asyncio.ensure_future(receive_until_disconnect())
+    try:
+        while not (subscriber.dropped and subscriber.queue.empty()):
+            next_event = asyncio.ensure_future(subscriber.queue.get())
+            await asyncio.wait({next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected.done():
+                next_event.cancel()
+                disconnected.exception()  # WebSocketDisconnect
+                return
+            await websocket.send_text(next_event.result()['data'].decode('utf-8'))
+        await websocket.close(code=1013)  # 너무 느린 구독자 → 재접속 요청
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+        news_broadcaster.unsubscribe(subscriber)
+
+@app.post("/api/news/batch", response_model=NewsBatchResponseBody)
+async def get_news_batch(batch_request: NewsBatchRequest):
+    """뉴스 일괄 조회 (북마크, 공유 링크 등 id 목록으로 조회, BatchGetItem)"""
+    try:
+        selected_fields = parse_fields(batch_request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        result = await db_manager.batch_get_news(batch_request.ids, projection=selected_fields)
+    except Exception as e:
+        logger.error("News batch query failed", extra={
+            'extra_data': {'requested': len(batch_request.ids), 'error': str(e)}
+        })
+        raise HTTPException(status_code=500, detail=f"뉴스 일괄 조회 실패: {str(e)}")
+
+    query_logger.info("News batch query successful", extra={
+        'extra_data': {
+            'requested': len(batch_request.ids),
+            'returned_items': len(result['items']),
+            'unprocessed': len(result['unprocessed_ids'])
+        }
+    })
+
+    body = {
+        'news_items': news_item_dicts(result['items'], selected_fields),
+        'missing_ids': result['missing_ids'],
+        'unprocessed_ids': result['unprocessed_ids'],
+        'timestamp': datetime.now().isoformat()
+    }
+    return Response(content=dumps(body), media_type="application/json")
+
+@app.get("/api/news/{news_id}", response_model=Union[NewsItem, NewsItemSummary])
+async def get_news_item(
+    request: Request,
+    news_id: str,
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (콤마 구분 또는 프리셋: list, full)")
+):
+    """뉴스 1건 조회 (GetItem)"""
+    try:
+        selected_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    etag = await version_etag(request.url.path, selected_fields)
+    if http_cache.matches(request, etag):
+        return http_cache.not_modified('news', etag)
+
+    try:
+        item = await db_manager.get_news_by_id(news_id, projection=selected_fields)
+    except Exception as e:
+        logger.error("News item query failed", extra={
+            'extra_data': {'news_id': news_id, 'error': str(e)}
+        })
+        raise HTTPException(status_code=500, detail=f"뉴스 조회 실패: {str(e)}")
+
+    if item is None:
+        raise HTTPException(status_code=404, detail=f"뉴스를 찾을 수 없습니다: {news_id}")
+
+    return Response(
+        content=dumps(news_item_dict(item, selected_fields)),
+        media_type="application/json",
+        headers=http_cache.headers('news', etag)
+    )
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """DynamoDB 스레드 풀 정리"""
+    dynamodb_executor.shutdown()
+    log_pipeline.stop()
+
+@app.get("/api/statistics")
+async def get_statistics(request: Request, response: Response):
+    """뉴스 통계 (수집기가 관리하는 집계 카운터)
+
+    응답 필드는 이전(GSI 표본 집계) 응답의 total_items, keyword_distribution, source_distribution,
+    sample_size, index_used를 그대로 두고 daily_distribution, updated_at만 추가했다. 집계 카운터는
+    전체 기사 기준이므로 sample_size는 total_items와 같고 index_used는 카운터 아이템 id다.
+    """
+    etag = await version_etag(request.url.path)
+    if http_cache.matches(request, etag):
+        return http_cache.not_modified('statistics', etag)
+
+    http_cache.apply(response, 'statistics', etag)
+    return {
+        "statusCode": 200,
+        "body": {
+            "statistics": await db_manager.get_statistics(),
+            "timestamp": datetime.now().isoformat()
+        }
+    }
+
+@app.get("/api/trending")
+async def get_trending(
+    request: Request,
+    response: Response,
+    window: str = Query("1h", pattern="^(1h|6h|24h)$", description="집계 기간"),
+    kind: str = Query("terms", pattern="^(terms|keywords)$", description="terms: 제목 검색어, keywords: 수집 키워드"),
+    limit: int = Query(20, ge=1, le=100, description="반환할 순위 수")
+):
+    """최근 1/6/24시간 인기 검색어/키워드 (수집기가 갱신하는 구간별 스케치 합산, 추정 건수)"""
+    current_bucket = window_bucket_ids(window, datetime.now())[0]  # 구간이 넘어가면 결과도 바뀜
+    etag = await version_etag(request.url.path, window, kind, limit, current_bucket)
+    if http_cache.matches(request, etag):
+        return http_cache.not_modified('trending', etag)
+
+    cache_key = ('trending', window, kind, current_bucket)
+    version = news_cache.data_version  # 조회 전 버전 (version_etag에서 확인한 값)
+    trending = news_cache.get(cache_key)
+    if trending is None:
+        try:
+            trending = await news_flight.do((*cache_key, version), lambda: trend_reader.top(window, kind))
+            news_cache.set(cache_key, trending, version)
+        except Exception as e:
+            trending = news_cache.get_stale(cache_key)
+            if trending is None:
+                logger.error(f"❌ 인기어 조회 실패: {e}")
+                raise HTTPException(status_code=503, detail="인기어 조회 실패", headers={'Retry-After': '1'})
+            logger.warning(f"⚠️  인기어 조회 실패 ({e!r}) → stale_cache 데이터로 응답")
+            response.headers.update(http_cache.fallback_headers('stale_cache'))
+            etag = None
+
+    if etag:
+        http_cache.apply(response, 'trending', etag)
+    return {
+        "statusCode": 200,
+        "body": {
+            "window": trending['window'],
+            "kind": trending['kind'],
+            "from": trending['from'],
+            "until": trending['until'],
+            "buckets": trending['buckets'],
+            "articles": trending['articles'],
+            "trending": trending['ranking'][:limit],
+            "timestamp": datetime.now().isoformat()
+        }
+    }
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """조회 캐시, 최신 뉴스 윈도우, 검색 색인, 동일 조회 합치기, 데이터 버전 조회 통계 (크기 산정용)"""
+    return {
+        "statusCode": 200,
+        "body": {
+            "news_cache": news_cache.stats(),
+            "search_index": search_index.stats(),
+            "news_stream": news_broadcaster.stats(),
+            "news_window": news_window.stats(),
+            "single_flight": news_flight.stats(),
+            "data_version": data_version_poller.stats(),
+            "timestamp": datetime.now().isoformat()
+        }
+    }
+
 # Auto Scaling 테스트용 엔드포인트들
 @app.get("/api/cpu-test")
 async def cpu_intensive_task():
@@ -247,7 +917,7 @@ async def database_stress_test():
     
     # 여러 DynamoDB 쿼리 실행
     for i in range(5):
-        db_manager.get_news(limit=10, offset=i*10)
+        await db_manager.get_news(limit=10, offset=i*10)
     
     return {
         "statusCode": 200,
@@ -269,8 +939,8 @@ async def load_test():
         _ = sum(range(50000))
     
     # 2. DB 부하
-    db_manager.get_news(limit=20)
-    db_manager.get_latest_news(limit=10)
+    await db_manager.get_news(limit=20)
+    await db_manager.get_news_since(None, 10)  # 최신 뉴스 10개
     
     # 3. 메모리 부하
     temp_data = [random.randint(1, 1000) for _ in range(500000)]
@@ -0,0 +1,122 @@
+import time
+from typing import Any
+from fastapi import FastAPI, Request, Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from starlette.routing import Match
+
+# HTTP 지연 구간 (ms 단위 캐시 응답부터 수 초 걸리는 DynamoDB 필터 조회까지)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds', 'HTTP 요청 처리 시간',
+    ['method', 'route'], buckets=LATENCY_BUCKETS
+)
+HTTP_REQUESTS = Counter(
+    'http_requests_total', 'HTTP 요청 수 (상태 코드별)',
+    ['method', 'route', 'status']
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight', '처리 중인 HTTP 요청 수',
+    ['method', 'route']
+)
+HTTP_EXCEPTIONS = Counter(
+    'http_request_exceptions_total', '처리되지 않은 예외로 끝난 HTTP 요청 수',
+    ['method', 'route', 'exception']
+)
+
+DYNAMODB_CALL_DURATION = Histogram(
+    'dynamodb_call_duration_seconds', 'DynamoDB 호출 시간 (스레드 풀 대기 포함)',
+    ['operation'], buckets=LATENCY_BUCKETS
+)
+DYNAMODB_CALL_ERRORS = Counter(
+    'dynamodb_call_errors_total', 'DynamoDB 호출 실패 수',
+    ['operation', 'error']
+)
+DYNAMODB_CONSUMED_CAPACITY = Counter(
+    'dynamodb_consumed_capacity_units_total', 'DynamoDB ConsumedCapacity 합계',
+    ['operation', 'table']
+)
+DYNAMODB_HEDGED_REQUESTS = Counter(
+    'dynamodb_hedged_requests_total', 'hedged read 중복 호출 수 (sent, primary_won, hedge_won)',
+    ['operation', 'outcome']
+)
+
+CACHE_EVENTS = Counter(
+    'cache_events_total', '캐시 이벤트 수 (hit, miss, eviction, expiration, invalidation)',
+    ['cache', 'event']
+)
+
+NEWS_FALLBACKS = Counter(
+    'news_fallback_responses_total', 'DynamoDB 조회 실패/시간 초과로 보관 데이터로 응답한 수',
+    ['source', 'reason']
+)
+
+NEWS_WINDOW_ITEMS = Gauge('news_window_items', '최신 뉴스 윈도우에 보관 중인 뉴스 수')
+NEWS_WINDOW_MEMORY_BYTES = Gauge('news_window_memory_bytes', '최신 뉴스 윈도우의 대략적인 메모리 사용량')
+NEWS_WINDOW_STALENESS = Gauge('news_window_staleness_seconds', '최신 뉴스 윈도우를 마지막으로 DynamoDB와 맞춘 뒤 지난 시간')
+
+LOG_RECORDS_DROPPED = Counter(
+    'log_records_dropped_total', '출력하지 않은 로그 수 (sampled, rate_limited, queue_full)',
+    ['reason']
+)
+
+# ConsumedCapacity를 돌려주는 DynamoDB 호출 (executor.run의 operation 이름 기준)
+CAPACITY_OPERATIONS = frozenset({
+    'get_item', 'put_item', 'update_item', 'delete_item', 'query', 'scan',
+    'batch_get_item', 'batch_write_item'
+})
+
+
+def route_label(app: FastAPI, request: Request) -> str:
+    """경로 템플릿 (/api/news/{news_id}) 기준 라벨 (id마다 시계열이 생기지 않도록)"""
+    for route in app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, 'path', request.url.path)
+    return 'unmatched'
+
+
+def record_consumed_capacity(operation: str, response: Any) -> None:
+    """응답의 ConsumedCapacity (단일 dict 또는 배치 호출의 list) 누적"""
+    if not isinstance(response, dict):
+        return
+    consumed = response.get('ConsumedCapacity')
+    if not consumed:
+        return
+    for entry in consumed if isinstance(consumed, list) else [consumed]:
+        DYNAMODB_CONSUMED_CAPACITY.labels(operation, entry.get('TableName', 'unknown')).inc(
+            float(entry.get('CapacityUnits', 0))
+        )
+
+
+def setup_metrics(app: FastAPI) -> None:
+    """요청 지연/처리 중 요청 수 미들웨어와 /metrics 엔드포인트 등록"""
+
+    @app.middleware("http")
+    async def prometheus_middleware(request: Request, call_next):
+        if request.url.path == '/metrics':
+            return await call_next(request)
+
+        method = request.method
+        route = route_label(app, request)
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method, route)
+        in_flight.inc()
+        start_time = time.perf_counter()
+        try:
+            response = await call_next(request)
+        except Exception as e:
+            HTTP_EXCEPTIONS.labels(method, route, type(e).__name__).inc()
+            HTTP_REQUESTS.labels(method, route, '500').inc()
+            raise
+        else:
+            HTTP_REQUESTS.labels(method, route, str(response.status_code)).inc()
+            return response
+        finally:
+            # 스트리밍 응답은 헤더를 보낼 때까지의 시간
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - start_time)
+            in_flight.dec()
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        """Prometheus 스크레이프 엔드포인트"""
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
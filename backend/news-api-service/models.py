@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
 
 class NewsItem(BaseModel):
@@ -15,24 +15,61 @@ class NewsItem(BaseModel):
     collected_at: str
     content_type: str
     source: str
+    story_id: Optional[str] = None  # 유사 기사 묶음 id (대표 기사는 자기 id)
+    keywords: Optional[List[str]] = None  # 이 기사를 찾은 수집 키워드 전체 (keyword는 처음 수집한 키워드)
+
+class NewsItemSummary(BaseModel):
+    """fields 파라미터로 일부 필드만 요청한 경우의 뉴스 아이템 (요청한 필드만 포함)"""
+    id: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    keyword: Optional[str] = None
+    originallink: Optional[str] = None
+    link: Optional[str] = None
+    pubDate: Optional[str] = None
+    image_url: Optional[str] = None
+    cloudfront_image_url: Optional[str] = None
+    collected_at: Optional[str] = None
+    content_type: Optional[str] = None
+    source: Optional[str] = None
+    story_id: Optional[str] = None
+    keywords: Optional[List[str]] = None
 
 class QueryParams(BaseModel):
     limit: str
     offset: str
     keyword: Optional[str] = None
+    cursor: Optional[str] = None
+    fields: Optional[str] = None
+    since: Optional[str] = None
+    until: Optional[str] = None
 
 class APIResponseBody(BaseModel):
     message: str
-    news_items: List[NewsItem]
+    news_items: List[Union[NewsItem, NewsItemSummary]]
     total_items: int
     query_params: QueryParams
     timestamp: str
+    next_cursor: Optional[str] = None
+    # False면 total_items는 검색 색인 범위(horizon 이후 collected_at) 안의 건수 (더 오래된 결과가 있을 수 있음)
+    complete: bool = True
+    horizon: Optional[str] = None
 
 class APIResponse(BaseModel):
     statusCode: int
     headers: Dict[str, str]
     body: APIResponseBody
 
+class NewsBatchRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=500, description="조회할 뉴스 id 목록 (최대 500개)")
+    fields: Optional[str] = Field(None, description="응답에 포함할 필드 (콤마 구분 또는 프리셋: list, full)")
+
+class NewsBatchResponseBody(BaseModel):
+    news_items: List[Union[NewsItem, NewsItemSummary]]
+    missing_ids: List[str]
+    unprocessed_ids: List[str]
+    timestamp: str
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: datetime
@@ -0,0 +1,193 @@
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from dotenv import load_dotenv
+from logging_config import get_logger
+from database import db_manager
+from data_version import data_version_poller
+from serialization import dumps, news_item_dict
+
+# .env 파일 로드
+load_dotenv()
+
+logger = get_logger(__name__)
+
+# SSE event id = "collected_at|news_id" (수집 1회분이 같은 collected_at이라 id까지 있어야 이어받을 위치가 정해짐)
+EVENT_ID_SEPARATOR = '|'
+
+
+def event_key(item: Dict) -> Tuple[str, str]:
+    """전달 순서 (collected_at, id) - event id와 같은 순서"""
+    return item.get('collected_at', ''), item.get('id', '')
+
+
+def parse_event_id(last_event_id: str) -> Tuple[str, Optional[str]]:
+    """Last-Event-ID → (collected_at, 마지막으로 받은 news_id, 예전 형식(collected_at만)이면 None)"""
+    collected_at, separator, news_id = last_event_id.partition(EVENT_ID_SEPARATOR)
+    return collected_at, news_id if separator else None
+
+
+class NewsSubscriber:
+    """스트림 구독자 1명 (SSE/WebSocket 연결 1개)"""
+
+    def __init__(self, keyword: Optional[str], queue_size: int):
+        self.keyword = keyword
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False  # 너무 느려서 연결을 끊어야 하는 구독자
+        # 재접속 시 먼저 보낸 뉴스 id (replay 조회 중 큐에 들어온 같은 뉴스는 다시 보내지 않음)
+        self.replayed: Set[str] = set()
+
+    def matches(self, item: Dict) -> bool:
+        if not self.keyword:
+            return True
+        keyword = self.keyword
+        return (keyword == item.get('keyword')
+                or keyword in (item.get('keywords') or ())
+                or keyword in (item.get('title') or '')
+                or keyword in (item.get('description') or ''))
+
+    def is_replayed(self, event: Dict) -> bool:
+        return event['news_id'] in self.replayed
+
+
+class NewsBroadcaster:
+    """수집기가 저장한 새 뉴스를 Pod 내 구독자들에게 전달 (Pod당 업스트림 조회 1개)
+
+    데이터 버전(GetItem 1회)을 주기적으로 확인하다가 save_news_items가 버전을 올리면
+    watermark 이후 뉴스만 조회해서 모든 구독자에게 나눠준다. 구독자 수와 무관하게
+    DynamoDB 조회는 Pod당 1번이고, 뉴스 1건당 JSON 직렬화도 1번만 한다.
+    """
+
+    def __init__(self):
+        self.poll_interval = float(os.getenv("NEWS_STREAM_POLL_INTERVAL", "2"))
+        self.queue_size = int(os.getenv("NEWS_STREAM_QUEUE_SIZE", "256"))
+        self.replay_limit = int(os.getenv("NEWS_STREAM_REPLAY_LIMIT", "100"))
+        self.heartbeat_interval = float(os.getenv("NEWS_STREAM_HEARTBEAT_INTERVAL", "15"))
+
+        self._subscribers: Set[NewsSubscriber] = set()
+        self.watermark: Optional[str] = None  # 전달한 가장 최신 collected_at
+        self._watermark_ids: Set[str] = set()  # watermark와 collected_at이 같은 이미 전달한 뉴스
+        self._version: Optional[int] = None
+        self.published = 0
+        self.dropped_subscribers = 0
+        self.last_publish_at: Optional[float] = None
+
+    # ---------- 구독 ----------
+
+    def subscribe(self, keyword: Optional[str] = None) -> NewsSubscriber:
+        subscriber = NewsSubscriber(keyword, self.queue_size)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: NewsSubscriber) -> None:
+        self._subscribers.discard(subscriber)
+
+    @staticmethod
+    def event(item: Dict) -> Dict:
+        """구독자에게 전달할 이벤트 (event id는 재접속 시 이어받기 기준인 collected_at|news_id)"""
+        return {
+            'id': EVENT_ID_SEPARATOR.join(event_key(item)),
+            'news_id': item.get('id'),
+            'data': dumps(news_item_dict(item))
+        }
+
+    async def replay(self, subscriber: NewsSubscriber, last_event_id: str) -> List[Dict]:
+        """재접속한 구독자가 놓친 뉴스 (Last-Event-ID 다음부터 (collected_at, id) 순서로 최대 replay_limit개)
+
+        같은 collected_at(>=)부터 조회하고 마지막으로 받은 뉴스까지는 건너뛰므로 수집 1회분을
+        보내다 끊긴 경우에도 나머지를 이어서 보낸다. 예전 형식(collected_at만)이면 그 시각 이후만 보낸다.
+        """
+        since, last_id = parse_event_id(last_event_id)
+        after = (since, last_id) if last_id is not None else (since, chr(0x10FFFF))
+        items: List[Dict] = []
+        start_key = None
+        while True:
+            page, start_key = await db_manager.get_news_since_page(since, self.replay_limit, start_key)
+            items.extend(item for item in page if event_key(item) > after and subscriber.matches(item))
+            if start_key is None or not page:
+                break
+            # collected_at 순서로 읽으므로 replay_limit번째 뉴스의 시각을 지나면 그 앞 순서는 모두 읽음
+            if len(items) >= self.replay_limit:
+                cutoff = sorted(items, key=event_key)[self.replay_limit - 1].get('collected_at', '')
+                if page[-1].get('collected_at', '') > cutoff:
+                    break
+        items.sort(key=event_key)
+        events = [self.event(item) for item in items[:self.replay_limit]]
+        subscriber.replayed = {event['news_id'] for event in events}
+        return events
+
+    # ---------- 업스트림 ----------
+
+    async def start(self) -> None:
+        """현재 가장 최신 뉴스를 기준점으로 잡고 폴링 시작"""
+        self._version = await data_version_poller.get()
+        latest = await db_manager.get_news_since(None, 1)
+        if latest:
+            self.watermark = latest[0].get('collected_at')
+            self._watermark_ids = {latest[0]['id']}
+        logger.info(f"📡 뉴스 스트림 시작: watermark={self.watermark}")
+
+    async def poll(self) -> int:
+        """데이터 버전이 바뀌었으면 새 뉴스를 조회해서 구독자에게 전달"""
+        version = await data_version_poller.get()
+        if version is None or version == self._version:
+            return 0
+
+        # watermark와 같은 collected_at 뉴스가 queue_size개를 넘어도 LastEvaluatedKey로 끝까지 조회
+        items: List[Dict] = []
+        start_key = None
+        while True:
+            page, start_key = await db_manager.get_news_since_page(self.watermark, self.queue_size, start_key)
+            items.extend(page)
+            if start_key is None or not page:
+                break
+        self._version = version
+        new_items = [item for item in items if item['id'] not in self._watermark_ids]
+        if not new_items:
+            return 0
+        new_items.sort(key=event_key)  # event id 순서로 전달 (재접속 시 마지막 id 다음부터 이어받기)
+
+        for item in new_items:
+            collected_at = item.get('collected_at', '')
+            if self.watermark is None or collected_at > self.watermark:
+                self.watermark = collected_at
+                self._watermark_ids = set()
+            if collected_at == self.watermark:
+                self._watermark_ids.add(item['id'])
+
+        self.publish(new_items)
+        return len(new_items)
+
+    def publish(self, items: List[Dict]) -> None:
+        """구독자별 큐에 이벤트 전달 (직렬화는 뉴스 1건당 1번)"""
+        events = [(item, self.event(item)) for item in items]
+        for subscriber in list(self._subscribers):
+            for item, event in events:
+                if not subscriber.matches(item):
+                    continue
+                try:
+                    subscriber.queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    # 느린 구독자 때문에 메모리가 늘지 않도록 연결을 끊음 (재접속 시 Last-Event-ID로 이어받기)
+                    subscriber.dropped = True
+                    self._subscribers.discard(subscriber)
+                    self.dropped_subscribers += 1
+                    break
+
+        self.published += len(items)
+        self.last_publish_at = time.time()
+        logger.info(f"📡 새 뉴스 {len(items)}개 전달 (구독자 {len(self._subscribers)}명)")
+
+    def stats(self) -> Dict:
+        return {
+            'subscribers': len(self._subscribers),
+            'watermark': self.watermark,
+            'published': self.published,
+            'dropped_subscribers': self.dropped_subscribers,
+            'last_publish_at': self.last_publish_at,
+            'poll_interval_seconds': self.poll_interval
+        }
+
+# 전역 인스턴스
+news_broadcaster = NewsBroadcaster()
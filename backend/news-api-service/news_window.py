@@ -0,0 +1,304 @@
+import asyncio
+import bisect
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from logging_config import get_logger
+from data_version import data_version_poller
+from database import (db_manager, INDEX_KEY_ATTRIBUTES, KEYWORD_INDEX_KEY_ATTRIBUTES,
+                      keyword_alias_article_id, keyword_alias_id)
+from metrics import CACHE_EVENTS, NEWS_WINDOW_ITEMS, NEWS_WINDOW_MEMORY_BYTES, NEWS_WINDOW_STALENESS
+from serialization import NEWS_ITEM_DEFAULTS, dumps, news_item_dict
+
+# .env 파일 로드
+load_dotenv()
+
+logger = get_logger(__name__)
+
+# 슬롯에 보관하는 필드 (NewsItem 스키마 순서, 아이템 1건 = 값 tuple 1개)
+WINDOW_FIELDS = tuple(NEWS_ITEM_DEFAULTS)
+KEYWORD_FIELD = WINDOW_FIELDS.index('keyword')
+KEYWORDS_FIELD = WINDOW_FIELDS.index('keywords')
+
+
+class WindowSnapshot:
+    """최신 뉴스 윈도우 1벌 (collected_at 오름차순 배열, 갱신 시 새로 만들어 통째로 교체)"""
+
+    __slots__ = ('keys', 'rows', 'fragments', 'ids', 'complete', 'memory_bytes')
+
+    def __init__(self, keys: List[Tuple[str, str]], rows: List[tuple], fragments: List[bytes], complete: bool):
+        self.keys = keys            # (collected_at, id) - 정렬/cursor 위치 탐색용
+        self.rows = rows            # WINDOW_FIELDS 순서의 값 tuple
+        self.fragments = fragments  # 전체 필드 JSON (응답에 그대로 삽입)
+        self.ids = {key[1] for key in keys}
+        self.complete = complete    # 테이블의 뉴스 전체가 윈도우 안에 있음
+        self.memory_bytes = self._measure()
+
+    def _measure(self) -> int:
+        """슬롯 배열이 차지하는 대략적인 메모리 (bytes)"""
+        size = sys.getsizeof(self.keys) + sys.getsizeof(self.rows) + sys.getsizeof(self.fragments)
+        for key, row, fragment in zip(self.keys, self.rows, self.fragments):
+            size += sys.getsizeof(key) + sys.getsizeof(row) + sys.getsizeof(fragment)
+            size += sum(sys.getsizeof(value) for value in row if value is not None)
+        return size
+
+    @property
+    def floor(self) -> Optional[str]:
+        """윈도우에 있는 가장 오래된 collected_at (이보다 최근 뉴스는 모두 윈도우 안에 있음)"""
+        return self.keys[0][0] if self.keys else None
+
+
+EMPTY_SNAPSHOT = WindowSnapshot([], [], [], complete=False)
+
+
+class NewsWindow:
+    """Pod 내 최신 뉴스 N개 윈도우
+
+    대부분의 /api/news 요청은 최신 수백 건 안에서 끝나므로, 최신 NEWS_WINDOW_SIZE개를
+    값 tuple 배열과 미리 직렬화한 JSON 조각으로 보관해서 DynamoDB 없이 응답한다.
+    데이터 버전이 바뀌면 content_type 글로벌 인덱스를 watermark(가장 최신 collected_at) 이후만
+    증분 조회해서 반영하고(이미 있는 기사에 추가된 수집 키워드는 별칭 조회로 반영), 윈도우가 알고 있는 데이터 버전이 현재 버전과 다르거나
+    마지막 갱신 후 NEWS_WINDOW_MAX_STALENESS초가 지나면 윈도우로 응답하지 않는다.
+    """
+
+    def __init__(self):
+        self.size = int(os.getenv("NEWS_WINDOW_SIZE", "1000"))
+        self.refresh_interval = float(os.getenv("NEWS_WINDOW_REFRESH_INTERVAL", "2"))
+        self.max_staleness = float(os.getenv("NEWS_WINDOW_MAX_STALENESS", "30"))
+        self.enabled = self.size > 0
+
+        self._snapshot = EMPTY_SNAPSHOT
+        self.ready = False
+        self.watermark: Optional[str] = None  # 반영된 가장 최신 collected_at
+        self.data_version: Optional[int] = None  # 윈도우가 반영한 데이터 버전
+        self.last_refresh_at: Optional[float] = None  # 마지막으로 DynamoDB와 맞춰 본 시각
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+        NEWS_WINDOW_STALENESS.set_function(lambda: self.staleness_seconds() or 0.0)
+
+    # ---------- 갱신 ----------
+
+    def _merge(self, snapshot: WindowSnapshot, items: List[Dict], complete: bool) -> WindowSnapshot:
+        """기존 윈도우 + 새 뉴스 → 새 윈도우 (직렬화 포함, 이벤트 루프 밖에서 실행)"""
+        keys = list(snapshot.keys)
+        rows = list(snapshot.rows)
+        fragments = list(snapshot.fragments)
+        ids = set(snapshot.ids)
+
+        for item in items:
+            news_id = item.get('id')
+            if not news_id:
+                continue
+            if news_id in ids:  # 이미 있는 뉴스 (watermark와 같은 시각이거나 다시 저장됨) → 기존 슬롯 교체
+                position = next(i for i, key in enumerate(keys) if key[1] == news_id)
+                del keys[position], rows[position], fragments[position]
+            ids.add(news_id)
+            key = (item.get('collected_at', ''), news_id)
+            position = bisect.bisect_left(keys, key)
+            keys.insert(position, key)
+            rows.insert(position, tuple(item.get(field, NEWS_ITEM_DEFAULTS[field]) for field in WINDOW_FIELDS))
+            fragments.insert(position, dumps(news_item_dict(item)))
+
+        overflow = len(keys) - self.size
+        if overflow > 0:  # 오래된 뉴스부터 제거 (이후로는 테이블 전체가 아님)
+            del keys[:overflow], rows[:overflow], fragments[:overflow]
+            complete = False
+        return WindowSnapshot(keys, rows, fragments, complete)
+
+    @staticmethod
+    def _apply_aliases(snapshot: WindowSnapshot, aliases: List[Dict]) -> WindowSnapshot:
+        """윈도우에 있는 기사에 나중에 추가된 수집 키워드(별칭) 반영 (바뀐 슬롯만 다시 직렬화)"""
+        added: Dict[str, set] = {}
+        for alias in aliases:
+            if alias.get('article_id') in snapshot.ids:
+                added.setdefault(alias['article_id'], set()).add(alias.get('keyword'))
+
+        rows, fragments = snapshot.rows, snapshot.fragments
+        changed = False
+        for position, (_, news_id) in enumerate(snapshot.keys):
+            keywords = added.get(news_id)
+            row = rows[position]
+            if not keywords or keywords <= set(row[KEYWORDS_FIELD] or ()):
+                continue
+            if not changed:
+                rows, fragments, changed = list(rows), list(fragments), True
+            row = row[:KEYWORDS_FIELD] + (set(row[KEYWORDS_FIELD] or ()) | keywords,) + row[KEYWORDS_FIELD + 1:]
+            rows[position] = row
+            fragments[position] = dumps(news_item_dict(dict(zip(WINDOW_FIELDS, row))))
+        return WindowSnapshot(snapshot.keys, rows, fragments, snapshot.complete) if changed else snapshot
+
+    async def refresh(self) -> int:
+        """DynamoDB와 동기화 (최초 1회는 최신 size개, 이후에는 watermark 이후만)"""
+        version = await data_version_poller.get()
+        if self.ready and version is not None and version == self.data_version:
+            self.last_refresh_at = time.time()  # 새로 저장된 데이터 없음 (윈도우가 최신)
+            return 0
+
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        snapshot = self._snapshot
+        added = 0
+        since, start_key = self.watermark, None
+        while True:
+            items, start_key = await db_manager.get_news_since_page(since, self.size, start_key)
+            complete = snapshot.complete if self.ready else len(items) < self.size
+            snapshot = await loop.run_in_executor(None, self._merge, snapshot, items, complete)
+            added += len(items)
+            if items:
+                self.watermark = max(self.watermark or '', max(item.get('collected_at', '') for item in items))
+            # 증분 조회가 size개로 잘렸으면 다음 페이지부터 이어서 조회 (최신 뉴스가 빠진 채로 응답하지 않도록)
+            # since(>= watermark)는 그대로 두고 LastEvaluatedKey로 넘어가므로 수집 1회분이 같은
+            # collected_at으로 size개를 넘어도 같은 페이지를 반복하지 않는다
+            if not self.ready or start_key is None:
+                break
+        if snapshot.keys:
+            aliases = await db_manager.get_keyword_aliases(snapshot.floor)
+            if aliases:
+                snapshot = await loop.run_in_executor(None, self._apply_aliases, snapshot, aliases)
+
+        self._snapshot = snapshot
+        self.data_version = version
+        self.last_refresh_at = time.time()
+        self.refreshes += 1
+        NEWS_WINDOW_ITEMS.set(len(snapshot.keys))
+        NEWS_WINDOW_MEMORY_BYTES.set(snapshot.memory_bytes)
+        if not self.ready:
+            self.ready = True
+            logger.info(f"🪟 최신 뉴스 윈도우 준비 완료: {len(snapshot.keys)}개 "
+                        f"({snapshot.memory_bytes / 1024:.0f}KB, {time.time() - start_time:.2f}초)")
+        return added
+
+    def staleness_seconds(self) -> Optional[float]:
+        """마지막으로 DynamoDB와 맞춰 본 뒤 지난 시간"""
+        if self.last_refresh_at is None:
+            return None
+        return time.time() - self.last_refresh_at
+
+    def is_fresh(self, current_version: Optional[int]) -> bool:
+        """윈도우로 응답해도 되는지 (현재 데이터 버전을 반영했고 갱신이 멈추지 않았음)"""
+        if not self.enabled or not self.ready:
+            return False
+        if current_version is not None and current_version != self.data_version:
+            return False  # 수집기가 새로 저장한 뉴스가 아직 반영되지 않음
+        return self.staleness_seconds() <= self.max_staleness
+
+    # ---------- 조회 ----------
+
+    def query(self, limit: int, offset: int = 0, keyword: Optional[str] = None,
+              start_key: Optional[Dict] = None, since: Optional[str] = None,
+              until: Optional[str] = None) -> Optional[Dict]:
+        """최신순 페이지 조회 (윈도우만으로 정확히 답할 수 없으면 None)
+
+        keyword는 키워드 피드 인덱스와 같은 의미(keyword 또는 keywords의 수집 키워드 일치)이며, 반환하는
+        cursor도 DynamoDB 조회와 같은 형식(다른 키워드로 먼저 저장된 기사는 별칭 아이템 키)이라
+        다음 페이지가 윈도우 밖이면 DynamoDB에서 이어서 조회된다.
+        """
+        snapshot = self._snapshot
+        keys = snapshot.keys
+
+        # 시작 위치 (cursor가 있으면 그 아이템 바로 다음, 내림차순이므로 배열에서는 앞쪽)
+        end = len(keys)
+        if start_key:
+            start_id = keyword_alias_article_id(start_key.get('id', ''))
+            end = bisect.bisect_left(keys, (start_key.get('collected_at', ''), start_id))
+        if until:
+            end = min(end, bisect.bisect_right(keys, (until, '\uffff')))
+
+        wanted = offset + limit + 1  # 다음 페이지 존재 여부 확인용 1개 포함
+        positions = []
+        skipped = 0
+        position = end - 1
+        while position >= 0 and len(positions) + skipped < wanted:
+            collected_at = keys[position][0]
+            if since and collected_at < since:
+                break
+            row = snapshot.rows[position]
+            if not keyword or row[KEYWORD_FIELD] == keyword or keyword in (row[KEYWORDS_FIELD] or ()):
+                if skipped < offset:
+                    skipped += 1
+                else:
+                    positions.append(position)
+            position -= 1
+
+        exhausted = len(positions) + skipped < wanted
+        if exhausted:
+            # 윈도우 바닥까지 내려갔으면 그 아래(윈도우 밖)에 남은 뉴스가 없을 때만 정확한 응답
+            covered = snapshot.complete or (since is not None and snapshot.floor is not None and since > snapshot.floor)
+            if not covered:
+                return None
+        if keyword and not positions and not skipped and not start_key:
+            return None  # 수집 키워드가 아닌 검색어 → 호출하는 쪽에서 검색 색인/필터 조회로 대체
+
+        has_more = not exhausted
+        if has_more:
+            positions.pop()
+        items = [dict(zip(WINDOW_FIELDS, snapshot.rows[i])) for i in positions]
+        last_evaluated_key = None
+        if has_more and items:
+            last_item = items[-1]
+            if keyword and last_item['keyword'] != keyword:  # 키워드 피드에서는 별칭 아이템
+                last_item = {**last_item, 'id': keyword_alias_id(keyword, last_item['id']), 'keyword': keyword}
+            last_evaluated_key = db_manager._index_key(
+                last_item, KEYWORD_INDEX_KEY_ATTRIBUTES if keyword else INDEX_KEY_ATTRIBUTES
+            )
+        return {
+            'items': items,
+            'fragments': [snapshot.fragments[i] for i in positions],
+            'total_count': skipped + len(items),
+            'returned_count': len(items),
+            'last_evaluated_key': last_evaluated_key
+        }
+
+    def items_by_id(self, news_ids: List[str]) -> Dict[str, Dict]:
+        """윈도우에 있는 뉴스만 id로 조회 → {id: 아이템} (검색 색인 결과 페이지 구성용)"""
+        snapshot = self._snapshot
+        wanted = set(news_ids) & snapshot.ids
+        if not wanted:
+            return {}
+        return {
+            news_id: dict(zip(WINDOW_FIELDS, snapshot.rows[position]))
+            for position, (_, news_id) in enumerate(snapshot.keys) if news_id in wanted
+        }
+
+    def lookup(self, limit: int, offset: int = 0, keyword: Optional[str] = None,
+               start_key: Optional[Dict] = None, since: Optional[str] = None,
+               until: Optional[str] = None, current_version: Optional[int] = None) -> Optional[Dict]:
+        """신선도 확인 후 윈도우 조회 (적중/미적중 집계)"""
+        result = self.query(limit, offset, keyword, start_key, since, until) if self.is_fresh(current_version) else None
+        if result is None:
+            self.misses += 1
+            CACHE_EVENTS.labels('window', 'miss').inc()
+        else:
+            self.hits += 1
+            CACHE_EVENTS.labels('window', 'hit').inc()
+        return result
+
+    def stats(self) -> Dict:
+        snapshot = self._snapshot
+        lookups = self.hits + self.misses
+        staleness = self.staleness_seconds()
+        return {
+            'enabled': self.enabled,
+            'ready': self.ready,
+            'items': len(snapshot.keys),
+            'size': self.size,
+            'complete': snapshot.complete,
+            'memory_bytes': snapshot.memory_bytes,
+            'oldest_collected_at': snapshot.floor,
+            'watermark': self.watermark,
+            'data_version': self.data_version,
+            'staleness_seconds': round(staleness, 3) if staleness is not None else None,
+            'max_staleness_seconds': self.max_staleness,
+            'refreshes': self.refreshes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+# 전역 인스턴스
+news_window = NewsWindow()
@@ -0,0 +1,90 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+from typing import Dict, Optional
+from dotenv import load_dotenv
+from logging_config import get_logger
+
+# .env 파일 로드
+load_dotenv()
+
+logger = get_logger(__name__)
+
+# offset 방식은 구 클라이언트 호환용으로만 유지 (깊은 페이지는 cursor 사용)
+MAX_OFFSET = int(os.getenv("MAX_NEWS_OFFSET", "500"))
+
+# CURSOR_SECRET 없이 개발용 기본 키로 서명 허용 (로컬 개발 전용, 운영에서는 시작 실패)
+DEV_CURSOR_SECRET = "news-api-dev-cursor-secret"
+ALLOW_DEV_CURSOR_SECRET = os.getenv("ALLOW_DEV_CURSOR_SECRET", "false").lower() == "true"
+
+
+class InvalidCursorError(ValueError):
+    """위조되었거나 다른 쿼리에서 발급된 cursor"""
+
+
+class CursorCodec:
+    """DynamoDB LastEvaluatedKey를 서명된 불투명 cursor 문자열로 변환"""
+
+    def __init__(self):
+        secret = os.getenv("CURSOR_SECRET")
+        if not secret:
+            # 공개된 기본 키로 서명하면 누구나 cursor를 위조할 수 있으므로 명시적으로 허용한 경우만 사용
+            if not ALLOW_DEV_CURSOR_SECRET:
+                logger.error("❌ CURSOR_SECRET 미설정 - 로컬 개발이면 ALLOW_DEV_CURSOR_SECRET=true로 실행하세요")
+                raise RuntimeError("CURSOR_SECRET is not set")
+            logger.warning("⚠️  CURSOR_SECRET 미설정 - 개발용 기본 키로 cursor를 서명합니다 (ALLOW_DEV_CURSOR_SECRET)")
+            secret = DEV_CURSOR_SECRET
+        self.secret = secret.encode('utf-8')
+
+    def _sign(self, payload: bytes) -> str:
+        digest = hmac.new(self.secret, payload, hashlib.sha256).digest()
+        return self._b64encode(digest[:16])
+
+    @staticmethod
+    def _b64encode(data: bytes) -> str:
+        return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def _b64decode(data: str) -> bytes:
+        return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+    @staticmethod
+    def query_fingerprint(**query_params) -> str:
+        """cursor가 발급된 쿼리 조건 (다른 조건에 재사용 방지)"""
+        canonical = json.dumps(query_params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+    def encode(self, last_key: Optional[Dict], fingerprint: str) -> Optional[str]:
+        """LastEvaluatedKey → cursor (더 이상 페이지가 없으면 None)"""
+        if not last_key:
+            return None
+
+        payload = json.dumps(
+            {'k': last_key, 'q': fingerprint},
+            separators=(',', ':'),
+            ensure_ascii=False,
+            default=str
+        ).encode('utf-8')
+        return f"{self._b64encode(payload)}.{self._sign(payload)}"
+
+    def decode(self, cursor: str, fingerprint: str) -> Dict:
+        """cursor → ExclusiveStartKey (서명 및 쿼리 조건 검증)"""
+        try:
+            encoded_payload, signature = cursor.split('.', 1)
+            payload = self._b64decode(encoded_payload)
+        except (ValueError, TypeError):
+            raise InvalidCursorError("cursor 형식이 올바르지 않습니다")
+
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            raise InvalidCursorError("cursor 서명이 올바르지 않습니다")
+
+        data = json.loads(payload)
+        if data.get('q') != fingerprint:
+            raise InvalidCursorError("cursor가 현재 검색 조건과 일치하지 않습니다")
+
+        return data['k']
+
+# 전역 인스턴스
+cursor_codec = CursorCodec()
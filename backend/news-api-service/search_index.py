@@ -0,0 +1,325 @@
+import asyncio
+import bisect
+import math
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+from dotenv import load_dotenv
+from logging_config import get_logger
+from database import db_manager
+from data_version import data_version_poller
+from news_window import news_window
+
+# .env 파일 로드
+load_dotenv()
+
+logger = get_logger(__name__)
+query_logger = get_logger('queries')  # 요청마다 남는 조회 로그 (샘플링/건수 제한 대상)
+
+HANGUL_RE = re.compile(r'[가-힣]')
+WORD_RE = re.compile(r'\w+')
+
+# 필드별 가중치 (제목/수집 키워드에 등장하면 본문보다 점수를 높게)
+FIELD_WEIGHTS = {'title': 2, 'description': 1, 'keyword': 3}
+KEYWORD_WEIGHT = FIELD_WEIGHTS['keyword']  # 나중에 추가된 수집 키워드(keywords, 별칭)도 같은 가중치
+# 색인할 때 읽는 속성 (기사 본문 전체를 읽거나 보관하지 않음)
+INDEX_FIELDS = ('title', 'description', 'keyword', 'keywords')
+
+
+def tokenize(text: str) -> List[str]:
+    """한국어 대응 토큰화
+
+    한글이 포함된 단어는 띄어쓰기/조사와 무관하게 부분 일치하도록 문자 bigram으로,
+    영문/숫자 단어는 소문자 단어 그대로 사용한다.
+    """
+    tokens = []
+    for word in WORD_RE.findall(text.lower()):
+        if HANGUL_RE.search(word):
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+class SearchIndex:
+    """최신 뉴스에 대한 Pod 내 역색인 (BM25 관련도 정렬 지원)
+
+    글로벌 인덱스를 collected_at 기준으로 증분 조회하여 수집기가 저장한 뉴스를 반영하고,
+    이미 색인된 뉴스에 나중에 추가된 수집 키워드는 키워드 피드 별칭 조회로 반영한다.
+    색인에는 뉴스 id, posting(토큰별 tf), 정렬용 collected_at만 보관하고 응답할 아이템은
+    결과 페이지의 id로 최신 뉴스 윈도우/BatchGetItem에서 가져온다.
+    메모리 사용량은 SEARCH_INDEX_MAX_DOCS 개의 최신 뉴스로 제한된다 (문서 1개당 약 3KB,
+    기본 5000개 ≈ 15MB - Pod 메모리 예산은 news-api-deployment.yaml resources 참고).
+
+    테이블에 그보다 오래된 뉴스가 있으면 색인은 가장 오래된 색인 문서의 collected_at(horizon)
+    이후만 안다. 최신순 조회는 페이지가 horizon 안에서 끝날 때만 색인으로 응답하고(lookup이 None →
+    DynamoDB 조회), 결과에는 complete/horizon을 함께 돌려줘 total_count가 색인 범위 기준임을 알린다.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self.max_docs = int(os.getenv("SEARCH_INDEX_MAX_DOCS", "5000"))
+        self.sync_interval = float(os.getenv("SEARCH_INDEX_SYNC_INTERVAL", "10"))
+
+        self._lock = threading.RLock()
+        self._collected_at: Dict[str, str] = {}         # id -> collected_at (최신순 정렬용)
+        self._postings: Dict[str, Dict[str, int]] = {}  # term -> {id: tf}
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {} # id -> 토큰 목록 (삭제용)
+        self._doc_len: Dict[str, int] = {}
+        self._doc_keywords: Dict[str, set] = {}         # id -> 색인된 수집 키워드 (keyword + keywords)
+        self._order: List[Tuple[str, str]] = []         # (collected_at, id) 오름차순
+        self._total_len = 0
+
+        self.ready = False
+        self.complete = True  # 테이블의 뉴스를 모두 색인했는지 (최대 문서 수를 넘겨 오래된 뉴스가 빠지면 False)
+        self.watermark: Optional[str] = None  # 반영된 가장 최신 collected_at
+        self.last_sync_at: Optional[float] = None
+        self._synced_version: Optional[int] = None
+
+    @property
+    def horizon(self) -> Optional[str]:
+        """색인이 아는 가장 오래된 collected_at (모든 뉴스를 색인했으면 None)"""
+        if self.complete or not self._order:
+            return None
+        return self._order[0][0]
+
+    @property
+    def synced_version(self) -> Optional[int]:
+        """색인이 반영한 데이터 버전 (ETag/캐시 키에 포함해서 색인이 뒤처진 결과가 새 버전으로 남지 않게)"""
+        return self._synced_version
+
+    # ---------- 색인 ----------
+
+    def _add(self, item: Dict) -> None:
+        doc_id = item['id']
+        if doc_id in self._collected_at:
+            self._remove(doc_id)
+
+        term_freqs = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(str(item.get(field) or '')):
+                term_freqs[term] += weight
+
+        keywords = set(item.get('keywords') or ()) - {item.get('keyword')}
+        for keyword in keywords:
+            for term in tokenize(keyword):
+                term_freqs[term] += KEYWORD_WEIGHT
+
+        collected_at = item.get('collected_at', '')
+        self._collected_at[doc_id] = collected_at
+        self._doc_terms[doc_id] = ()
+        self._doc_len[doc_id] = 0
+        self._doc_keywords[doc_id] = keywords | {item.get('keyword')}
+        self._add_terms(doc_id, term_freqs)
+        bisect.insort(self._order, (collected_at, doc_id))
+
+    def _add_terms(self, doc_id: str, term_freqs: Counter) -> None:
+        """문서에 토큰 추가 (posting/문서 길이 갱신, 토큰 문자열은 posting 키 하나만 보관)"""
+        terms = []
+        for term, tf in term_freqs.items():
+            term = sys.intern(term)
+            postings = self._postings.setdefault(term, {})
+            postings[doc_id] = postings.get(doc_id, 0) + tf
+            terms.append(term)
+        known = self._doc_terms[doc_id]
+        self._doc_terms[doc_id] = tuple(terms) if not known else known + tuple(set(terms) - set(known))
+        length = sum(term_freqs.values())
+        self._doc_len[doc_id] += length
+        self._total_len += length
+
+    def add_keywords(self, aliases: List[Dict]) -> int:
+        """이미 색인된 뉴스에 나중에 추가된 수집 키워드 반영 (키워드 피드 별칭) → 반영한 수"""
+        added = 0
+        with self._lock:
+            for alias in aliases:
+                doc_id, keyword = alias.get('article_id'), alias.get('keyword')
+                keywords = self._doc_keywords.get(doc_id)
+                if keywords is None or not keyword or keyword in keywords:
+                    continue
+                keywords.add(keyword)
+                term_freqs = Counter()
+                for term in tokenize(keyword):
+                    term_freqs[term] += KEYWORD_WEIGHT
+                self._add_terms(doc_id, term_freqs)
+                added += 1
+        return added
+
+    def _remove(self, doc_id: str) -> None:
+        collected_at = self._collected_at.pop(doc_id)
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_len -= self._doc_len.pop(doc_id)
+        self._doc_keywords.pop(doc_id, None)
+        position = bisect.bisect_left(self._order, (collected_at, doc_id))
+        if position < len(self._order) and self._order[position][1] == doc_id:
+            del self._order[position]
+
+    def add_items(self, items: List[Dict]) -> int:
+        """뉴스 아이템 색인 (오래된 뉴스부터 max_docs 초과분 제거)"""
+        with self._lock:
+            for item in items:
+                if item.get('id'):
+                    self._add(item)
+                    collected_at = item.get('collected_at')
+                    if collected_at and (self.watermark is None or collected_at > self.watermark):
+                        self.watermark = collected_at
+
+            while len(self._order) > self.max_docs:
+                self._remove(self._order[0][1])
+                self.complete = False
+        return len(items)
+
+    async def sync(self) -> int:
+        """DynamoDB와 동기화 (최초 1회는 최신 max_docs개, 이후에는 watermark 이후만)"""
+        version = await data_version_poller.get()
+        if self.ready and version is not None and version == self._synced_version:
+            return 0  # 수집기가 새로 저장한 데이터 없음
+
+        start_time = time.time()
+        items = await db_manager.get_news_since(self.watermark, self.max_docs, projection=INDEX_FIELDS)
+        if not self.ready and len(items) >= self.max_docs:
+            self.complete = False  # 최신 max_docs개보다 오래된 뉴스는 색인하지 않음
+        # 토큰화는 CPU 작업이므로 이벤트 루프 밖에서 실행
+        loop = asyncio.get_running_loop()
+        added = await loop.run_in_executor(None, self.add_items, items)
+        if self._order:
+            aliases = await db_manager.get_keyword_aliases(self._order[0][0])
+            if aliases:
+                await loop.run_in_executor(None, self.add_keywords, aliases)
+
+        self._synced_version = version
+        self.last_sync_at = time.time()
+        if not self.ready:
+            self.ready = True
+            logger.info(f"🔎 검색 색인 준비 완료: {len(self._collected_at)}개 문서 ({time.time() - start_time:.2f}초)")
+        elif added:
+            logger.info(f"🔎 검색 색인 갱신: {added}개 반영 (총 {len(self._collected_at)}개)")
+        return added
+
+    # ---------- 검색 ----------
+
+    def _bm25(self, doc_id: str, terms: List[str], doc_count: int, avg_len: float) -> float:
+        score = 0.0
+        length = self._doc_len[doc_id]
+        for term in terms:
+            postings = self._postings[term]
+            tf = postings[doc_id]
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            score += idf * tf * (self.K1 + 1) / (tf + self.K1 * (1 - self.B + self.B * length / avg_len))
+        return score
+
+    def search(self, keyword: str, limit: int = 20, offset: int = 0, sort: str = "date") -> Dict:
+        """키워드 검색 (모든 토큰을 포함하는 문서, 최신순 또는 BM25 관련도순) → 결과 페이지의 뉴스 id
+
+        complete가 False면 total_count는 horizon 이후 뉴스만 센 값이고, covered_count는 그중
+        horizon보다 새로운(색인 범위가 확실한) 결과 수다.
+        """
+        start_time = time.time()
+        terms = list(dict.fromkeys(tokenize(keyword)))
+
+        with self._lock:
+            if not terms or any(term not in self._postings for term in terms):
+                matches = []
+            else:
+                # 가장 짧은 posting list부터 교집합
+                terms.sort(key=lambda term: len(self._postings[term]))
+                candidates = set(self._postings[terms[0]])
+                for term in terms[1:]:
+                    candidates.intersection_update(self._postings[term])
+                matches = list(candidates)
+
+            horizon = self.horizon
+            covered = len(matches) if horizon is None else sum(
+                1 for doc_id in matches if self._collected_at[doc_id] > horizon
+            )
+
+            if sort == "relevance":
+                doc_count = len(self._collected_at)
+                avg_len = self._total_len / doc_count if doc_count else 1.0
+                matches.sort(
+                    key=lambda doc_id: (self._bm25(doc_id, terms, doc_count, avg_len), self._collected_at[doc_id]),
+                    reverse=True
+                )
+            else:
+                matches.sort(key=lambda doc_id: (self._collected_at[doc_id], doc_id), reverse=True)
+
+            page = matches[offset:offset + limit]
+
+        # 최신순은 색인 밖의 오래된 뉴스가 남아 있을 수 있으므로 다음 페이지(DynamoDB 조회)를 이어서 제공
+        has_more = offset + limit < len(matches) or (horizon is not None and sort != "relevance")
+        duration = time.time() - start_time
+        query_logger.info("🔎 색인 검색 완료: '%s' %d개 중 %d개 반환 (%.1fms)", keyword, len(matches), len(page), duration * 1000)
+
+        return {
+            'ids': page,
+            'total_count': len(matches),
+            'covered_count': covered,
+            'complete': horizon is None,
+            'horizon': horizon,
+            'last_evaluated_key': {'offset': offset + limit} if has_more else None
+        }
+
+    @staticmethod
+    def _within_horizon(result: Dict, limit: int, offset: int, sort: str) -> bool:
+        """색인만으로 응답할 수 있는 페이지인지 (최신순은 페이지 끝이 horizon 안쪽일 때만)"""
+        return result['complete'] or sort == "relevance" or offset + limit <= result['covered_count']
+
+    async def lookup(self, keyword: str, limit: int = 20, offset: int = 0, sort: str = "date",
+                     projection: Optional[Sequence[str]] = None) -> Dict:
+        """검색 결과 페이지 (윈도우에 있는 뉴스는 메모리에서, 나머지는 BatchGetItem으로)
+
+        최신순 페이지가 색인 horizon을 넘어가면 None (호출하는 쪽에서 DynamoDB로 조회).
+        """
+        result = self.search(keyword, limit=limit, offset=offset, sort=sort)
+        if not self._within_horizon(result, limit, offset, sort):
+            return None
+        ids = result.pop('ids')
+        items = news_window.items_by_id(ids)
+        missing = [doc_id for doc_id in ids if doc_id not in items]
+        if missing:
+            fetched = await db_manager.batch_get_news(missing, projection)
+            items.update((item['id'], item) for item in fetched['items'])
+        result['items'] = [items[doc_id] for doc_id in ids if doc_id in items]
+        result['returned_count'] = len(result['items'])
+        return result
+
+    def lookup_cached(self, keyword: str, limit: int = 20, offset: int = 0, sort: str = "date") -> Optional[Dict]:
+        """DynamoDB 없이 검색 결과 페이지 (결과가 모두 윈도우에 있고 horizon 안일 때만, 아니면 None)"""
+        result = self.search(keyword, limit=limit, offset=offset, sort=sort)
+        if not self._within_horizon(result, limit, offset, sort):
+            return None
+        ids = result.pop('ids')
+        items = news_window.items_by_id(ids)
+        if len(items) < len(ids):
+            return None
+        result['items'] = [items[doc_id] for doc_id in ids]
+        result['returned_count'] = len(ids)
+        return result
+
+    def stats(self) -> Dict:
+        return {
+            'ready': self.ready,
+            'documents': len(self._collected_at),
+            'terms': len(self._postings),
+            'max_docs': self.max_docs,
+            'complete': self.complete,
+            'horizon': self.horizon,
+            'watermark': self.watermark,
+            'last_sync_at': self.last_sync_at
+        }
+
+# 전역 인스턴스
+search_index = SearchIndex()
@@ -0,0 +1,83 @@
+import zlib
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
+import orjson
+
+# NewsItem 스키마 필드와 기본값 (models.NewsItem과 동일한 순서/기본값 유지)
+NEWS_ITEM_DEFAULTS = {
+    'id': '',
+    'title': '',
+    'description': '',
+    'keyword': '',
+    'originallink': '',
+    'link': '',
+    'pubDate': '',
+    'image_url': None,
+    'cloudfront_image_url': None,
+    'collected_at': '',
+    'content_type': 'news',
+    'source': '',
+    'story_id': None,
+    'keywords': None
+}
+
+
+# fields 프리셋 (list: 목록 화면에 필요한 최소 필드)
+FIELD_PRESETS = {
+    'list': ('id', 'title', 'cloudfront_image_url', 'collected_at'),
+    'full': tuple(NEWS_ITEM_DEFAULTS),
+}
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """fields 파라미터 해석 (프리셋 이름 또는 콤마 구분 필드 목록, 전체 필드면 None)"""
+    if not fields:
+        return None
+    if fields in FIELD_PRESETS:
+        selected = FIELD_PRESETS[fields]
+    else:
+        selected = tuple(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip()))
+        unknown = [field for field in selected if field not in NEWS_ITEM_DEFAULTS]
+        if unknown:
+            raise ValueError(f"알 수 없는 필드: {', '.join(unknown)}")
+    return None if set(selected) == set(NEWS_ITEM_DEFAULTS) else selected
+
+
+def news_item_dict(item: Dict, fields: Optional[Sequence[str]] = None) -> Dict:
+    """DynamoDB 아이템 → NewsItem 스키마 dict (pydantic 모델 생성 없이, fields 지정 시 해당 필드만)"""
+    if fields:
+        return {field: item.get(field, NEWS_ITEM_DEFAULTS[field]) for field in fields}
+    return {field: item.get(field, default) for field, default in NEWS_ITEM_DEFAULTS.items()}
+
+
+def news_item_dicts(items: Iterable[Dict], fields: Optional[Sequence[str]] = None) -> List[Dict]:
+    return [news_item_dict(item, fields) for item in items]
+
+
+def json_fragments(fragments: Iterable[bytes]) -> List[orjson.Fragment]:
+    """미리 직렬화한 JSON 조각 → dumps 시 다시 직렬화하지 않고 그대로 삽입되는 값"""
+    return [orjson.Fragment(fragment) for fragment in fragments]
+
+
+def _default(obj: Any) -> Any:
+    """orjson이 직접 처리하지 못하는 DynamoDB 타입 변환"""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"직렬화할 수 없는 타입: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """orjson 기반 JSON 직렬화 (bytes 반환)"""
+    return orjson.dumps(obj, default=_default)
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """bytes 스트림을 gzip 스트림으로 변환 (전체를 모으지 않고 청크 단위로 압축)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from metrics import CACHE_EVENTS
+
+
+class LeaderCancelled(Exception):
+    """leader 요청이 취소되어 조회 결과가 없음 (합류한 요청은 다시 조회)"""
+    pass
+
+
+class SingleFlight:
+    """동일한 조회가 동시에 여러 번 들어오면 DynamoDB 호출 1번의 결과를 함께 사용
+
+    먼저 들어온 요청(leader)만 실제로 조회하고, 조회가 끝나기 전에 들어온 같은 키의
+    요청들은 leader의 결과(또는 예외)를 그대로 받는다. 결과는 보관하지 않는다(캐시는 cache.py).
+    leader가 취소되면(클라이언트 연결 종료 등) 합류한 요청 중 하나가 새 leader로 다시 조회한다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0     # 실제 조회를 수행한 요청 수
+        self.coalesced = 0   # 진행 중인 조회에 합류한 요청 수
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._inflight.get(key)
+        while future is not None:
+            self.coalesced += 1
+            CACHE_EVENTS.labels('singleflight', 'coalesced').inc()
+            try:
+                # 합류한 요청이 취소되어도 leader의 조회는 계속 진행
+                return await asyncio.shield(future)
+            except LeaderCancelled:
+                future = self._inflight.get(key)  # 다른 요청이 이미 새 leader가 되었으면 다시 합류
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.leaders += 1
+        CACHE_EVENTS.labels('singleflight', 'leader').inc()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            # future.cancel()이면 합류한 요청에 CancelledError가 퍼지므로 다시 조회하라는 예외로 알림
+            future.set_exception(LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 합류한 요청이 없어도 "exception never retrieved" 경고가 나지 않도록
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def stats(self) -> Dict:
+        requests = self.leaders + self.coalesced
+        return {
+            'in_flight': len(self._inflight),
+            'leaders': self.leaders,
+            'coalesced': self.coalesced,
+            'coalesced_ratio': round(self.coalesced / requests, 4) if requests else 0.0
+        }
+
+# 전역 인스턴스
+news_flight = SingleFlight()
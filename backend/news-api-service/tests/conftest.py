@@ -0,0 +1,32 @@
+"""moto DynamoDB 위의 API 앱 (테스트 세션에 1개)
+
+전역 인스턴스(db_manager, 스레드 풀, 캐시)를 모듈이 한 번만 만들므로 앱도 세션 동안 한 번만 띄운다.
+"""
+import os
+import sys
+import time
+
+import pytest
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+sys.path.insert(0, BACKEND_DIR)
+from dynamodb_fixtures import TEST_ENV, dynamodb_table  # noqa: E402,F401
+
+os.environ.update({
+    **TEST_ENV,
+    "CURSOR_SECRET": "testing",
+    "DATA_VERSION_POLL_INTERVAL": "0",  # 수집기 저장 직후 갱신 확인 (공유 조회 결과를 재사용하지 않음)
+})
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+@pytest.fixture(scope="session")
+def api(dynamodb_table):
+    from fastapi.testclient import TestClient
+
+    import main
+    with TestClient(main.app) as client:
+        deadline = time.time() + 10  # DynamoDB 연결은 백그라운드에서 예열됨
+        while client.get("/ready").status_code != 200 and time.time() < deadline:
+            time.sleep(0.05)
+        yield client, dynamodb_table
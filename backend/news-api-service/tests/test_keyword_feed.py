@@ -0,0 +1,107 @@
+"""다른 키워드로 먼저 저장된 기사를 두 번째 키워드로 조회 (키워드 피드 별칭, moto DynamoDB)
+
+수집기가 같은 기사를 '반도체'로 저장한 뒤 'AI'로 다시 수집했을 때 남기는 상태
+(기사 keywords에 'AI' 추가 + 'AI' 키워드 피드 별칭 아이템 + 데이터 버전 증가)를 만들고
+키워드 피드 인덱스, 최신 뉴스 윈도우, 검색 색인, 스트림 구독자가 모두 'AI'로 찾는지 확인한다.
+
+    cd backend/news-api-service
+    pip install -r requirements.txt -r ../requirements-dev.txt
+    python -m pytest tests
+"""
+import functools
+
+ARTICLE_IDS = [f"{i:032x}" for i in range(1, 4)]
+
+
+def bump_data_version(table):
+    table.update_item(
+        Key={"id": "__meta__#data_version"},
+        UpdateExpression="ADD #version :one",
+        ExpressionAttributeNames={"#version": "version"},
+        ExpressionAttributeValues={":one": 1},
+    )
+
+
+def collect_first_keyword(table):
+    """'반도체'로 처음 수집 (수집기 save_news_items와 같은 형식)"""
+    for i, article_id in enumerate(ARTICLE_IDS):
+        table.put_item(Item={
+            "id": article_id,
+            "title": f"반도체 업계 동향 {i}",
+            "description": f"메모리 가격 전망 {i}",
+            "keyword": "반도체",
+            "keywords": {"반도체"},
+            "collected_at": f"2024-09-10T10:00:0{i}",
+            "content_type": "news",
+            "source": "naver_api",
+        })
+    bump_data_version(table)
+
+
+def collect_second_keyword(table):
+    """같은 기사를 'AI'로 다시 수집 (수집기 merge_keywords/put_keyword_aliases와 같은 형식)"""
+    from database import KEYWORD_ALIAS_TYPE, keyword_alias_id
+
+    for i, article_id in enumerate(ARTICLE_IDS):
+        table.update_item(
+            Key={"id": article_id},
+            UpdateExpression="ADD keywords :keywords",
+            ExpressionAttributeValues={":keywords": {"AI"}},
+        )
+        table.put_item(Item={
+            "id": keyword_alias_id("AI", article_id),
+            "content_type": KEYWORD_ALIAS_TYPE,
+            "keyword": "AI",
+            "collected_at": f"2024-09-10T10:00:0{i}",
+            "article_id": article_id,
+        })
+    bump_data_version(table)
+
+
+def test_article_collected_under_two_keywords(api):
+    from database import db_manager
+    from news_stream import NewsSubscriber
+    from news_window import news_window
+    from search_index import search_index
+
+    client, table = api
+    collect_first_keyword(table)
+    client.portal.call(news_window.refresh)
+    client.portal.call(search_index.sync)
+    assert news_window.query(10, keyword="AI") is None  # 아직 'AI'로 수집된 기사 없음
+
+    collect_second_keyword(table)
+    newest_first = list(reversed(ARTICLE_IDS))
+
+    # 키워드 피드 인덱스: 별칭 → 기사, cursor로 이어서 조회
+    first = client.portal.call(functools.partial(db_manager.get_keyword_feed, "AI", limit=2))
+    assert [item["id"] for item in first["items"]] == newest_first[:2]
+    assert all(item["keywords"] == {"반도체", "AI"} for item in first["items"])
+    rest = client.portal.call(functools.partial(
+        db_manager.get_keyword_feed, "AI", limit=2, start_key=first["last_evaluated_key"]
+    ))
+    assert [item["id"] for item in rest["items"]] == newest_first[2:]
+    assert rest["last_evaluated_key"] is None
+
+    # 최신 뉴스 윈도우: 별칭으로 keywords 갱신, cursor는 DynamoDB 피드와 같은 별칭 키
+    client.portal.call(news_window.refresh)
+    page = news_window.query(2, keyword="AI")
+    assert [item["id"] for item in page["items"]] == newest_first[:2]
+    assert page["last_evaluated_key"] == first["last_evaluated_key"]
+    page = news_window.query(2, keyword="AI", start_key=page["last_evaluated_key"])
+    assert [item["id"] for item in page["items"]] == newest_first[2:]
+
+    # 검색 색인: 나중에 추가된 수집 키워드도 색인
+    client.portal.call(search_index.sync)
+    assert search_index.search("AI")["total_count"] == len(ARTICLE_IDS)
+
+    # API 응답
+    response = client.get("/api/news", params={"keyword": "AI", "limit": 10})
+    assert response.status_code == 200
+    news_items = response.json()["body"]["news_items"]
+    assert [item["id"] for item in news_items] == newest_first
+    assert all(sorted(item["keywords"]) == ["AI", "반도체"] for item in news_items)
+
+    # 스트림 구독자
+    article = table.get_item(Key={"id": ARTICLE_IDS[0]})["Item"]
+    assert NewsSubscriber("AI", 1).matches(article)
@@ -0,0 +1,78 @@
+"""새 뉴스 스트림: 재접속 replay와 겹친 뉴스 중복 제거, 수집 1회분 중간부터 이어받기, WebSocket 클라이언트 메시지 무시
+
+    cd backend/news-api-service
+    pip install -r requirements.txt -r ../requirements-dev.txt
+    python -m pytest tests
+"""
+import functools
+import json
+
+ARTICLE = {
+    "id": "f" * 32,
+    "title": "스트림 테스트 기사",
+    "description": "재접속 중 저장된 뉴스",
+    "keyword": "스트림",
+    "keywords": {"스트림"},
+    "collected_at": "2024-09-11T09:00:00",
+    "content_type": "news",
+    "source": "naver_api",
+}
+
+
+async def call(func, *args):
+    return func(*args)
+
+
+def test_replayed_news_is_not_sent_twice(api):
+    from news_stream import news_broadcaster
+
+    client, table = api
+    table.put_item(Item=ARTICLE)
+    subscriber = news_broadcaster.subscribe("스트림")
+    try:
+        # replay 조회가 끝나기 전에 업스트림 폴링이 같은 뉴스를 전달한 경우
+        client.portal.call(call, news_broadcaster.publish, [ARTICLE])
+        replayed = client.portal.call(functools.partial(
+            news_broadcaster.replay, subscriber, "2024-09-11T08:59:59"
+        ))
+        assert [event["news_id"] for event in replayed] == [ARTICLE["id"]]
+        assert subscriber.is_replayed(subscriber.queue.get_nowait())
+    finally:
+        news_broadcaster.unsubscribe(subscriber)
+        table.delete_item(Key={"id": ARTICLE["id"]})
+
+
+def test_replay_resumes_inside_batch(api):
+    from news_stream import news_broadcaster
+
+    client, table = api
+    # 수집 1회분은 모두 같은 collected_at → 2개째까지 받고 끊긴 구독자
+    batch = [{**ARTICLE, "id": f"{i:032x}", "collected_at": "2024-09-11T10:00:00"} for i in range(4)]
+    for item in batch:
+        table.put_item(Item=item)
+    subscriber = news_broadcaster.subscribe("스트림")
+    try:
+        sent = [news_broadcaster.event(item)["id"] for item in batch[:2]]
+        assert sent[-1] == f"2024-09-11T10:00:00|{batch[1]['id']}"
+        replayed = client.portal.call(functools.partial(news_broadcaster.replay, subscriber, sent[-1]))
+        assert [event["news_id"] for event in replayed] == [item["id"] for item in batch[2:]]
+
+        # 예전 형식(collected_at만)은 그 시각 이후만
+        assert client.portal.call(functools.partial(
+            news_broadcaster.replay, subscriber, "2024-09-11T10:00:00"
+        )) == []
+    finally:
+        news_broadcaster.unsubscribe(subscriber)
+        for item in batch:
+            table.delete_item(Key={"id": item["id"]})
+
+
+def test_websocket_ignores_client_messages(api):
+    from news_stream import news_broadcaster
+
+    client, _ = api
+    with client.websocket_connect("/api/news/ws?keyword=스트림") as websocket:
+        websocket.send_text("ping")
+        websocket.send_bytes(b"\x00")
+        client.portal.call(call, news_broadcaster.publish, [ARTICLE])
+        assert json.loads(websocket.receive_text())["id"] == ARTICLE["id"]
@@ -0,0 +1,49 @@
+"""수집 1회분이 같은 collected_at으로 윈도우 크기보다 많이 저장됐을 때 갱신이 끝나는지 확인
+
+    cd backend/news-api-service
+    pip install -r requirements.txt -r ../requirements-dev.txt
+    python -m pytest tests
+"""
+import asyncio
+
+
+def article(i, collected_at):
+    return {
+        "id": f"{0xd00000 + i:032x}",
+        "title": f"윈도우 갱신 기사 {i}",
+        "description": "같은 시각에 저장된 기사",
+        "keyword": "윈도우",
+        "collected_at": collected_at,
+        "content_type": "news",
+        "source": "naver_api",
+    }
+
+
+def test_refresh_pages_past_same_collected_at(api):
+    from news_window import NewsWindow
+
+    client, table = api
+    seeded = [article(i, f"2099-01-01T00:00:0{i}") for i in range(3)]
+    batch = [article(10 + i, "2099-01-01T00:00:10") for i in range(7)]  # 수집 1회분 (size의 2배 이상)
+
+    window = NewsWindow()
+    window.size = 3
+
+    async def refresh():
+        return await asyncio.wait_for(window.refresh(), timeout=5)
+
+    try:
+        for item in seeded:
+            table.put_item(Item=item)
+        client.portal.call(refresh)
+        assert window.watermark == seeded[-1]["collected_at"]
+
+        for item in batch:
+            table.put_item(Item=item)
+        window.data_version = -1  # 수집기가 새로 저장한 것으로 처리
+        assert client.portal.call(refresh) == len(batch) + 1  # watermark와 같은 시각의 기사 1개 포함
+        assert window.watermark == "2099-01-01T00:00:10"
+        assert {key[1] for key in window._snapshot.keys} <= {item["id"] for item in batch}
+    finally:
+        for item in seeded + batch:
+            table.delete_item(Key={"id": item["id"]})
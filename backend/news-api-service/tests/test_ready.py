@@ -0,0 +1,39 @@
+"""/ready 준비 상태 (예열 완료 + DynamoDB 호출 연속 실패 수, moto DynamoDB)
+
+    cd backend/news-api-service
+    pip install -r requirements.txt -r ../requirements-dev.txt
+    python -m pytest tests
+"""
+import pytest
+
+
+def test_ready_follows_consecutive_failures(api, monkeypatch):
+    from database import db_manager
+
+    client, _ = api
+    calls = []
+    get_item = db_manager.table.get_item
+
+    def unavailable(**kwargs):
+        calls.append(kwargs)
+        raise ConnectionError("endpoint unreachable")
+
+    monkeypatch.setattr(db_manager.table, "get_item", unavailable)
+
+    # 평소에는 probe마다 DynamoDB를 호출하지 않음
+    assert client.get("/ready").status_code == 200
+    assert calls == []
+
+    # 연속 실패가 쌓이면 준비 해제, 그 뒤에는 GetItem 1회로 복구 여부 확인
+    for _ in range(db_manager.ready_max_failures):
+        with pytest.raises(ConnectionError):
+            client.portal.call(db_manager._ping)
+    calls.clear()
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"]["dynamodb"] == "unavailable"
+    assert len(calls) == 1
+
+    monkeypatch.setattr(db_manager.table, "get_item", get_item)
+    assert client.get("/ready").status_code == 200
+    assert db_manager.executor.consecutive_failures == 0
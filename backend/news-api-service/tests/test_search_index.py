@@ -0,0 +1,61 @@
+"""검색 색인이 최신 뉴스 일부만 알 때 (SEARCH_INDEX_MAX_DOCS 초과): horizon 밖 페이지는 DynamoDB로 조회
+
+    cd backend/news-api-service
+    pip install -r requirements.txt -r ../requirements-dev.txt
+    python -m pytest tests
+"""
+import functools
+
+ARTICLES = [
+    {
+        "id": f"{0xabc000 + i:032x}",
+        "title": f"지평선 관측 기록 {i}",
+        "description": "색인 범위 확인용 기사",
+        "keyword": "천문",
+        "keywords": {"천문"},
+        "collected_at": f"2024-09-12T10:00:0{i}",
+        "content_type": "news",
+        "source": "naver_api",
+    }
+    for i in range(5)
+]
+
+
+def test_index_horizon(api, monkeypatch):
+    import main
+    from search_index import SearchIndex
+
+    client, table = api
+    for article in ARTICLES:
+        table.put_item(Item=article)
+    newest_first = [article["id"] for article in reversed(ARTICLES)]
+
+    index = SearchIndex()
+    index.max_docs = 3
+    try:
+        client.portal.call(index.sync)
+        assert not index.complete
+        assert index.horizon == ARTICLES[2]["collected_at"]
+
+        # horizon 안에서 끝나는 페이지는 색인으로 응답 (total_count는 색인 범위 기준으로 표시)
+        page = client.portal.call(functools.partial(index.lookup, "지평선", limit=2))
+        assert [item["id"] for item in page["items"]] == newest_first[:2]
+        assert page["complete"] is False and page["horizon"] == ARTICLES[2]["collected_at"]
+        assert page["last_evaluated_key"] == {"offset": 2}
+        # horizon을 넘어가는 페이지는 색인으로 응답하지 않음
+        assert client.portal.call(functools.partial(index.lookup, "지평선", limit=2, offset=2)) is None
+
+        # API: 첫 페이지는 색인, 다음 페이지부터 DynamoDB (오래된 뉴스까지 모두)
+        monkeypatch.setattr(main, "search_index", index)
+        body = client.get("/api/v2/news", params={"keyword": "지평선", "limit": 2}).json()
+        assert body["complete"] is False
+        ids = [item["id"] for item in body["news_items"]]
+        while body["next_cursor"]:
+            body = client.get("/api/v2/news", params={
+                "keyword": "지평선", "limit": 2, "cursor": body["next_cursor"]
+            }).json()
+            ids += [item["id"] for item in body["news_items"]]
+        assert ids == newest_first
+    finally:
+        for article in ARTICLES:
+            table.delete_item(Key={"id": article["id"]})
@@ -0,0 +1,33 @@
+"""동일 조회 합치기: leader 요청이 취소되어도 합류한 요청은 다시 조회해서 결과를 받음
+
+    cd backend/news-api-service
+    python -m pytest tests
+"""
+import asyncio
+
+from singleflight import SingleFlight
+
+
+def test_follower_retries_when_leader_is_cancelled():
+    calls = []
+
+    async def fetch():
+        calls.append(len(calls))
+        await asyncio.sleep(0.05)
+        return f"result-{len(calls)}"
+
+    async def scenario():
+        flight = SingleFlight()
+        leader = asyncio.create_task(flight.do('key', fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do('key', fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        results = await asyncio.gather(*followers)
+        assert leader.cancelled()
+        return results
+
+    # 취소된 leader 대신 합류한 요청 중 하나가 한 번만 다시 조회
+    assert asyncio.run(scenario()) == ["result-2"] * 3
+    assert len(calls) == 2
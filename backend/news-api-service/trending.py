@@ -0,0 +1,114 @@
+import asyncio
+import hashlib
+import sys
+import time
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from logging_config import get_logger
+from database import db_manager, TREND_PREFIX
+
+# .env 파일 로드
+load_dotenv()
+
+logger = get_logger(__name__)
+
+# 조회 창 → (구간 단위, 분 단위 길이, 구간 수) - 수집기 trending.TREND_LEVELS와 같은 구간
+TREND_WINDOWS = {
+    '1h': ('m', 10, 6),
+    '6h': ('h', 60, 6),
+    '24h': ('h', 60, 24),
+}
+TREND_KINDS = {'terms': 'top_terms', 'keywords': 'top_keywords'}
+KIND_KEYS = {'terms': 't:', 'keywords': 'k:'}
+
+
+def bucket_id(level: str, minutes: int, timestamp: datetime) -> str:
+    """집계 구간 아이템 id (수집기와 같은 형식, 구간 시작 시각)"""
+    start = timestamp.replace(minute=timestamp.minute - timestamp.minute % minutes, second=0, microsecond=0)
+    return f"{TREND_PREFIX}{level}#{start.strftime('%Y-%m-%dT%H:%M')}"
+
+
+def window_bucket_ids(window: str, now: datetime) -> List[str]:
+    """조회 창에 들어가는 구간 id (현재 구간부터 과거 순)"""
+    level, minutes, count = TREND_WINDOWS[window]
+    return [bucket_id(level, minutes, now - timedelta(minutes=minutes * i)) for i in range(count)]
+
+
+def decode_counters(item: Dict) -> array:
+    """구간 아이템의 스케치 카운터 (little-endian uint32)"""
+    counters = array('I')
+    counters.frombytes(bytes(item['sketch']))
+    if sys.byteorder != 'little':
+        counters.byteswap()
+    return counters
+
+
+def sketch_positions(key: str, width: int, depth: int) -> List[int]:
+    """수집기 CountMinSketch와 같은 해시 위치 (행마다 blake2b 4바이트)"""
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=4 * depth).digest()
+    return [row * width + int.from_bytes(digest[4 * row:4 * row + 4], 'little') % width for row in range(depth)]
+
+
+class TrendReader:
+    """인기 검색어/키워드 조회 (수집기가 갱신하는 구간별 count-min sketch 합산)
+
+    창에 들어가는 구간 아이템(최대 24개)을 BatchGetItem으로 읽어 스케치를 더하고, 구간별
+    상위 후보의 합집합을 합친 스케치로 다시 추정해서 순위를 매긴다. 기사를 읽지 않으므로
+    비용은 기사 수와 관계없이 구간 수 x 스케치 크기로 정해진다.
+    """
+
+    @staticmethod
+    def _rank(buckets: List[Dict], kind: str) -> Tuple[List[Dict], int]:
+        """구간 아이템 합산 → 추정 건수 순 후보 목록 (이벤트 루프 밖에서 실행)"""
+        if not buckets:
+            return [], 0
+        newest = max(buckets, key=lambda bucket: bucket['id'])
+        width, depth = int(newest['width']), int(newest['depth'])
+        # 스케치 크기 설정이 바뀌기 전 구간은 합칠 수 없으므로 제외
+        buckets = [bucket for bucket in buckets if int(bucket['width']) == width and int(bucket['depth']) == depth]
+
+        merged = decode_counters(buckets[0])
+        for bucket in buckets[1:]:
+            for position, count in enumerate(decode_counters(bucket)):
+                if count:
+                    merged[position] += count
+
+        candidates = set()
+        for bucket in buckets:
+            candidates.update(bucket.get(TREND_KINDS[kind], {}))
+
+        prefix = KIND_KEYS[kind]
+        estimates = Counter({
+            term: min(merged[position] for position in sketch_positions(prefix + term, width, depth))
+            for term in candidates
+        })
+        articles = sum(int(bucket.get('articles', 0)) for bucket in buckets)
+        return [{'term': term, 'count': count} for term, count in estimates.most_common()], articles
+
+    async def top(self, window: str, kind: str, now: Optional[datetime] = None) -> Dict:
+        """조회 창의 인기 검색어/키워드 전체 순위 (호출하는 쪽에서 limit만큼 자름)"""
+        start_time = time.time()
+        now = now or datetime.now()
+        bucket_ids = window_bucket_ids(window, now)
+        buckets = await db_manager.get_trend_buckets(bucket_ids)
+
+        loop = asyncio.get_running_loop()
+        ranking, articles = await loop.run_in_executor(None, self._rank, buckets, kind)
+
+        logger.debug(f"📈 인기어 집계: {window}/{kind} 구간 {len(buckets)}/{len(bucket_ids)}개, "
+                     f"후보 {len(ranking)}개 ({(time.time() - start_time) * 1000:.0f}ms)")
+        return {
+            'window': window,
+            'kind': kind,
+            'from': bucket_ids[-1][len(TREND_PREFIX) + 2:],
+            'until': now.isoformat(),
+            'buckets': len(buckets),
+            'articles': articles,
+            'ranking': ranking
+        }
+
+# 전역 인스턴스
+trend_reader = TrendReader()
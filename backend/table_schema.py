@@ -0,0 +1,36 @@
+"""뉴스 테이블 구성 (id 해시 키 + 글로벌 인덱스 2개, 벤치마크/서비스 테스트 공용)
+
+운영 테이블은 terraform 밖에서 만들어졌고 keyword 인덱스만 infra/terraform/dynamodb.tf가 추가한다.
+인덱스를 바꾸면 여기와 dynamodb.tf를 함께 고친다.
+"""
+
+GLOBAL_INDEXES = {
+    'content_type-collected_at-index': ('content_type', 'collected_at'),
+    'keyword-collected_at-index': ('keyword', 'collected_at'),
+}
+
+
+def create_table(dynamodb, table_name: str):
+    """운영과 같은 키/글로벌 인덱스 구성의 테이블 생성 (생성 완료까지 대기)"""
+    table = dynamodb.create_table(
+        TableName=table_name,
+        KeySchema=[{'AttributeName': 'id', 'KeyType': 'HASH'}],
+        AttributeDefinitions=[
+            {'AttributeName': name, 'AttributeType': 'S'}
+            for name in ('id', 'content_type', 'keyword', 'collected_at')
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                'IndexName': index_name,
+                'KeySchema': [
+                    {'AttributeName': hash_key, 'KeyType': 'HASH'},
+                    {'AttributeName': range_key, 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'}
+            }
+            for index_name, (hash_key, range_key) in GLOBAL_INDEXES.items()
+        ],
+        BillingMode='PAY_PER_REQUEST'
+    )
+    table.wait_until_exists()
+    return table
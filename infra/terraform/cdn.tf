@@ -139,6 +139,20 @@ resource "aws_cloudfront_origin_access_control" "images" {
   signing_protocol                  = "sigv4"
 }
 
+# 엣지에서 캐시하지 않고 News API로 그대로 보내는 경로
+locals {
+  news_api_uncached_paths = ["/api/news/batch", "/api/news/stream", "/api/news/ws"]
+}
+
+# AWS 관리형 캐시/오리진 요청 정책
+data "aws_cloudfront_cache_policy" "caching_disabled" {
+  name = "Managed-CachingDisabled"
+}
+
+data "aws_cloudfront_origin_request_policy" "all_viewer_except_host" {
+  name = "Managed-AllViewerExceptHostHeader"
+}
+
 # CloudFront Distribution (WAF 연동 추가)
 resource "aws_cloudfront_distribution" "main" {
   # WAF 연결
@@ -158,6 +172,19 @@ resource "aws_cloudfront_distribution" "main" {
     origin_id                = "S3-Images"
   }
 
+  # News API Origin (ALB) - 읽기 API 응답을 엣지에서 캐시
+  origin {
+    domain_name = "api.${var.domain_name}"
+    origin_id   = "News-API"
+
+    custom_origin_config {
+      http_port              = 80
+      https_port             = 443
+      origin_protocol_policy = "https-only"
+      origin_ssl_protocols   = ["TLSv1.2"]
+    }
+  }
+
   enabled             = true
   is_ipv6_enabled     = true
   default_root_object = "index.html"
@@ -185,6 +212,44 @@ resource "aws_cloudfront_distribution" "main" {
     max_ttl     = 86400 # 24시간
   }
 
+  # 캐시하지 않는 API (POST 일괄 조회, SSE/WebSocket 스트림) - /api/* 보다 먼저 매칭
+  # 뷰어 헤더(Last-Event-ID, Upgrade, Sec-WebSocket-*)를 그대로 전달하고 Host는 ALB 도메인 유지
+  dynamic "ordered_cache_behavior" {
+    for_each = local.news_api_uncached_paths
+    content {
+      path_pattern             = ordered_cache_behavior.value
+      allowed_methods          = ["DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"]
+      cached_methods           = ["GET", "HEAD"]
+      target_origin_id         = "News-API"
+      compress                 = false # 스트림 응답을 압축 버퍼링 없이 바로 전달
+      viewer_protocol_policy   = "redirect-to-https"
+      cache_policy_id          = data.aws_cloudfront_cache_policy.caching_disabled.id
+      origin_request_policy_id = data.aws_cloudfront_origin_request_policy.all_viewer_except_host.id
+    }
+  }
+
+  # 뉴스 조회 API 캐시 동작 (TTL은 API의 Cache-Control/ETag를 따름)
+  ordered_cache_behavior {
+    path_pattern           = "/api/*"
+    allowed_methods        = ["GET", "HEAD", "OPTIONS"]
+    cached_methods         = ["GET", "HEAD"]
+    target_origin_id       = "News-API"
+    compress               = true
+    viewer_protocol_policy = "redirect-to-https"
+
+    forwarded_values {
+      query_string = true # limit/keyword/cursor 등 쿼리 파라미터별로 캐시
+      headers      = ["Origin"]
+      cookies {
+        forward = "none"
+      }
+    }
+
+    min_ttl     = 0
+    default_ttl = 0   # Cache-Control이 없는 응답은 캐시하지 않음
+    max_ttl     = 300 # 5분
+  }
+
   # 이미지 경로 전용 캐시 동작
   ordered_cache_behavior {
     path_pattern           = "/images/*"
@@ -309,6 +374,14 @@ resource "aws_wafv2_web_acl" "main" {
       managed_rule_group_statement {
         name        = "AWSManagedRulesCommonRuleSet"
         vendor_name = "AWS"
+
+        # 본문 8KB 제한은 POST /api/news/batch (id 최대 500개, 약 18KB)를 막으므로 집계만 (API가 개수 제한)
+        rule_action_override {
+          name = "SizeRestrictions_BODY"
+          action_to_use {
+            count {}
+          }
+        }
       }
     }
 
@@ -15,4 +15,42 @@ resource "aws_vpc_endpoint" "dynamodb" {
     Name = "${var.project_name}-${var.environment}-dynamodb-endpoint"
     Type = "VPCEndpoint"
   }
-}
\ No newline at end of file
+}
+# 키워드별 피드 인덱스 (news-api 키워드 조회, 수집기 워터마크 부트스트랩)
+# 테이블은 terraform 밖에서 만들어져 data 소스로만 읽으므로, 인덱스가 없을 때만 update-table로 추가
+locals {
+  keyword_feed_index_name = "keyword-collected_at-index"
+  keyword_feed_index = merge(
+    {
+      IndexName = local.keyword_feed_index_name
+      KeySchema = [
+        { AttributeName = "keyword", KeyType = "HASH" },
+        { AttributeName = "collected_at", KeyType = "RANGE" }
+      ]
+      Projection = { ProjectionType = "ALL" }
+    },
+    data.aws_dynamodb_table.naver_news_articles.billing_mode == "PROVISIONED" ? {
+      ProvisionedThroughput = {
+        ReadCapacityUnits  = data.aws_dynamodb_table.naver_news_articles.read_capacity
+        WriteCapacityUnits = data.aws_dynamodb_table.naver_news_articles.write_capacity
+      }
+    } : {}
+  )
+}
+
+resource "terraform_data" "keyword_feed_index" {
+  triggers_replace = [data.aws_dynamodb_table.naver_news_articles.arn, jsonencode(local.keyword_feed_index)]
+
+  provisioner "local-exec" {
+    command = <<-EOT
+      if aws dynamodb describe-table --region ${var.region} --table-name ${data.aws_dynamodb_table.naver_news_articles.name} \
+          --query "Table.GlobalSecondaryIndexes[].IndexName" --output text | grep -qw ${local.keyword_feed_index_name}; then
+        echo "${local.keyword_feed_index_name} 이미 존재"
+      else
+        aws dynamodb update-table --region ${var.region} --table-name ${data.aws_dynamodb_table.naver_news_articles.name} \
+          --attribute-definitions AttributeName=keyword,AttributeType=S AttributeName=collected_at,AttributeType=S \
+          --global-secondary-index-updates '${jsonencode([{ Create = local.keyword_feed_index }])}'
+      fi
+    EOT
+  }
+}
@@ -17,7 +17,7 @@ terraform {
       version = ">= 1.7.0"
     }
   }
-  required_version = ">= 1.2"
+  required_version = ">= 1.4"
 }
 
 provider "aws" {